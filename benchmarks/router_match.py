@@ -0,0 +1,136 @@
+"""Measure route matching and reversing across route table sizes
+
+Usage: python -m benchmarks.router_match [--sizes 10 100 1000 10000]
+                                         [--engine tree|regex] [--output FILE]
+
+The results are written as json, one entry for each table size and scenario
+"""
+
+import argparse
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+
+import structlog
+
+from benchmarks.routes import (
+    build_handlers,
+    hit_samples,
+    miss_samples,
+    reverse_samples,
+)
+from selva.web.routing.router import Router
+
+DEFAULT_SIZES = (10, 100, 1_000, 10_000)
+
+# number of requests measured in each scenario
+REQUESTS = 20_000
+
+
+def measure(
+    name: str, size: int, samples: list, call: Callable, requests: int = REQUESTS
+) -> dict:
+    timings = []
+    count = len(samples)
+
+    for index in range(requests):
+        sample = samples[index % count]
+
+        start = time.perf_counter_ns()
+        call(*sample)
+        timings.append(time.perf_counter_ns() - start)
+
+    timings.sort()
+    total = sum(timings)
+
+    return {
+        "scenario": name,
+        "routes": size,
+        "requests": requests,
+        "ops_per_second": requests / (total / 1e9),
+        "mean_ns": total / requests,
+        "p50_ns": timings[requests // 2],
+        "p99_ns": timings[int(requests * 0.99)],
+        "stdev_ns": statistics.pstdev(timings),
+    }
+
+
+def run(size: int, engine: str, requests: int = REQUESTS) -> list[dict]:
+    router = Router()
+    for handler in build_handlers(size):
+        router.route(handler)
+
+    match = router.match if engine == "tree" else router.match_regex
+
+    def check(method, path):
+        if not match(method, path):
+            raise RuntimeError(f"no match for {method} {path}")
+
+    hits = hit_samples(size)
+    websocket_hits = hit_samples(size, websocket=True)
+    misses = miss_samples(size)
+
+    # every sample must behave as expected before being measured
+    for sample in hits + websocket_hits:
+        check(*sample)
+
+    for sample in misses:
+        if match(*sample):
+            raise RuntimeError(f"unexpected match for {sample}")
+
+    reverses = reverse_samples(router)
+
+    def reverse(name, params):
+        return router.reverse(name, **params)
+
+    for name, params in reverses:
+        route = router.routes[name]
+        found = match(route.method, "/" + reverse(name, params))
+        if not found or found.route is not route:
+            raise RuntimeError(f"reversed path of {name} does not match its route")
+
+    results = [
+        measure("match_hit", size, hits, match, requests),
+        measure("match_miss", size, misses, match, requests),
+    ]
+
+    if websocket_hits:
+        results.append(
+            measure("match_websocket", size, websocket_hits, match, requests)
+        )
+
+    results.append(measure("reverse", size, reverses, reverse, requests))
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--engine", choices=("tree", "regex"), default="tree")
+    parser.add_argument("--output", type=argparse.FileType("w"), default=sys.stdout)
+    args = parser.parse_args()
+
+    # route registration logs every route, which is not what is being measured
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.INFO)
+    )
+
+    report = {
+        "benchmark": "router_match",
+        "engine": args.engine,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [result for size in args.sizes for result in run(size, args.engine)],
+    }
+
+    json.dump(report, args.output, indent=2)
+    args.output.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Measure the time to register a large route table
+
+Usage: python -m benchmarks.router_startup [--routes 10000] [--repeat 5]
+
+The result is printed as json
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import time
+
+import structlog
+
+from benchmarks.routes import build_handlers
+from selva.web.routing.router import Router
+
+
+def run(routes: int, repeat: int) -> dict:
+    handlers = build_handlers(routes)
+    timings = []
+
+    for _ in range(repeat):
+        router = Router()
+
+        start = time.perf_counter()
+        for handler in handlers:
+            router.route(handler)
+        timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    return {
+        "benchmark": "router_startup",
+        "routes": routes,
+        "repeat": repeat,
+        "best_seconds": best,
+        "median_seconds": statistics.median(timings),
+        "routes_per_second": routes / best,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--routes", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # route registration logs every route, which is not what is being measured
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.INFO)
+    )
+
+    print(json.dumps(run(args.routes, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
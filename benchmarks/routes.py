@@ -0,0 +1,139 @@
+"""Synthetic route tables for the router benchmarks"""
+
+import uuid
+from collections.abc import Callable
+from decimal import Decimal
+from http import HTTPMethod
+from typing import Any, NamedTuple
+
+from selva.web.routing.decorator import route, websocket
+from selva.web.routing.router import Router
+
+SHAPES = ("static", "param", "wildcard")
+
+METHODS = (HTTPMethod.GET, HTTPMethod.POST, HTTPMethod.PUT, HTTPMethod.DELETE)
+
+# one in every WEBSOCKET_EVERY routes is a websocket route
+WEBSOCKET_EVERY = 10
+
+
+# values used to reverse routes, by the type of the path parameter
+PARAM_VALUES: dict[type, Any] = {
+    int: 42,
+    float: 4.2,
+    Decimal: Decimal("4.2"),
+    bool: True,
+    uuid.UUID: uuid.UUID(int=42),
+}
+
+# value of path parameters without a type, also valid for `*param`
+DEFAULT_PARAM_VALUE = "value"
+
+
+class RequestSample(NamedTuple):
+    method: HTTPMethod | None
+    path: str
+
+
+class ReverseSample(NamedTuple):
+    name: str
+    params: dict[str, Any]
+
+
+def route_path(index: int, shape: str) -> str:
+    match shape:
+        case "static":
+            return f"resource{index}/items"
+        case "param":
+            return f"resource{index}/items/:item_id"
+        case "wildcard":
+            return f"resource{index}/files/*path"
+        case _:
+            raise ValueError(shape)
+
+
+def request_path(index: int, shape: str) -> str:
+    """build a request path that matches the route created by `route_path`"""
+
+    match shape:
+        case "static":
+            return f"/resource{index}/items"
+        case "param":
+            return f"/resource{index}/items/42"
+        case "wildcard":
+            return f"/resource{index}/files/path/to/file.txt"
+        case _:
+            raise ValueError(shape)
+
+
+def route_method(index: int) -> HTTPMethod | None:
+    if index % WEBSOCKET_EVERY == WEBSOCKET_EVERY - 1:
+        return None
+
+    return METHODS[index % len(METHODS)]
+
+
+def route_shape(index: int) -> str:
+    return SHAPES[index % len(SHAPES)]
+
+
+def make_handler(index: int, method: HTTPMethod | None, path: str) -> Callable:
+    async def handler(request):
+        pass
+
+    # route names are derived from the handler name, so they must be unique
+    handler.__name__ = handler.__qualname__ = f"handler_{index}"
+
+    if method is None:
+        return websocket(path)(handler)
+
+    return route([method], path)(handler)
+
+
+def build_handlers(size: int) -> list[Callable]:
+    """build `size` handlers, alternating between the route shapes and methods"""
+
+    return [
+        make_handler(index, route_method(index), route_path(index, route_shape(index)))
+        for index in range(size)
+    ]
+
+
+def hit_samples(size: int, *, websocket: bool = False) -> list[RequestSample]:
+    """requests that match the http routes, or the websocket routes"""
+
+    return [
+        RequestSample(method, request_path(index, route_shape(index)))
+        for index in range(size)
+        if ((method := route_method(index)) is None) == websocket
+    ]
+
+
+def miss_samples(size: int) -> list[RequestSample]:
+    """requests that do not match any route
+
+    Half share a prefix with an existing route and half do not share any segment
+    """
+
+    return [
+        RequestSample(
+            HTTPMethod.GET,
+            f"/resource{index}/unknown" if index % 2 else f"/unknown{index}/items",
+        )
+        for index in range(size)
+    ]
+
+
+def reverse_samples(router: Router) -> list[ReverseSample]:
+    """route names with a valid value for each of their path parameters"""
+
+    return [
+        ReverseSample(
+            name,
+            {
+                param: PARAM_VALUES.get(param_type, DEFAULT_PARAM_VALUE)
+                for param, param_type in route.path_params.items()
+            },
+        )
+        for name, route in router.routes.items()
+    ]
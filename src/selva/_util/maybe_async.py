@@ -1,9 +1,9 @@
-import asyncio
-import functools
 import inspect
 from collections.abc import Awaitable, Callable
 from typing import Any, ParamSpec
 
+from selva.executor import get_executor, is_inline
+
 P = ParamSpec("P")
 
 
@@ -21,4 +21,7 @@ async def maybe_async(
     if inspect.iscoroutinefunction(call):
         return await call(*args, **kwargs)
 
-    return await asyncio.to_thread(functools.partial(call, *args, **kwargs))
+    if is_inline(call):
+        return call(*args, **kwargs)
+
+    return await get_executor().run(call, *args, **kwargs)
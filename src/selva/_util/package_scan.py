@@ -16,18 +16,94 @@ def _scan_members(module, predicate):
             yield member
 
 
+class PackageIndex:
+    """Classes and functions of packages, collected in a single pass
+
+    Consumers looking for members marked with an attribute share the result of
+    the scan instead of importing and inspecting the packages again. The index
+    can be given to `scan_packages` in place of the packages.
+    """
+
+    def __init__(self, *args: str | ModuleType):
+        self.packages = [
+            module if isinstance(module, str) else module.__name__ for module in args
+        ]
+        self.members: list[type | Callable] = list(scan_packages(*args))
+        self.by_attribute: dict[str, list[type | Callable]] = {}
+
+    def with_attribute(self, attribute: str) -> list[type | Callable]:
+        """Members that have the attribute, such as a decorator marker"""
+
+        try:
+            return self.by_attribute[attribute]
+        except KeyError:
+            pass
+
+        result = [member for member in self.members if hasattr(member, attribute)]
+        self.by_attribute[attribute] = result
+        return result
+
+    def find(self, predicate: Callable[[Any], bool] = None) -> list[type | Callable]:
+        if not predicate:
+            return list(self.members)
+
+        return [member for member in self.members if predicate(member)]
+
+    def covers(self, module: str | ModuleType) -> bool:
+        """Whether the module is one of the indexed packages or their submodules"""
+
+        name = module if isinstance(module, str) else module.__name__
+        return any(
+            name == package or name.startswith(f"{package}.")
+            for package in self.packages
+        )
+
+    def subpackage(self, module: str | ModuleType) -> "PackageIndex":
+        """Index of the members of a module covered by this index"""
+
+        name = module if isinstance(module, str) else module.__name__
+
+        index = PackageIndex()
+        index.packages = [name]
+        index.members = [
+            member
+            for member in self.members
+            if member.__module__ == name or member.__module__.startswith(f"{name}.")
+        ]
+
+        return index
+
+
 def scan_packages(
-    *args: str | ModuleType,
+    *args: str | ModuleType | PackageIndex,
     predicate: Callable[[Any], bool] = None,
+    attribute: str = None,
 ) -> Iterable[type | Callable]:
+    """Find the classes and functions defined in the packages
+
+    :param predicate: function to select the members
+    :param attribute: select only members with the attribute, which is looked
+        up by key on a `PackageIndex`
+    """
+
     if predicate and not inspect.isfunction(predicate):
         raise TypeError("invalid predicate")
 
     for module in args:
+        if isinstance(module, PackageIndex):
+            members = module.with_attribute(attribute) if attribute else module.members
+            for member in members:
+                if not predicate or predicate(member):
+                    yield member
+            continue
+
         if isinstance(module, str):
             module = importlib.import_module(module)
 
         def scan_predicate(arg):
+            if attribute and not hasattr(arg, attribute):
+                return False
+
             predicate_result = predicate(arg) if predicate else True
             return _is_class_or_function(arg) and predicate_result
 
@@ -2,6 +2,26 @@ default_settings = {
     "application": "application",
     "extensions": [],
     "middleware": [],
+    "routing": {
+        "cache": {
+            "size": 0,
+            "negative": False,
+        },
+        "mounts": {},
+    },
+    "handlers": {
+        "concurrent_params": False,
+    },
+    "services": {
+        "eager": False,
+        "timeout": None,
+        "finalize_timeout": None,
+        "shutdown_timeout": None,
+    },
+    "executor": {
+        "max_workers": None,
+        "queue_size": 0,
+    },
     "logging": {
         "setup": "selva.logging:setup",
     },
@@ -23,4 +43,7 @@ default_settings = {
         "path": "/uploads",
         "root": "resources/uploads",
     },
+    "diagnostics": {
+        "path": "/_selva/services",
+    },
 }
@@ -3,3 +3,5 @@
 from selva.di.container import Container
 from selva.di.decorator import service
 from selva.di.inject import Inject
+from selva.di.lazy import Lazy
+from selva.di.scope import Scope
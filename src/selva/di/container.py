@@ -1,30 +1,79 @@
 import asyncio
+import functools
 import inspect
-from collections.abc import AsyncGenerator, Awaitable, Generator, Iterable
+import time
+import typing
+from collections import Counter
+from collections.abc import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+    Set,
+)
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from types import FunctionType, ModuleType
 from typing import Any, TypeVar
 
 import structlog
 
+from selva._util.base_types import get_base_types
 from selva._util.maybe_async import maybe_async
-from selva._util.package_scan import scan_packages
-from selva.di.decorator import ATTRIBUTE_DI_SERVICE
+from selva._util.package_scan import PackageIndex, scan_packages
+from selva.di.decorator import ATTRIBUTE_DI_INIT, ATTRIBUTE_DI_SERVICE
 from selva.di.decorator import service as service_decorator
+from selva.di.diagnostics import ServiceTimings
 from selva.di.error import (
     DependencyLoopError,
     NonInjectableTypeError,
+    RequestScopeNotActiveError,
+    ScopeMismatchError,
+    ServiceInitTimeoutError,
+    ServiceNotCreatedError,
     ServiceNotFoundError,
     ServiceWithoutDecoratorError,
 )
+from selva.di.graph import ServiceKey, compile_graph
 from selva.di.interceptor import Interceptor
+from selva.di.lazy import Lazy
+from selva.di.scope import RequestScope, Scope
 from selva.di.service.model import InjectableType, ServiceDependency, ServiceSpec
 from selva.di.service.parse import parse_service_spec
 from selva.di.service.registry import ServiceRegistry
+from selva.executor import get_executor
 
 logger = structlog.get_logger(__name__)
 
 T = TypeVar("T")
 
+# marks services without a cached instance, since instances may be falsy
+MISSING = object()
+
+
+def _candidate_types(service_type: type) -> list[type]:
+    """Types to search for a service, varying the last type argument of generics
+
+    For `Converter[Body, Model]` the candidates are `Converter[Body, Model]`
+    followed by `Converter[Body, Base]` for each base type of `Model`. Lists are
+    searched by the base types of their items, so `Converter[Body, list[Model]]`
+    is followed by `Converter[Body, list[Base]]`.
+    """
+
+    if not (origin := typing.get_origin(service_type)):
+        return get_base_types(service_type)
+
+    *args, target = typing.get_args(service_type)
+
+    if typing.get_origin(target) is list:
+        (item_type,) = typing.get_args(target)
+        targets = [list[base] for base in get_base_types(item_type)]
+    else:
+        targets = get_base_types(target)
+
+    return [origin[*args, base] for base in targets]
+
 
 def _is_service(arg) -> bool:
     return (inspect.isfunction(arg) or inspect.isclass(arg)) and hasattr(
@@ -32,15 +81,86 @@ def _is_service(arg) -> bool:
     )
 
 
+def _accepts_dependencies(service_spec: ServiceSpec) -> bool:
+    """Whether the constructor generated by the service decorator receives
+    all the dependencies of the service class
+    """
+
+    init_params = getattr(service_spec.impl.__init__, ATTRIBUTE_DI_INIT, ())
+    return all(name in init_params for name, _ in service_spec.dependencies)
+
+
 class Container:
-    def __init__(self):
-        self.registry = ServiceRegistry()
+    def __init__(self, parent: "Container" = None):
+        self.parent = parent
+        self.registry = ServiceRegistry(parent.registry if parent else None)
         self.cache: dict[tuple[type, str | None], Any] = {}
-        self.finalizers: list[Awaitable] = []
-        self.interceptors: list[type[Interceptor]] = []
+        # singletons being created, awaited by concurrent requests for them
+        self.pending: dict[ServiceKey, asyncio.Future] = {}
+        self.finalizers: list[tuple[ServiceKey, Awaitable]] = []
+        self.interceptors: list[type[Interceptor]] = (
+            list(parent.interceptors) if parent else []
+        )
+        # services registered or defined in a child, replacing the ones of the parent
+        self.overrides: set[ServiceKey] = set()
+        # whether the instances of the parent can be used for each service
+        self.inheritance: dict[ServiceKey, bool] = {}
+        # interceptor instances that apply to each service type
+        self.interceptor_chains: dict[type, list[Interceptor]] = {}
+        self.graph: dict[ServiceKey, list[ServiceSpec]] | None = None
+        # class services created with their dependencies, when the graph is compiled
+        self.constructor_injection: set[ServiceKey] = set()
+        # requested types mapped to the type registered for one of their bases
+        self.resolution_cache: dict[ServiceKey, type | None] = {}
+        # time taken to create the instances of each service
+        self.timings: dict[ServiceKey, ServiceTimings] = {}
+        # number of times each service was resolved
+        self.resolutions: Counter[ServiceKey] = Counter()
+        # children share the request scope of the root container
+        self.request_scope_var: ContextVar[RequestScope | None] = (
+            parent.request_scope_var
+            if parent
+            else ContextVar(f"selva_di_request_scope_{id(self)}", default=None)
+        )
+
+    def child(self) -> "Container":
+        """Create a container that inherits the services of this container
+
+        The child uses the services registered in this container and the
+        instances it already created, and services registered or defined in the
+        child replace the ones of this container only in the child. Instances
+        that depend on a replaced service, directly or indirectly, are created
+        again by the child. Creating a child costs only its own services, as the
+        services of this container are not copied.
+
+        The child shares the request scope of this container, and request
+        scoped instances are reused in the same way as singletons.
+
+        Instances created by the child are finalized by the child, and services
+        registered in this container after the child is created may not be
+        visible to types already resolved by the child.
+        """
 
-    def scan(self, *args: str | ModuleType):
-        for item in scan_packages(*args, predicate=_is_service):
+        child = Container(parent=self)
+
+        if self.cache.get((Container, None)) is self:
+            child.define(Container, child)
+
+        return child
+
+    def _reset(self, service_type: type, name: str | None):
+        self.graph = None
+        self.constructor_injection = set()
+        self.resolution_cache.clear()
+
+        if self.parent:
+            self.overrides.add((service_type, name))
+            self.inheritance.clear()
+
+    def scan(self, *args: str | ModuleType | PackageIndex):
+        for item in scan_packages(
+            *args, predicate=_is_service, attribute=ATTRIBUTE_DI_SERVICE
+        ):
             self.register(item)
 
     def register(self, injectable: InjectableType):
@@ -52,11 +172,12 @@ class Container:
         if not service_info:
             raise ServiceWithoutDecoratorError(injectable)
 
-        provides, name = service_info
-        service_spec = parse_service_spec(injectable, provides, name)
+        provides, name, scope = service_info
+        service_spec = parse_service_spec(injectable, provides, name, scope)
         provided_service = service_spec.service
 
         self.registry[provided_service, name] = service_spec
+        self._reset(provided_service, name)
 
         log_context = {
             "service": f"{injectable.__module__}.{injectable.__qualname__}",
@@ -68,10 +189,14 @@ class Container:
         if provides:
             log_context["provides"] = f"{provides.__module__}.{provides.__qualname__}"
 
+        if scope is not Scope.SINGLETON:
+            log_context["scope"] = str(scope)
+
         logger.debug("service registered", **log_context)
 
     def define(self, service_type: type, instance: Any, *, name: str = None):
         self.cache[service_type, name] = instance
+        self._reset(service_type, name)
 
         log_context = {
             "service": f"{service_type.__module__}.{service_type.__qualname__}"
@@ -91,6 +216,7 @@ class Container:
             )
         )
         self.interceptors.append(interceptor)
+        self.interceptor_chains.clear()
 
         logger.debug(
             "interceptor registered",
@@ -104,19 +230,18 @@ class Container:
     def iter_service(
         self, service_type: type
     ) -> Iterable[tuple[type | FunctionType, str | None]]:
-        record = self.registry.services.get(service_type)
-        if not record:
+        providers = self.registry.providers(service_type)
+        if not providers:
             raise ServiceNotFoundError(service_type)
 
-        for name, definition in record.providers.items():
+        for name, definition in providers.items():
             yield definition.impl, name
 
     def iter_all_services(
         self,
     ) -> Iterable[tuple[type, type | FunctionType | None, str | None]]:
-        for _interface, record in self.registry.services.items():
-            for name, definition in record.providers.items():
-                yield definition.service, definition.impl, name
+        for definition in self.registry.specs():
+            yield definition.service, definition.impl, definition.name
 
     async def get(
         self, service_type: type[T], *, name: str = None, optional=False
@@ -124,14 +249,496 @@ class Container:
         dependency = ServiceDependency(service_type, name=name, optional=optional)
         return await self._get(dependency)
 
-    async def run_finalizers(self):
-        for finalizer in reversed(self.finalizers):
-            await finalizer
+    def get_cached(
+        self, service_type: type[T], *, name: str = None, default: Any = None
+    ) -> T | Any:
+        """Get a service only if its instance was already created
+
+        Singleton instances are looked up in the container and request scoped
+        instances in the active request. Nothing is created, so this method can
+        be called without awaiting, for instance after the singletons are
+        initialized on startup.
+
+        :param default: value returned if there is no instance of the service
+        """
+
+        instance = self._get_from_cache(service_type, name)
+        return default if instance is MISSING else instance
+
+    def get_nowait(self, service_type: type[T], *, name: str = None) -> T:
+        """Get a service whose instance was already created
+
+        :raises ServiceNotCreatedError: if there is no instance of the service
+        """
+
+        if (instance := self._get_from_cache(service_type, name)) is MISSING:
+            raise ServiceNotCreatedError(service_type, name)
+
+        return instance
+
+    def compile(self):
+        """Validate the service graph and plan the creation of each service
+
+        Registering or defining services afterwards discards the plan, and
+        services are resolved on demand until the container is compiled again
+
+        :raises MissingDependencyError: if a required dependency is not registered
+        :raises ScopeMismatchError: if a singleton depends on a request scoped service
+        :raises DependencyLoopError: if a dependency loop includes a factory function
+        """
+
+        self.graph, looped = compile_graph(self.registry, self._defined_keys())
+
+        # classes outside dependency loops receive their dependencies in the
+        # constructor, since they do not need to exist before their dependencies
+        self.constructor_injection = {
+            (service_spec.service, service_spec.name)
+            for service_spec in self.registry.specs()
+            if not service_spec.factory
+            and (service_spec.service, service_spec.name) not in looped
+            and _accepts_dependencies(service_spec)
+        }
+        logger.debug("service graph compiled", services=len(self.graph))
+
+    async def initialize_singletons(
+        self, *, timeout: float = None
+    ) -> dict[ServiceKey, float]:
+        """Create all singleton services ahead of their first use
+
+        Services are created in layers, each layer containing the services
+        whose dependencies were created in the previous layers, and the services
+        in a layer are created concurrently.
+
+        :param timeout: maximum time in seconds to create each service
+        :returns: time in seconds taken to create each service
+        :raises ServiceInitTimeoutError: if a service takes longer than the timeout
+        """
+
+        if self.graph is None:
+            self.compile()
+
+        timings = {}
+
+        for layer in self._singleton_layers():
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    for key in layer:
+                        task_group.create_task(
+                            self._initialize_singleton(key, timeout, timings)
+                        )
+            except ExceptionGroup as err:
+                raise err.exceptions[0]  # pylint: disable=raise-missing-from
+
+        return timings
+
+    async def _initialize_singleton(
+        self, key: ServiceKey, timeout: float | None, timings: dict[ServiceKey, float]
+    ):
+        if self._get_from_cache(*key) is not MISSING:
+            return
+
+        service_type, name = key
+        start = time.perf_counter()
+
+        try:
+            async with asyncio.timeout(timeout):
+                await self.get(service_type, name=name)
+        except TimeoutError:
+            # pylint: disable=raise-missing-from
+            raise ServiceInitTimeoutError(service_type, name, timeout)
+
+        timings[key] = elapsed = time.perf_counter() - start
+
+        log_context = {
+            "service": f"{service_type.__module__}.{service_type.__qualname__}",
+            "seconds": round(elapsed, 6),
+        }
+
+        if name:
+            log_context["name"] = name
+
+        logger.info("service initialized", **log_context)
+
+    def _singleton_layers(self) -> list[list[ServiceKey]]:
+        layers: dict[ServiceKey, int] = {}
+        visiting: set[ServiceKey] = set()
+
+        def layer_of(key: ServiceKey) -> int:
+            if (layer := layers.get(key)) is not None:
+                return layer
+
+            visiting.add(key)
+            layer = 0
+            for dep_spec in self.graph[key]:
+                dep_key = (dep_spec.service, dep_spec.name)
+                # a dependency in a loop of service classes is not waited for
+                if dep_key not in visiting:
+                    layer = max(layer, layer_of(dep_key) + 1)
+            visiting.discard(key)
+
+            layers[key] = layer
+            return layer
+
+        for key in self.graph:
+            service_spec = self.registry.get(*key)
+            if service_spec.scope is Scope.SINGLETON:
+                layer_of(key)
+
+        result = [[] for _ in range(max(layers.values(), default=-1) + 1)]
+        for key, layer in layers.items():
+            result[layer].append(key)
+
+        return result
+
+    def resolutions_by_scope(self) -> dict[Scope, int]:
+        """Number of times services of each scope were resolved
+
+        Services defined as instances are counted as singletons
+        """
+
+        result = dict.fromkeys(Scope, 0)
+        for (service_type, name), count in self.resolutions.items():
+            result[self.scope_of(service_type, name) or Scope.SINGLETON] += count
+
+        return result
+
+    def scope_of(self, service_type: type, name: str = None) -> Scope | None:
+        """Get the scope of a service, or None if the service is not found"""
+
+        if (service_type, name) in self.cache:
+            return Scope.SINGLETON
+
+        if service_spec := self.registry.get(service_type, name):
+            return service_spec.scope
+
+        if self.parent:
+            return self.parent.scope_of(service_type, name)
+
+        return None
+
+    @asynccontextmanager
+    async def request_scope(self):
+        """Activate a request scope for the current context
+
+        Request scoped services are cached while the scope is active and
+        their finalizers are run when it ends
+        """
+
+        request_scope = RequestScope()
+        token = self.request_scope_var.set(request_scope)
+        try:
+            yield request_scope
+        finally:
+            self.request_scope_var.reset(token)
+            await request_scope.close()
+
+    async def find(self, service_type: type[T], *, name: str = None) -> T | None:
+        """Get the service for the type or for the closest of its base types
+
+        Generic types are searched by the base types of their last type argument,
+        for instance `Converter[Body, Model]` may be provided by a service
+        registered for `Converter[Body, pydantic.BaseModel]`. The type found for
+        each requested type is cached, including when there is none.
+        """
+
+        key = (service_type, name)
+
+        try:
+            found = self.resolution_cache[key]
+        except KeyError:
+            found = self._resolve_type(service_type, name)
+            self.resolution_cache[key] = found
+
+        if found is None:
+            return None
+
+        return await self.get(found, name=name)
+
+    def _resolve_type(self, service_type: type, name: str | None) -> type | None:
+        candidates = _candidate_types(service_type)
+        defined = self._defined_keys()
+
+        for candidate in candidates:
+            if (candidate, name) in defined:
+                return candidate
+
+        if service_spec := self.registry.find(candidates, name):
+            return service_spec.service
+
+        return None
+
+    async def run_finalizers(
+        self, *, timeout: float = None, total_timeout: float = None
+    ) -> dict[ServiceKey, float]:
+        """Run the finalizers of the services created by the container
+
+        Finalizers run in layers, so the finalizer of a service only runs after
+        the finalizers of the services that depend on it, and the finalizers in
+        a layer run concurrently. Finalizers that fail or take longer than the
+        timeout are logged and do not hold up the other finalizers.
+
+        :param timeout: maximum time in seconds to run each finalizer
+        :param total_timeout: maximum time in seconds to run all finalizers,
+            finalizers not completed in time are cancelled
+        :returns: time in seconds taken to run the finalizers of each service
+        """
+
+        finalizers = self.finalizers
+        self.finalizers = []
+
+        timings = {}
+
+        try:
+            async with asyncio.timeout(total_timeout):
+                for layer in self._finalizer_layers(finalizers):
+                    async with asyncio.TaskGroup() as task_group:
+                        for key, finalizer in layer:
+                            task_group.create_task(
+                                self._run_finalizer(key, finalizer, timeout, timings)
+                            )
+        except TimeoutError:
+            logger.warning(
+                "service finalizers timed out",
+                timeout=total_timeout,
+                pending=len(finalizers) - len(timings),
+            )
+        finally:
+            # finalizers cancelled before they started
+            for _key, finalizer in finalizers:
+                if (
+                    inspect.iscoroutine(finalizer)
+                    and inspect.getcoroutinestate(finalizer) == inspect.CORO_CREATED
+                ):
+                    finalizer.close()
+
+        return timings
+
+    async def _run_finalizer(
+        self,
+        key: ServiceKey,
+        finalizer: Awaitable,
+        timeout: float | None,
+        timings: dict[ServiceKey, float],
+    ):
+        service_type, name = key
+
+        log_context = {
+            "service": f"{service_type.__module__}.{service_type.__qualname__}",
+        }
+
+        if name:
+            log_context["name"] = name
+
+        start = time.perf_counter()
+
+        try:
+            async with asyncio.timeout(timeout):
+                await finalizer
+        except TimeoutError:
+            logger.warning(
+                "service finalizer timed out", timeout=timeout, **log_context
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("service finalizer failed", **log_context)
+
+        elapsed = time.perf_counter() - start
+        timings[key] = timings.get(key, 0) + elapsed
+
+        logger.debug("service finalized", seconds=round(elapsed, 6), **log_context)
+
+    def _finalizer_layers(
+        self, finalizers: list[tuple[ServiceKey, Awaitable]]
+    ) -> list[list[tuple[ServiceKey, Awaitable]]]:
+        depths: dict[ServiceKey, int] = {}
+        visiting: set[ServiceKey] = set()
+
+        def depth_of(key: ServiceKey) -> int:
+            if (depth := depths.get(key)) is not None:
+                return depth
+
+            visiting.add(key)
+            depth = 0
+            if service_spec := self.registry.get(*key):
+                for _name, dep in service_spec.dependencies:
+                    dep_key = (dep.service, dep.name)
+                    # a dependency in a loop of service classes is not waited for
+                    if dep_key not in visiting:
+                        depth = max(depth, depth_of(dep_key) + 1)
+            visiting.discard(key)
+
+            depths[key] = depth
+            return depth
+
+        layers: dict[int, list[tuple[ServiceKey, Awaitable]]] = {}
+        for key, finalizer in reversed(finalizers):
+            layers.setdefault(depth_of(key), []).append((key, finalizer))
+
+        # services that depend on others are finalized before their dependencies
+        return [layers[depth] for depth in sorted(layers, reverse=True)]
+
+    def _defined_keys(self) -> Set[ServiceKey]:
+        if not self.parent:
+            return self.cache.keys()
+
+        return self.cache.keys() | self.parent._defined_keys()
+
+    def _get_from_cache(self, service_type: type[T], name: str | None) -> T | object:
+        key = (service_type, name)
+
+        if (instance := self.cache.get(key, MISSING)) is not MISSING:
+            return instance
+
+        if self.parent and (instance := self._get_inherited(key)) is not MISSING:
+            return instance
+
+        if request_scope := self.request_scope_var.get():
+            return self._request_scope_of(request_scope, key).cache.get(key, MISSING)
+
+        return MISSING
+
+    def _request_scope_of(
+        self, request_scope: RequestScope, key: ServiceKey
+    ) -> RequestScope:
+        """Request scope that holds the instances of the service in this container
+
+        Services that depend on an override of a child container are created
+        again in the request by the child, so they are kept in a scope of their own.
+        """
+
+        if not self.parent:
+            return request_scope
+
+        if self._inherits(key):
+            # pylint: disable=protected-access
+            return self.parent._request_scope_of(request_scope, key)
+
+        return request_scope.child(self)
+
+    def _get_inherited(self, key: ServiceKey) -> Any:
+        if not self._inherits(key):
+            return MISSING
+
+        # pylint: disable=protected-access
+        parent = self.parent
+        if (instance := parent.cache.get(key, MISSING)) is not MISSING:
+            return instance
+
+        if parent.parent:
+            return parent._get_inherited(key)
+
+        return MISSING
+
+    def _inherits(self, key: ServiceKey) -> bool:
+        """Whether the service does not depend on an override, directly or indirectly"""
+
+        if (inherits := self.inheritance.get(key)) is not None:
+            return inherits
+
+        visited = set()
+
+        def reaches_override(current: ServiceKey) -> bool:
+            if current in self.overrides:
+                return True
+
+            visited.add(current)
+
+            if service_spec := self.registry.get(*current):
+                for _name, dep in service_spec.dependencies:
+                    dep_key = (dep.service, dep.name)
+                    inherits = self.inheritance.get(dep_key)
+                    if inherits is False:
+                        return True
+                    if (
+                        inherits is None
+                        and dep_key not in visited
+                        and reaches_override(dep_key)
+                    ):
+                        return True
+
+            return False
+
+        if reaches_override(key):
+            self.inheritance[key] = False
+            return False
+
+        # nothing reachable from the service depends on an override
+        for visited_key in visited:
+            self.inheritance[visited_key] = True
+
+        return True
 
-        self.finalizers.clear()
+    def _cache_instance(self, service_spec: ServiceSpec, instance: Any):
+        key = (service_spec.service, service_spec.name)
 
-    def _get_from_cache(self, service_type: type[T], name: str | None) -> T | None:
-        return self.cache.get((service_type, name))
+        match service_spec.scope:
+            case Scope.SINGLETON:
+                self.cache[key] = instance
+            case Scope.REQUEST:
+                self._get_request_scope(service_spec).cache[key] = instance
+
+    def _get_request_scope(self, service_spec: ServiceSpec) -> RequestScope:
+        if not (request_scope := self.request_scope_var.get()):
+            raise RequestScopeNotActiveError(service_spec.service, service_spec.name)
+
+        key = (service_spec.service, service_spec.name)
+        return self._request_scope_of(request_scope, key)
+
+    def _lifetime_of(self, service_spec: ServiceSpec, stack: list) -> Scope:
+        """Scope that bounds the lifetime of the instance being created
+
+        Transient instances live as long as the service they are injected into,
+        so a transient dependency of a singleton lives as long as the singleton.
+        """
+
+        if service_spec.scope is not Scope.TRANSIENT:
+            return service_spec.scope
+
+        # the last item in the stack is the service being created
+        for key in reversed(stack[:-1]):
+            if (scope := self.scope_of(*key)) is not Scope.TRANSIENT:
+                return scope
+
+        return Scope.TRANSIENT
+
+    def _add_finalizer(
+        self,
+        service_spec: ServiceSpec,
+        stack: list,
+        finalizer: Callable[[], Awaitable],
+    ):
+        key = (service_spec.service, service_spec.name)
+        lifetime = self._lifetime_of(service_spec, stack)
+
+        if lifetime is Scope.SINGLETON:
+            self.finalizers.append((key, finalizer()))
+        elif request_scope := self.request_scope_var.get():
+            # finalizers of instances that do not outlive the request run at its end
+            self._request_scope_of(request_scope, key).finalizers.append(finalizer())
+        else:
+            # transient instances requested outside of a request are not owned by
+            # any scope, and keeping their finalizers would keep them alive
+            logger.debug(
+                "transient service finalizer discarded",
+                service=f"{key[0].__module__}.{key[0].__qualname__}",
+                name=key[1],
+            )
+
+    def _check_dependency_scopes(self, service_spec: ServiceSpec):
+        if service_spec.scope is not Scope.SINGLETON:
+            return
+
+        for _name, dep in service_spec.dependencies:
+            if dep.lazy:
+                continue
+
+            dep_spec = self.registry.get(dep.service, dep.name)
+            if dep_spec and dep_spec.scope is Scope.REQUEST:
+                raise ScopeMismatchError(
+                    service_spec.service,
+                    service_spec.scope,
+                    dep_spec.service,
+                    dep_spec.scope,
+                )
 
     async def _get(
         self,
@@ -145,7 +752,9 @@ class Container:
         )
 
         # check if service exists in cache
-        if instance := self._get_from_cache(service_type, service_name):
+        instance = self._get_from_cache(service_type, service_name)
+        if instance is not MISSING:
+            self.resolutions[service_type, service_name] += 1
             return instance
 
         try:
@@ -157,22 +766,82 @@ class Container:
                 return None
             raise
 
+        if not stack and self.graph is not None:
+            await self._create_planned_services((service_type, service_name))
+
+            # service created as a dependency of a service in a loop
+            instance = self._get_from_cache(service_type, service_name)
+            if instance is not MISSING:
+                self.resolutions[service_type, service_name] += 1
+                return instance
+
         stack = stack or []
 
         if (service_type, service_name) in stack:
             raise DependencyLoopError(stack, (service_type, service_name))
 
         stack.append((service_type, service_name))
-        instance = await self._create_service(service_spec, stack)
+        instance = await self._create_once(service_spec, stack)
         stack.pop()
 
+        self.resolutions[service_type, service_name] += 1
+
+        return instance
+
+    async def _create_planned_services(self, key: ServiceKey):
+        # dependencies come before their dependents in the plan, so creating
+        # each service only needs to look up the instances already created
+        for dep_spec in self.graph.get(key, []):
+            dep_key = (dep_spec.service, dep_spec.name)
+            if self._get_from_cache(*dep_key) is MISSING:
+                await self._create_once(dep_spec, [dep_key])
+
+    async def _create_once(self, service_spec: ServiceSpec, stack: list) -> Any:
+        """Create the service, unless it is already being created
+
+        Concurrent requests for a singleton, or for a request scoped service in
+        the same request, wait for the instance being created instead of
+        creating another one.
+        """
+
+        match service_spec.scope:
+            case Scope.SINGLETON:
+                pending = self.pending
+            case Scope.REQUEST:
+                pending = self._get_request_scope(service_spec).pending
+            case _:
+                return await self._create_service(service_spec, stack)
+
+        key = (service_spec.service, service_spec.name)
+
+        if (future := pending.get(key)) is not None:
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        pending[key] = future
+
+        try:
+            instance = await self._create_service(service_spec, stack)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as err:
+            future.set_exception(err)
+            # the error is raised here, so it is not lost if nobody is waiting
+            future.exception()
+            raise
+        finally:
+            del pending[key]
+
+        future.set_result(instance)
         return instance
 
     async def _get_dependent_services(
         self, service_spec: ServiceSpec, stack: list
     ) -> dict[str, Any]:
         return {
-            name: await self._get(dep, stack) for name, dep in service_spec.dependencies
+            name: Lazy(self, dep) if dep.lazy else await self._get(dep, stack)
+            for name, dep in service_spec.dependencies
         }
 
     async def _create_service(
@@ -180,54 +849,117 @@ class Container:
         service_spec: ServiceSpec,
         stack: list[tuple[type[T], str]],
     ) -> T:
-        name = service_spec.name
+        if self.graph is None:
+            self._check_dependency_scopes(service_spec)
+
+        if service_spec.scope is Scope.REQUEST:
+            self._get_request_scope(service_spec)
+
+        initializer_time = interceptors_time = 0.0
+        cached = False
 
         if factory := service_spec.factory:
             dependencies = await self._get_dependent_services(service_spec, stack)
 
+            start = time.perf_counter()
             instance = await maybe_async(factory, **dependencies)
             if inspect.isgenerator(instance):
                 generator = instance
-                instance = await asyncio.to_thread(next, generator)
-                self._setup_generator_finalizer(generator)
+                instance = await get_executor().run(next, generator)
+                self._setup_generator_finalizer(service_spec, stack, generator)
             elif inspect.isasyncgen(instance):
                 generator = instance
                 instance = await anext(generator)
-                self._setup_asyncgen_finalizer(generator)
+                self._setup_asyncgen_finalizer(service_spec, stack, generator)
+            factory_time = time.perf_counter() - start
+        elif (service_spec.service, service_spec.name) in self.constructor_injection:
+            dependencies = await self._get_dependent_services(service_spec, stack)
 
-            self.cache[service_spec.service, name] = instance
+            start = time.perf_counter()
+            instance = service_spec.impl(**dependencies)
+            factory_time = time.perf_counter() - start
         else:
+            # services in a loop of service classes must exist before their
+            # dependencies, so the dependencies are set after they are resolved
+            # and the instance is cached before it is initialized
+            start = time.perf_counter()
             instance = service_spec.impl()
-            self.cache[service_spec.service, name] = instance
+            factory_time = time.perf_counter() - start
+
+            self._cache_instance(service_spec, instance)
+            cached = True
 
             dependencies = await self._get_dependent_services(service_spec, stack)
 
             for name, dep_service in dependencies.items():
                 setattr(instance, name, dep_service)
 
+        if not factory:
             if initializer := service_spec.initializer:
+                start = time.perf_counter()
                 await maybe_async(initializer, instance)
+                initializer_time = time.perf_counter() - start
 
-            self._setup_finalizer(service_spec, instance)
+            self._setup_finalizer(service_spec, stack, instance)
 
-        if service_spec.service is not Interceptor:
+        if self.interceptors and service_spec.service is not Interceptor:
+            start = time.perf_counter()
             await self._run_interceptors(instance, service_spec.service)
+            interceptors_time = time.perf_counter() - start
+
+        # concurrent requests for the service wait for it to be ready, instead
+        # of finding an instance that is not initialized in the cache
+        if not cached:
+            self._cache_instance(service_spec, instance)
+
+        key = (service_spec.service, service_spec.name)
+        timings = self.timings.get(key, ServiceTimings())
+        self.timings[key] = timings.add(
+            factory_time, initializer_time, interceptors_time
+        )
 
         return instance
 
-    def _setup_finalizer(self, service_spec: ServiceSpec, instance: Any):
+    def _setup_finalizer(self, service_spec: ServiceSpec, stack: list, instance: Any):
         if finalizer := service_spec.finalizer:
-            self.finalizers.append(maybe_async(finalizer, instance))
+            self._add_finalizer(
+                service_spec, stack, functools.partial(maybe_async, finalizer, instance)
+            )
 
-    def _setup_generator_finalizer(self, gen: Generator):
-        self.finalizers.append(asyncio.to_thread(next, gen, None))
+    def _setup_generator_finalizer(
+        self, service_spec: ServiceSpec, stack: list, gen: Generator
+    ):
+        self._add_finalizer(
+            service_spec,
+            stack,
+            functools.partial(get_executor().run, next, gen, None),
+        )
 
-    def _setup_asyncgen_finalizer(self, gen: AsyncGenerator):
-        self.finalizers.append(anext(gen, None))
+    def _setup_asyncgen_finalizer(
+        self, service_spec: ServiceSpec, stack: list, gen: AsyncGenerator
+    ):
+        self._add_finalizer(service_spec, stack, functools.partial(anext, gen, None))
 
     async def _run_interceptors(self, instance: Any, service_type: type):
-        for cls in self.interceptors:
-            interceptor = await self.get(
-                Interceptor, name=f"{cls.__module__}.{cls.__qualname__}"
-            )
+        if (chain := self.interceptor_chains.get(service_type)) is None:
+            chain = await self._build_interceptor_chain(service_type)
+
+        for interceptor in chain:
             await maybe_async(interceptor.intercept, instance, service_type)
+
+    async def _build_interceptor_chain(self, service_type: type) -> list[Interceptor]:
+        base_types = get_base_types(service_type)
+        chain = []
+
+        for cls in self.interceptors:
+            service_types = getattr(cls, "service_types", None)
+            if service_types is not None and not any(
+                base in service_types for base in base_types
+            ):
+                continue
+
+            name = f"{cls.__module__}.{cls.__qualname__}"
+            chain.append(await self.get(Interceptor, name=name))
+
+        self.interceptor_chains[service_type] = chain
+        return chain
@@ -1,14 +1,17 @@
 import inspect
 import typing
 from collections.abc import Callable
-from typing import Annotated, TypeVar, dataclass_transform
+from typing import Annotated, Any, TypeVar, dataclass_transform
 
 from selva.di.inject import Inject
+from selva.di.scope import Scope
 from selva.di.service.model import InjectableType, ServiceInfo
 
-__all__ = ("service", "ATTRIBUTE_DI_SERVICE")
+__all__ = ("service", "ATTRIBUTE_DI_SERVICE", "ATTRIBUTE_DI_INIT")
 
 ATTRIBUTE_DI_SERVICE = "__selva_di_service__"
+# dependencies accepted by the generated constructor of service classes
+ATTRIBUTE_DI_INIT = "__selva_di_init__"
 
 T = TypeVar("T")
 
@@ -24,51 +27,115 @@ def _is_inject(value) -> bool:
     return isinstance(args[1], Inject) or args[1] is Inject
 
 
-def _service(
-    injectable: InjectableType,
-    attribute_name: str,
-    attribute_value,
-) -> InjectableType:
-    setattr(injectable, attribute_name, attribute_value)
+def _make_init(dependencies: list[str], original_init: Callable | None) -> Callable:
+    """Generate the constructor of a service class
 
-    if inspect.isclass(injectable):
-        dependencies = [
-            dependency
-            for dependency, annotation in inspect.get_annotations(injectable).items()
-            if _is_inject(annotation)
-        ]
+    The constructor assigns each dependency from its argument directly, instead
+    of matching the arguments to the dependencies on each call.
+    """
 
-        # save a reference to the original constructor
-        original_init = getattr(injectable, "__init__", None)
+    params = "".join(f", {dependency}=None" for dependency in dependencies)
+    lines = [f"def __init__(self{params}, *_args, **_kwargs):"]
+
+    if original_init:
+        lines.append("    original_init(self)")
+
+    lines.extend(f"    self.{dependency} = {dependency}" for dependency in dependencies)
+
+    if len(lines) == 1:
+        lines.append("    pass")
+
+    namespace = {}
+    # pylint: disable=exec-used
+    exec("\n".join(lines), {"original_init": original_init}, namespace)
+    init = namespace["__init__"]
+    setattr(init, ATTRIBUTE_DI_INIT, tuple(dependencies))
+
+    init.__doc__ = """Generated init method for service
+
+    Positional and keyword arguments will be set to declared dependencies.
+    Dependencies without an argument to set their value will be None.
+    Remaining arguments will be ignored.
+    """
+
+    return init
+
+
+def _add_slots(injectable: type, dependencies: list[str]) -> type:
+    """Recreate the service class with the dependencies as slots"""
 
-        def init(self, *args, **kwargs):
-            """Generated init method for service
+    namespace = dict(injectable.__dict__)
 
-            Positional and keyword arguments will be set to declared dependencies.
-            Dependencies without an argument to set their value will be None.
-            Remaining arguments will be ignored.
-            """
+    inherited_slots = {
+        slot
+        for base in injectable.__mro__[1:]
+        for slot in getattr(base, "__slots__", ())
+    }
+    namespace["__slots__"] = tuple(d for d in dependencies if d not in inherited_slots)
 
-            # call original constructor
-            if original_init:
-                original_init(self)
+    for name in (*dependencies, "__dict__", "__weakref__"):
+        namespace.pop(name, None)
 
-            positional_params = [d for d in dependencies if d not in kwargs]
+    cls = type(injectable)(injectable.__name__, injectable.__bases__, namespace)
+    cls.__qualname__ = injectable.__qualname__
 
-            # set positional argument values
-            values = dict(zip(positional_params, args))
+    # methods using zero argument super() refer to the class in a cell
+    for member in namespace.values():
+        _update_class_cell(member, injectable, cls)
 
-            # set keyword argument values
-            values |= {k: v for k, v in kwargs.items() if k in dependencies}
+    return cls
 
-            # the rest of the dependencies will be set to None
-            param_keys = values.keys()
-            values |= {d: None for d in dependencies if d not in param_keys}
 
-            for k, v in values.items():
-                setattr(self, k, v)
+def _update_class_cell(member: Any, old_cls: type, new_cls: type):
+    if isinstance(member, classmethod | staticmethod):
+        member = member.__func__
 
-        setattr(injectable, "__init__", init)
+    if isinstance(member, property):
+        for accessor in (member.fget, member.fset, member.fdel):
+            _update_class_cell(accessor, old_cls, new_cls)
+        return
+
+    if not inspect.isfunction(member) or not member.__closure__:
+        return
+
+    try:
+        index = member.__code__.co_freevars.index("__class__")
+    except ValueError:
+        return
+
+    cell = member.__closure__[index]
+    if cell.cell_contents is old_cls:
+        cell.cell_contents = new_cls
+
+
+def _service(
+    injectable: InjectableType,
+    attribute_name: str,
+    attribute_value,
+    slots: bool = False,
+) -> InjectableType:
+    if inspect.isclass(injectable):
+        # dependencies declared in base classes are assigned by the constructor too
+        dependencies = list(
+            dict.fromkeys(
+                dependency
+                for cls in reversed(injectable.__mro__)
+                for dependency, annotation in inspect.get_annotations(cls).items()
+                if _is_inject(annotation)
+            )
+        )
+
+        if slots:
+            injectable = _add_slots(injectable, dependencies)
+
+        # save a reference to the original constructor
+        original_init = injectable.__init__
+        if original_init is object.__init__:
+            original_init = None
+
+        setattr(injectable, "__init__", _make_init(dependencies, original_init))
+
+    setattr(injectable, attribute_name, attribute_value)
 
     return injectable
 
@@ -80,16 +147,26 @@ def service(
     *,
     provides: type = None,
     name: str = None,
+    scope: Scope = Scope.SINGLETON,
+    slots: bool = False,
 ) -> T | Callable[[T], T]:
     """Declare a class or function as a service
 
     For classes, a constructor will be generated to help create instances
     outside the dependency injection context
+
+    :param scope: lifetime of the service instances, see `selva.di.Scope`
+    :param slots: for classes, store the dependencies in `__slots__`, in which
+        case the class is recreated and instances have no `__dict__` unless a
+        base class provides one
     """
 
     def inner(inner_injectable) -> T:
         return _service(
-            inner_injectable, ATTRIBUTE_DI_SERVICE, ServiceInfo(provides, name)
+            inner_injectable,
+            ATTRIBUTE_DI_SERVICE,
+            ServiceInfo(provides, name, Scope(scope)),
+            slots,
         )
 
     return inner(injectable) if injectable else inner
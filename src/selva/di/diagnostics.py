@@ -0,0 +1,158 @@
+import inspect
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from selva.di.scope import Scope
+
+if TYPE_CHECKING:
+    from selva.di.container import Container
+
+__all__ = ("ServiceTimings", "dependency_graph", "dependency_graph_dot")
+
+
+class ServiceTimings(NamedTuple):
+    """Time in seconds spent creating the instances of a service
+
+    Each phase is the sum over all instances created, and does not include
+    the time taken to resolve the dependencies of the service.
+    """
+
+    count: int = 0
+    factory: float = 0.0
+    initializer: float = 0.0
+    interceptors: float = 0.0
+
+    @property
+    def total(self) -> float:
+        return self.factory + self.initializer + self.interceptors
+
+    def add(
+        self, factory: float, initializer: float, interceptors: float
+    ) -> "ServiceTimings":
+        return ServiceTimings(
+            self.count + 1,
+            self.factory + factory,
+            self.initializer + initializer,
+            self.interceptors + interceptors,
+        )
+
+
+def _type_name(value: Any) -> str:
+    if inspect.isclass(value) or inspect.isfunction(value):
+        return f"{value.__module__}.{value.__qualname__}"
+
+    return repr(value)
+
+
+def _service_id(service_type: type, name: str | None) -> str:
+    service_id = _type_name(service_type)
+    return f"{service_id}#{name}" if name else service_id
+
+
+def _timings(timings: ServiceTimings | None) -> dict | None:
+    if timings is None:
+        return None
+
+    return timings._asdict() | {"total": timings.total}
+
+
+def dependency_graph(di: "Container") -> dict:
+    """Export the services of the container and their dependencies
+
+    The result can be serialized to json, and contains a list of `services`
+    with their scope, whether they were created and how long they took to
+    create, and a list of `dependencies` between them.
+    """
+
+    services = []
+    dependencies = []
+    known = set()
+
+    for service_spec in di.registry.specs():
+        key = (service_spec.service, service_spec.name)
+        known.add(key)
+
+        services.append(
+            {
+                "id": _service_id(*key),
+                "service": _type_name(service_spec.service),
+                "name": service_spec.name,
+                "impl": _type_name(service_spec.factory or service_spec.impl),
+                "scope": str(service_spec.scope),
+                "created": key in di.cache,
+                "resolutions": di.resolutions[key],
+                "timings": _timings(di.timings.get(key)),
+            }
+        )
+
+        for attribute, dep in service_spec.dependencies:
+            dependencies.append(
+                {
+                    "source": _service_id(*key),
+                    "target": _service_id(dep.service, dep.name),
+                    "attribute": attribute,
+                    "optional": dep.optional,
+                    "lazy": dep.lazy,
+                }
+            )
+
+    # services defined as instances
+    for key in di.cache:
+        if key in known:
+            continue
+
+        known.add(key)
+        services.append(
+            {
+                "id": _service_id(*key),
+                "service": _type_name(key[0]),
+                "name": key[1],
+                "impl": None,
+                "scope": str(Scope.SINGLETON),
+                "created": True,
+                "resolutions": di.resolutions[key],
+                "timings": None,
+            }
+        )
+
+    ids = {service["id"] for service in services}
+
+    # optional dependencies that are not registered
+    dependencies = [dep for dep in dependencies if dep["target"] in ids]
+
+    return {"services": services, "dependencies": dependencies}
+
+
+def _quote(value: str) -> str:
+    value = value.replace('"', '\\"')
+    return f'"{value}"'
+
+
+def dependency_graph_dot(graph: dict) -> str:
+    """Render the result of `dependency_graph` in the graphviz dot format
+
+    Lazy dependencies are drawn dashed and optional dependencies dotted
+    """
+
+    lines = ["digraph services {"]
+
+    for service in graph["services"]:
+        label = f"{service['service']}\\n{service['scope']}"
+        if service["name"]:
+            label = f"{service['service']} ({service['name']})\\n{service['scope']}"
+        if timings := service["timings"]:
+            label += f"\\n{timings['total'] * 1000:.3f} ms"
+
+        lines.append(f"  {_quote(service['id'])} [label={_quote(label)}];")
+
+    for dep in graph["dependencies"]:
+        if dep["lazy"]:
+            style = " [style=dashed]"
+        elif dep["optional"]:
+            style = " [style=dotted]"
+        else:
+            style = ""
+
+        lines.append(f"  {_quote(dep['source'])} -> {_quote(dep['target'])}{style};")
+
+    lines.append("}")
+    return "\n".join(lines) + "\n"
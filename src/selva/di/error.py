@@ -109,3 +109,49 @@ class InvalidDependencyAnnotationError(DependencyInjectionError):
         super().__init__(
             f"dependency '{dependency}' has invalid annotation '{annotation}'"
         )
+
+
+class RequestScopeNotActiveError(DependencyInjectionError):
+    def __init__(self, service: type, name: str = None):
+        message = f"service '{_type_name(service)}'"
+        if name is not None:
+            message += f" with name '{name}'"
+
+        super().__init__(f"{message} is request scoped, but no request is active")
+
+
+class ScopeMismatchError(DependencyInjectionError):
+    def __init__(self, service: type, scope: str, dependency: type, dep_scope: str):
+        super().__init__(
+            f"{scope} service '{_type_name(service)}' cannot depend on"
+            f" {dep_scope} service '{_type_name(dependency)}'"
+        )
+
+
+class MissingDependencyError(DependencyInjectionError):
+    def __init__(self, service: type, dependency: type, name: str = None):
+        message = (
+            f"service '{_type_name(service)}' depends on '{_type_name(dependency)}'"
+        )
+        if name is not None:
+            message += f" with name '{name}'"
+
+        super().__init__(f"{message}, which is not registered")
+
+
+class ServiceInitTimeoutError(DependencyInjectionError):
+    def __init__(self, service: type, name: str | None, timeout: float):
+        message = f"service '{_type_name(service)}'"
+        if name is not None:
+            message += f" with name '{name}'"
+
+        super().__init__(f"{message} was not initialized within {timeout} seconds")
+
+
+class ServiceNotCreatedError(DependencyInjectionError):
+    def __init__(self, service: type, name: str = None):
+        message = f"service '{_type_name(service)}'"
+        if name is not None:
+            message += f" with name '{name}'"
+
+        super().__init__(f"{message} was not created yet")
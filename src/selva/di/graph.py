@@ -0,0 +1,227 @@
+from collections.abc import Iterable
+
+from selva.di.error import (
+    DependencyLoopError,
+    MissingDependencyError,
+    ScopeMismatchError,
+)
+from selva.di.scope import Scope
+from selva.di.service.model import ServiceSpec
+from selva.di.service.registry import ServiceRegistry
+
+__all__ = ("ServiceKey", "compile_graph")
+
+ServiceKey = tuple[type, str | None]
+
+
+def _service_key(service_spec: ServiceSpec) -> ServiceKey:
+    return service_spec.service, service_spec.name
+
+
+def _build_edges(
+    registry: ServiceRegistry,
+    specs: Iterable[ServiceSpec],
+    defined: set[ServiceKey],
+) -> dict[ServiceKey, list[ServiceSpec]]:
+    """Map each service to the registered services it depends on
+
+    :raises MissingDependencyError: if a required dependency is not registered
+    :raises ScopeMismatchError: if a singleton depends on a request scoped service
+    """
+
+    edges = {}
+
+    for service_spec in specs:
+        dependencies = []
+
+        for _name, dep in service_spec.dependencies:
+            if (dep.service, dep.name) in defined:
+                continue
+
+            if not (dep_spec := registry.get(dep.service, dep.name)):
+                if dep.optional:
+                    continue
+                raise MissingDependencyError(
+                    service_spec.service, dep.service, dep.name
+                )
+
+            # lazy dependencies are resolved when used, so they are neither
+            # created with the service nor part of dependency loops
+            if dep.lazy:
+                continue
+
+            if (
+                service_spec.scope is Scope.SINGLETON
+                and dep_spec.scope is Scope.REQUEST
+            ):
+                raise ScopeMismatchError(
+                    service_spec.service,
+                    service_spec.scope,
+                    dep_spec.service,
+                    dep_spec.scope,
+                )
+
+            dependencies.append(dep_spec)
+
+        edges[_service_key(service_spec)] = dependencies
+
+    return edges
+
+
+def _strongly_connected(
+    edges: dict[ServiceKey, list[ServiceSpec]],
+) -> list[list[ServiceKey]]:
+    """Find the groups of services that depend on each other, using Tarjan's algorithm
+
+    Services that are not part of a loop are not included in the result
+    """
+
+    index: dict[ServiceKey, int] = {}
+    lowlink: dict[ServiceKey, int] = {}
+    stack: list[ServiceKey] = []
+    on_stack: set[ServiceKey] = set()
+    result = []
+
+    for root in edges:
+        if root in index:
+            continue
+
+        work = [(root, iter(edges[root]))]
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+
+        while work:
+            key, dependencies = work[-1]
+
+            for dep_spec in dependencies:
+                dep_key = _service_key(dep_spec)
+                if dep_key not in index:
+                    index[dep_key] = lowlink[dep_key] = len(index)
+                    stack.append(dep_key)
+                    on_stack.add(dep_key)
+                    work.append((dep_key, iter(edges[dep_key])))
+                    break
+
+                if dep_key in on_stack:
+                    lowlink[key] = min(lowlink[key], index[dep_key])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[key])
+
+                if lowlink[key] == index[key]:
+                    component = []
+                    while True:
+                        item = stack.pop()
+                        on_stack.discard(item)
+                        component.append(item)
+                        if item == key:
+                            break
+
+                    if len(component) > 1 or any(
+                        _service_key(dep) == key for dep in edges[key]
+                    ):
+                        result.append(component)
+
+    return result
+
+
+def _find_loop(
+    start: ServiceKey,
+    edges: dict[ServiceKey, list[ServiceSpec]],
+    component: set[ServiceKey],
+) -> list[ServiceKey]:
+    """Find a path from the service back to itself inside its component"""
+
+    parents: dict[ServiceKey, ServiceKey] = {}
+    queue = [start]
+
+    while queue:
+        key = queue.pop(0)
+        for dep_spec in edges[key]:
+            dep_key = _service_key(dep_spec)
+            if dep_key == start:
+                path = [key]
+                while path[-1] != start:
+                    path.append(parents[path[-1]])
+                return list(reversed(path))
+
+            if dep_key in component and dep_key not in parents:
+                parents[dep_key] = key
+                queue.append(dep_key)
+
+    return [start]
+
+
+def _check_loops(
+    edges: dict[ServiceKey, list[ServiceSpec]],
+    specs: dict[ServiceKey, ServiceSpec],
+    components: list[list[ServiceKey]],
+):
+    """Find dependency loops that cannot be resolved
+
+    Service classes are instantiated before their dependencies are set, so
+    loops made only of service classes are resolved. Factory functions need
+    their dependencies before creating the service, so any loop including a
+    factory function cannot be resolved.
+
+    :raises DependencyLoopError:
+    """
+
+    for component in components:
+        for key in component:
+            if specs[key].factory:
+                loop = _find_loop(key, edges, set(component))
+                raise DependencyLoopError(loop, key)
+
+
+def _instantiation_order(
+    root: ServiceKey, edges: dict[ServiceKey, list[ServiceSpec]]
+) -> list[ServiceSpec]:
+    """Singleton dependencies of the service, each after its own dependencies"""
+
+    result = []
+    visited = {root}
+
+    def visit(key: ServiceKey):
+        for dep_spec in edges[key]:
+            dep_key = _service_key(dep_spec)
+            if dep_key in visited or dep_spec.scope is not Scope.SINGLETON:
+                continue
+
+            visited.add(dep_key)
+            visit(dep_key)
+            result.append(dep_spec)
+
+    visit(root)
+    return result
+
+
+def compile_graph(
+    registry: ServiceRegistry, defined: Iterable[ServiceKey]
+) -> tuple[dict[ServiceKey, list[ServiceSpec]], set[ServiceKey]]:
+    """Validate the service graph and build the instantiation plan of each service
+
+    :param registry: registered services
+    :param defined: keys of services defined as instances
+    :returns: mapping of services to the singleton services they depend on,
+        directly or indirectly, in the order they should be instantiated, and
+        the services that are part of a dependency loop
+
+    :raises MissingDependencyError:
+    :raises ScopeMismatchError:
+    :raises DependencyLoopError:
+    """
+
+    specs = {_service_key(spec): spec for spec in registry.specs()}
+    edges = _build_edges(registry, specs.values(), set(defined))
+
+    components = _strongly_connected(edges)
+    _check_loops(edges, specs, components)
+
+    plan = {key: _instantiation_order(key, edges) for key in edges}
+    looped = {key for component in components for key in component}
+
+    return plan, looped
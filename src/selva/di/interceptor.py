@@ -3,5 +3,21 @@ from typing import Protocol, runtime_checkable
 
 @runtime_checkable
 class Interceptor(Protocol):
+    """Receives the instances of services right after they are created
+
+    Interceptors can declare the service types they apply to in the
+    `service_types` class attribute, in which case they are only called for
+    services of those types or their subclasses. Interceptors without it are
+    called for all services.
+
+    Example:
+        @service
+        class RepositoryInterceptor:
+            service_types = (Repository,)
+
+            async def intercept(self, instance: object, service_type: type):
+                ...
+    """
+
     async def intercept(self, instance: object, service_type: type):
         pass
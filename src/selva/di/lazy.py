@@ -0,0 +1,65 @@
+from collections.abc import Generator
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from selva.di.scope import Scope
+from selva.di.service.model import ServiceDependency
+
+if TYPE_CHECKING:
+    from selva.di.container import Container
+
+__all__ = ("Lazy",)
+
+T = TypeVar("T")
+
+
+class Lazy(Generic[T]):
+    """Dependency that is only resolved when it is first used
+
+    Declaring a dependency as `Lazy[T]` injects a proxy instead of the service,
+    and the service is created when the proxy is awaited, so services that are
+    rarely used are not created with the services that depend on them.
+
+    Singleton services are kept by the proxy after they are resolved, while
+    request scoped and transient services are resolved on each use.
+
+    Example:
+        @service
+        class MyService:
+            engine: Annotated[Lazy[Engine], Inject]
+
+            async def run(self):
+                engine = await self.engine
+    """
+
+    __slots__ = ("_di", "_dependency", "_instance")
+
+    def __init__(self, di: "Container", dependency: ServiceDependency):
+        self._di = di
+        self._dependency = dependency
+        self._instance = None
+
+    @property
+    def resolved(self) -> bool:
+        """Whether the singleton service was already resolved"""
+        return self._instance is not None
+
+    async def get(self) -> T:
+        if self._instance is not None:
+            return self._instance
+
+        service_type, name, optional = self._dependency[:3]
+        instance = await self._di.get(service_type, name=name, optional=optional)
+
+        if self._di.scope_of(service_type, name) is Scope.SINGLETON:
+            self._instance = instance
+
+        return instance
+
+    def __await__(self) -> Generator[Any, None, T]:
+        return self.get().__await__()
+
+    def __repr__(self) -> str:
+        service_type, name = self._dependency[:2]
+        service = getattr(service_type, "__qualname__", service_type)
+        name = f", name={name!r}" if name else ""
+        return f"Lazy[{service}{name}]"
@@ -0,0 +1,67 @@
+import asyncio
+from collections.abc import Awaitable
+from enum import StrEnum
+from typing import Any
+
+import structlog
+
+__all__ = ("Scope", "RequestScope")
+
+logger = structlog.get_logger(__name__)
+
+
+class Scope(StrEnum):
+    """Lifetime of service instances
+
+    - singleton: a single instance is created and shared by the whole application
+    - request: an instance is created for each request and shared while the
+      request is being handled
+    - transient: a new instance is created each time the service is requested
+    """
+
+    SINGLETON = "singleton"
+    REQUEST = "request"
+    TRANSIENT = "transient"
+
+
+class RequestScope:
+    """Instances and finalizers of the services created during a request"""
+
+    __slots__ = ("cache", "pending", "finalizers", "children")
+
+    def __init__(self):
+        self.cache: dict[tuple[type, str | None], Any] = {}
+        # services being created, awaited by concurrent requests for them
+        self.pending: dict[tuple[type, str | None], asyncio.Future] = {}
+        self.finalizers: list[Awaitable] = []
+        # scopes of the services that child containers do not inherit
+        self.children: dict[Any, RequestScope] = {}
+
+    def child(self, owner: Any) -> "RequestScope":
+        """Request scope for the instances that only `owner` can use"""
+
+        if (scope := self.children.get(owner)) is None:
+            scope = self.children[owner] = RequestScope()
+
+        return scope
+
+    async def close(self):
+        """Run the finalizers, logging the ones that fail
+
+        The scopes of child containers are closed first, as their services may
+        depend on the services of this scope, but not the other way around.
+        """
+
+        try:
+            for child in reversed(self.children.values()):
+                await child.close()
+
+            for finalizer in reversed(self.finalizers):
+                try:
+                    await finalizer
+                except Exception:  # pylint: disable=broad-exception-caught
+                    logger.exception("request service finalizer failed")
+        finally:
+            self.children.clear()
+            self.finalizers.clear()
+            self.cache.clear()
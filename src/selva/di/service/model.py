@@ -2,18 +2,22 @@ from collections.abc import Callable
 from types import FunctionType
 from typing import NamedTuple
 
+from selva.di.scope import Scope
+
 InjectableType = type | FunctionType
 
 
 class ServiceInfo(NamedTuple):
     provides: type | None
     name: str | None
+    scope: Scope = Scope.SINGLETON
 
 
 class ServiceDependency(NamedTuple):
     service: type
     name: str | None
     optional: bool = False
+    lazy: bool = False
 
 
 class ServiceSpec(NamedTuple):
@@ -24,3 +28,4 @@ class ServiceSpec(NamedTuple):
     dependencies: list[tuple[str, ServiceDependency]]
     initializer: Callable | None = None
     finalizer: Callable | None = None
+    scope: Scope = Scope.SINGLETON
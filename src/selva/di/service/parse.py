@@ -13,6 +13,8 @@ from selva.di.error import (
     TypeVarInGenericServiceError,
 )
 from selva.di.inject import Inject
+from selva.di.lazy import Lazy
+from selva.di.scope import Scope
 from selva.di.service.model import InjectableType, ServiceDependency, ServiceSpec
 
 DI_INITIALIZER = "initialize"
@@ -25,6 +27,7 @@ def parse_service_spec(
     injectable: InjectableType,
     provides: type = None,
     name: str = None,
+    scope: Scope = Scope.SINGLETON,
 ) -> ServiceSpec:
     if inspect.isclass(injectable):
         provided_service, initializer, finalizer = _parse_definition_class(
@@ -59,6 +62,7 @@ def parse_service_spec(
         dependencies=dependencies,
         initializer=initializer,
         finalizer=finalizer,
+        scope=Scope(scope),
     )
 
 
@@ -71,7 +75,12 @@ def get_dependencies(
         else:
             service_name = None
 
-        dependency = ServiceDependency(hint, name=service_name, optional=is_optional)
+        if lazy := typing.get_origin(hint) is Lazy:
+            hint = typing.get_args(hint)[0]
+
+        dependency = ServiceDependency(
+            hint, name=service_name, optional=is_optional, lazy=lazy
+        )
         yield name, dependency
 
 
@@ -1,5 +1,5 @@
 import typing
-from collections import defaultdict
+from collections.abc import Iterable
 
 from selva.di.error import ServiceAlreadyRegisteredError, ServiceNotFoundError
 from selva.di.service.model import ServiceSpec
@@ -39,27 +39,76 @@ def _get_key_with_name(key: type | tuple[type, str]) -> tuple[type, str | None]:
 
 
 class ServiceRegistry:
-    def __init__(self):
-        self.services: dict[type, ServiceRecord] = defaultdict(ServiceRecord)
+    """Services registered for each type
+
+    A registry with a parent also returns the services registered in the
+    parent, unless it has its own service registered for the same type and name.
+    """
+
+    def __init__(self, parent: "ServiceRegistry" = None):
+        self.parent = parent
+        self.services: dict[type, ServiceRecord] = {}
 
     def get(self, key: type, name: str = None) -> ServiceSpec | None:
-        try:
-            return self[key, name]
-        except ServiceNotFoundError:
-            return None
+        """Get the service registered for the type, without modifying the registry"""
+
+        if (record := self.services.get(key)) and (service := record.get(name)):
+            return service
+
+        if self.parent:
+            return self.parent.get(key, name)
+
+        return None
+
+    def types(self) -> list[type]:
+        """Types with registered services, including the ones of the parent"""
+
+        if not self.parent:
+            return list(self.services)
+
+        return list(dict.fromkeys([*self.parent.types(), *self.services]))
+
+    def providers(self, key: type) -> dict[str | None, ServiceSpec]:
+        """Services registered for the type by name, including the ones of the parent"""
+
+        providers = self.parent.providers(key) if self.parent else {}
+
+        if record := self.services.get(key):
+            providers |= record.providers
+
+        return providers
+
+    def specs(self) -> Iterable[ServiceSpec]:
+        """All registered services, including the ones of the parent"""
+
+        for key in self.types():
+            yield from self.providers(key).values()
+
+    def find(self, candidates: Iterable[type], name: str = None) -> ServiceSpec | None:
+        """Get the service registered for the first candidate type that has one"""
+
+        for candidate in candidates:
+            if service := self.get(candidate, name):
+                return service
+
+        return None
 
     def __getitem__(self, key: type | tuple[type, str]):
         inner_key, name = _get_key_with_name(key)
 
-        if service := self.services[inner_key].get(name):
+        if service := self.get(inner_key, name):
             return service
 
         raise ServiceNotFoundError(inner_key, name=name)
 
     def __setitem__(self, key: type | tuple[type, str], value: ServiceSpec):
         inner_key, name = _get_key_with_name(key)
-        self.services[inner_key].add(value, name)
+
+        if not (record := self.services.get(inner_key)):
+            record = self.services[inner_key] = ServiceRecord()
+
+        record.add(value, name)
 
     def __contains__(self, key: type | tuple[type, str]):
         inner_key, name = _get_key_with_name(key)
-        return inner_key in self.services and name in self.services[inner_key]
+        return self.get(inner_key, name) is not None
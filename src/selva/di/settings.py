@@ -0,0 +1,12 @@
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ServicesSettings(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    eager: bool = False
+    timeout: Annotated[float | None, Field(gt=0)] = None
+    finalize_timeout: Annotated[float | None, Field(gt=0)] = None
+    shutdown_timeout: Annotated[float | None, Field(gt=0)] = None
@@ -0,0 +1,214 @@
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Annotated, Any, NamedTuple, TypeVar
+
+from pydantic import BaseModel, ConfigDict, Field
+
+__all__ = (
+    "ExecutorSettings",
+    "ExecutorStats",
+    "SyncExecutor",
+    "configure_executor",
+    "get_executor",
+    "inline",
+    "is_inline",
+    "use_executor",
+)
+
+ATTRIBUTE_INLINE = "__selva_inline__"
+
+T = TypeVar("T")
+
+
+def inline(func: T) -> T:
+    """Mark a sync callable to run directly on the event loop
+
+    Intended for cheap functions that do not block, for which running
+    in a thread costs more than the function itself
+    """
+
+    setattr(func, ATTRIBUTE_INLINE, True)
+    return func
+
+
+def is_inline(func: Callable) -> bool:
+    return getattr(func, ATTRIBUTE_INLINE, False)
+
+
+class ExecutorSettings(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    max_workers: Annotated[int | None, Field(ge=1)] = None
+    queue_size: Annotated[int, Field(ge=0)] = 0
+
+
+class ExecutorStats(NamedTuple):
+    max_workers: int
+    queue_size: int
+    running: int
+    pending: int
+    waiting: int
+    completed: int
+
+    @property
+    def saturated(self) -> bool:
+        """Whether all workers are busy"""
+        return self.running >= self.max_workers
+
+
+class SyncExecutor:
+    """Thread pool that runs the sync callables called by the framework
+
+    :param max_workers: number of worker threads
+    :param queue_size: number of calls that can wait for a free worker before
+        callers are held back, 0 means no limit
+    """
+
+    def __init__(self, max_workers: int = None, queue_size: int = 0):
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.queue_size = queue_size
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._limit: tuple[asyncio.AbstractEventLoop, asyncio.Semaphore] | None = None
+
+        self._submitted = 0
+        self._running = 0
+        self._waiting = 0
+        self._completed = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if not self._executor:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="selva",
+            )
+
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore | None:
+        if not self.queue_size:
+            return None
+
+        loop = asyncio.get_running_loop()
+        if not self._limit or self._limit[0] is not loop:
+            semaphore = asyncio.Semaphore(self.max_workers + self.queue_size)
+            self._limit = (loop, semaphore)
+
+        return self._limit[1]
+
+    def _call(self, func: Callable, /, *args, **kwargs):
+        with self._lock:
+            self._running += 1
+
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+
+    async def run(self, func: Callable, /, *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+
+        # run in a copy of the caller context, as asyncio.to_thread does
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, self._call, func, *args, **kwargs)
+
+        if not (semaphore := self._get_semaphore()):
+            return await self._submit(loop, call)
+
+        if semaphore.locked():
+            self._waiting += 1
+            try:
+                await semaphore.acquire()
+            finally:
+                self._waiting -= 1
+        else:
+            await semaphore.acquire()
+
+        try:
+            return await self._submit(loop, call)
+        finally:
+            semaphore.release()
+
+    async def _submit(self, loop: asyncio.AbstractEventLoop, call: Callable) -> Any:
+        self._submitted += 1
+        try:
+            return await loop.run_in_executor(self._get_executor(), call)
+        finally:
+            self._submitted -= 1
+
+    def stats(self) -> ExecutorStats:
+        with self._lock:
+            running = self._running
+            completed = self._completed
+
+        return ExecutorStats(
+            max_workers=self.max_workers,
+            queue_size=self.queue_size,
+            running=running,
+            pending=max(self._submitted - running, 0),
+            waiting=self._waiting,
+            completed=completed,
+        )
+
+    def shutdown(self, wait: bool = True):
+        if executor := self._executor:
+            self._executor = None
+            executor.shutdown(wait=wait)
+
+
+_executor = SyncExecutor()
+
+# executor of the application handling the current call
+_current_executor: contextvars.ContextVar[SyncExecutor | None] = contextvars.ContextVar(
+    "selva_executor", default=None
+)
+
+
+def get_executor() -> SyncExecutor:
+    """Get the executor of the current application, or the default executor"""
+
+    if (executor := _current_executor.get()) is not None:
+        return executor
+
+    return _executor
+
+
+@contextmanager
+def use_executor(executor: SyncExecutor) -> Iterator[SyncExecutor]:
+    """Run sync callables in the given executor within the current context
+
+    Applications use it for the calls they handle, so each application runs
+    sync callables in its own executor
+    """
+
+    token = _current_executor.set(executor)
+    try:
+        yield executor
+    finally:
+        _current_executor.reset(token)
+
+
+def configure_executor(max_workers: int = None, queue_size: int = 0) -> SyncExecutor:
+    """Replace the default executor used to run sync callables
+
+    Applications use their own executor, configured from their settings, so
+    this only affects sync callables run outside of an application. The
+    previous executor is shut down without waiting for its running calls
+    """
+
+    global _executor  # pylint: disable=global-statement
+
+    previous = _executor
+    _executor = SyncExecutor(max_workers, queue_size)
+    previous.shutdown(wait=False)
+
+    return _executor
@@ -7,11 +7,13 @@ from jinja2 import Environment, FileSystemLoader
 from selva.configuration import Settings
 from selva.di import Inject, service
 from selva.ext.templates.jinja.settings import JinjaTemplateSettings
+from selva.web.routing.router import Router
 
 
 @service
 class JinjaTemplate:
     settings: Annotated[Settings, Inject]
+    router: Annotated[Router, Inject] = None
     environment: Environment
 
     def initialize(self):
@@ -28,6 +30,9 @@ class JinjaTemplate:
 
         self.environment = Environment(enable_async=True, **kwargs)
 
+        if self.router:
+            self.environment.globals["url_for"] = self.router.url_for
+
     # pylint: disable=too-many-arguments
     async def respond(
         self,
@@ -6,13 +6,16 @@ from mako.lookup import TemplateLookup
 from selva.configuration import Settings
 from selva.di import Inject, service
 from selva.ext.templates.mako.settings import MakoTemplateSettings
+from selva.web.routing.router import Router
 
 
 @service
 class MakoTemplate:
     settings: Annotated[Settings, Inject]
+    router: Annotated[Router, Inject] = None
 
     lookup: TemplateLookup = None
+    globals: dict = None
 
     def initialize(self):
         mako_settings = MakoTemplateSettings.model_validate(
@@ -22,6 +25,10 @@ class MakoTemplate:
         kwargs = mako_settings.model_dump(exclude_none=True)
         self.lookup = TemplateLookup(**kwargs)
 
+        self.globals = {}
+        if self.router:
+            self.globals["url_for"] = self.router.url_for
+
     # pylint: disable=too-many-arguments
     async def respond(
         self,
@@ -37,12 +44,12 @@ class MakoTemplate:
             response.content_type = "text/html"
 
         template = self.lookup.get_template(template_name)
-        rendered = template.render(**context)
+        rendered = template.render(**(self.globals | context))
         await respond_text(response, rendered)
 
     async def render(self, template_name: str, context: dict) -> str:
         template = self.lookup.get_template(template_name)
-        return template.render(**context)
+        return template.render(**(self.globals | context))
 
     async def render_str(self, source: str, context: dict) -> str:
         template_hash = str(hash(source))
@@ -50,4 +57,4 @@ class MakoTemplate:
             self.lookup.put_string(template_hash, source)
 
         template = self.lookup.get_template(template_hash)
-        return template.render(**context)
+        return template.render(**(self.globals | context))
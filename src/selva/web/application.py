@@ -1,6 +1,7 @@
 import asyncio
 import traceback
-from http import HTTPStatus
+from collections.abc import Callable
+from http import HTTPMethod, HTTPStatus
 
 import structlog
 from asgikit.errors.websocket import WebSocketDisconnectError, WebSocketError
@@ -10,16 +11,27 @@ from asgikit.websockets import WebSocket
 
 from selva._util.import_item import import_item
 from selva._util.maybe_async import maybe_async
+from selva._util.package_scan import PackageIndex
 from selva.configuration.settings import Settings, get_settings
 from selva.di.call import call_with_dependencies
 from selva.di.container import Container
+from selva.di.settings import ServicesSettings
+from selva.executor import ExecutorSettings, SyncExecutor, use_executor
 from selva.ext.error import ExtensionMissingInitFunctionError, ExtensionNotFoundError
-from selva.web.exception import HTTPException, HTTPNotFoundException, WebSocketException
+from selva.web.exception import (
+    HTTPException,
+    HTTPMethodNotAllowedException,
+    HTTPNotFoundException,
+    WebSocketException,
+)
 from selva.web.exception_handler.discover import find_exception_handlers
-from selva.web.handler.call import call_handler
+from selva.web.handler.call import CallPlan, build_call_plan
+from selva.web.handler.settings import HandlerSettings
 from selva.web.lifecycle.discover import find_background_services, find_startup_hooks
 from selva.web.middleware.exception_handler import exception_handler_middleware
+from selva.web.routing.cache import RouteCache
 from selva.web.routing.router import Router
+from selva.web.routing.settings import RoutingSettings
 
 logger = structlog.get_logger()
 
@@ -34,6 +46,34 @@ def _init_settings(settings: Settings | None) -> Settings:
     return settings
 
 
+def _init_router(routing_settings: RoutingSettings) -> Router:
+    if cache_size := routing_settings.cache.size:
+        cache = RouteCache(cache_size, negative=routing_settings.cache.negative)
+    else:
+        cache = None
+
+    return Router(cache=cache)
+
+
+def _skip_response_body(send):
+    """Wrap `send` to drop the response body, used to answer HEAD requests"""
+
+    async def inner(message):
+        if message["type"] in (
+            "http.response.body",
+            "http.response.pathsend",
+            "http.response.zerocopysend",
+        ):
+            if message.get("more_body", False):
+                return
+
+            message = {"type": "http.response.body", "body": b"", "more_body": False}
+
+        await send(message)
+
+    return inner
+
+
 class Selva:
     """Entrypoint class for a Selva Application
 
@@ -49,31 +89,65 @@ class Selva:
 
         self.di.define(Settings, self.settings)
 
-        self.router = Router()
+        routing_settings = RoutingSettings.model_validate(
+            self.settings.get("routing", {})
+        )
+
+        self.router = _init_router(routing_settings)
         self.di.define(Router, self.router)
 
         self.handler = self._request_handler
-        self.exception_handlers = find_exception_handlers(self.settings.application)
+        self.call_plans: dict[Callable, CallPlan] = {}
+        self.handler_settings = HandlerSettings.model_validate(
+            self.settings.get("handlers", {})
+        )
+
+        self.services_settings = ServicesSettings.model_validate(
+            self.settings.get("services", {})
+        )
+
+        executor_settings = ExecutorSettings.model_validate(
+            self.settings.get("executor", {})
+        )
+        # each application has its own executor, so applications in the same
+        # process do not replace or shut down the executor of one another
+        self.executor = SyncExecutor(
+            executor_settings.max_workers, executor_settings.queue_size
+        )
+        # the application package is imported and inspected only once
+        self.index = PackageIndex(self.settings.application)
+        self.di.define(PackageIndex, self.index)
+
+        self.exception_handlers = find_exception_handlers(self.index)
 
-        self.startup = find_startup_hooks(self.settings.application)
-        self.background_services = find_background_services(self.settings.application)
+        self.startup = find_startup_hooks(self.index)
+        self.background_services = find_background_services(self.index)
         self._background_services: set[asyncio.Task] = set()
 
         self.di.scan(
-            self.settings.application,
+            self.index,
             "selva.web.converter",
             "selva.web.middleware",
         )
-        self.router.scan(self.settings.application)
+
+        # handlers scanned into a mount are skipped when scanning the application
+        for prefix, module in routing_settings.mounts.items():
+            if self.index.covers(module):
+                module = self.index.subpackage(module)
+            self.router.scan(module, prefix=prefix)
+
+        self.router.scan(self.index)
 
     async def __call__(self, scope, receive, send):
-        match scope["type"]:
-            case "http" | "websocket":
-                await self._handle_request(scope, receive, send)
-            case "lifespan":
-                await self._handle_lifespan(scope, receive, send)
-            case _:
-                raise RuntimeError(f"unknown scope '{scope['type']}'")
+        with use_executor(self.executor):
+            match scope["type"]:
+                case "http" | "websocket":
+                    async with self.di.request_scope():
+                        await self._handle_request(scope, receive, send)
+                case "lifespan":
+                    await self._handle_lifespan(scope, receive, send)
+                case _:
+                    raise RuntimeError(f"unknown scope '{scope['type']}'")
 
     async def _initialize_extensions(self):
         for extension_name in self.settings.extensions:
@@ -104,9 +178,37 @@ class Selva:
                 factory, self.handler, self.settings, self.di
             )
 
+    async def _build_call_plan(self, action: Callable) -> CallPlan:
+        plan = await build_call_plan(
+            self.di,
+            action,
+            skip=1,
+            concurrent=self.handler_settings.concurrent_params,
+        )
+
+        self.call_plans[action] = plan
+        return plan
+
+    async def _initialize_call_plans(self):
+        for route in self.router.all_routes():
+            if route.action not in self.call_plans:
+                await self._build_call_plan(route.action)
+
     async def _lifespan_startup(self):
         await self._initialize_extensions()
+        self.di.compile()
+
+        if self.services_settings.eager:
+            timings = await self.di.initialize_singletons(
+                timeout=self.services_settings.timeout
+            )
+            logger.info(
+                "services initialized",
+                count=len(timings),
+                seconds=round(sum(timings.values()), 6),
+            )
         await self._initialize_middleware()
+        await self._initialize_call_plans()
 
         for hook in self.startup:
             await call_with_dependencies(self.di, hook)
@@ -127,7 +229,17 @@ class Selva:
             if not task.done():
                 task.cancel()
 
-        await self.di.run_finalizers()
+        timings = await self.di.run_finalizers(
+            timeout=self.services_settings.finalize_timeout,
+            total_timeout=self.services_settings.shutdown_timeout,
+        )
+        logger.info(
+            "services finalized",
+            count=len(timings),
+            seconds=round(sum(timings.values()), 6),
+        )
+
+        await asyncio.to_thread(self.executor.shutdown)
 
     async def _handle_lifespan(self, _scope, receive, send):
         while True:
@@ -187,6 +299,9 @@ class Selva:
                 logger.error("response is finished")
                 return
 
+            for name, value in err.headers.items():
+                response.header(name, value)
+
             if stack_trace:
                 response.status = err.status
                 await respond_text(response, stack_trace)
@@ -212,13 +327,31 @@ class Selva:
         match = self.router.match(request.method, path)
 
         if not match:
+            if request.is_http and (allowed := self.router.allowed_methods(path)):
+                allow = ", ".join(allowed)
+
+                if request.method is HTTPMethod.OPTIONS:
+                    request.response.header("allow", allow)
+                    await respond_status(request.response, HTTPStatus.NO_CONTENT)
+                    return
+
+                raise HTTPMethodNotAllowedException(headers={"allow": allow})
+
             raise HTTPNotFoundException()
 
+        if match.method is not match.route.method:
+            # HEAD request served by GET handler
+            request = Request(scope, receive, _skip_response_body(send))
+
         action = match.route.action
         path_params = match.params
         request["path_params"] = path_params
 
-        await call_handler(self.di, action, request, skip=1)
+        if not (plan := self.call_plans.get(action)):
+            # plans are built on startup, unless the lifespan is not run
+            plan = await self._build_call_plan(action)
+
+        await plan(action, request)
 
         response = request.response
 
@@ -1,9 +1,9 @@
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Callable
 from typing import Any, Protocol, TypeVar, runtime_checkable
 
 from asgikit.requests import Request
 
-__all__ = ("FromRequest",)
+__all__ = ("FromRequest", "PrepareFromRequest")
 
 T = TypeVar("T")
 
@@ -32,3 +32,26 @@ class FromRequest(Protocol[T]):
         :param metadata: Any metadata associated with the type
         :param optional: Whether the parameter is optional
         """
+
+
+@runtime_checkable
+class PrepareFromRequest(Protocol[T]):
+    """`FromRequest` services that can resolve their dependencies ahead of time
+
+    Handler call plans use `prepare` when building the plan for a handler, so
+    extracting the parameter from a request does not need to look up services.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def prepare(
+        self,
+        original_type: type[T],
+        parameter_name: str,
+        metadata: Any,
+        optional: bool,
+    ) -> Awaitable[Callable[[Request], T | Awaitable[T]]]:
+        """Create a function that extracts the parameter value from the request
+
+        Receives the same parameters as `FromRequest.from_request`, except for
+        the request itself
+        """
@@ -1,11 +1,11 @@
 import inspect
 from abc import ABC
+from collections.abc import Awaitable, Callable
 from http import HTTPMethod
-from typing import Annotated, Any, TypeVar, get_args, get_origin
+from typing import Annotated, Any, TypeVar
 
 from asgikit.requests import Body, Request
 
-from selva._util.base_types import get_base_types
 from selva._util.maybe_async import maybe_async
 from selva.di.container import Container
 from selva.di.error import ServiceNotFoundError
@@ -37,29 +37,35 @@ class BodyFromRequest(FromBody):
         request: Request,
         original_type: type,
         parameter_name: str,
+        metadata,
+        optional: bool,
+    ) -> Any:
+        extract = await self.prepare(original_type, parameter_name, metadata, optional)
+        return await extract(request)
+
+    async def prepare(
+        self,
+        original_type: type,
+        parameter_name: str,
         _metadata,
         _optional: bool,
-    ) -> Any:
-        if request.method not in (HTTPMethod.POST, HTTPMethod.PUT, HTTPMethod.PATCH):
-            raise FromBodyOnWrongHttpMethodError(parameter_name)
-
-        if (origin := get_origin(original_type)) is list:
-            search_type = get_args(original_type)[0]
-            search_types = [
-                origin[base_type] for base_type in get_base_types(search_type)
-            ]
-        elif original_type is dict:
-            search_types = [dict]
-        else:
-            search_types = get_base_types(original_type)
-
-        for base_type in search_types:
-            if converter := await self.di.get(
-                Converter[Body, base_type], optional=True
+    ) -> Callable[[Request], Awaitable[Any]]:
+        converter = await self.di.find(Converter[Body, original_type])
+
+        async def extract(request: Request) -> Any:
+            if request.method not in (
+                HTTPMethod.POST,
+                HTTPMethod.PUT,
+                HTTPMethod.PATCH,
             ):
-                return await maybe_async(converter.convert(request.body, original_type))
+                raise FromBodyOnWrongHttpMethodError(parameter_name)
+
+            if not converter:
+                raise MissingConverterImplError(original_type)
+
+            return await maybe_async(converter.convert(request.body, original_type))
 
-        raise MissingConverterImplError(original_type)
+        return extract
 
 
 T_EXTRACTOR = TypeVar("T_EXTRACTOR")
@@ -78,6 +84,16 @@ class RequestParamFromRequest(ABC):
         metadata: T_EXTRACTOR | type[T_EXTRACTOR],
         optional: bool,
     ):
+        extract = await self.prepare(original_type, parameter_name, metadata, optional)
+        return extract(request)
+
+    async def prepare(
+        self,
+        original_type: type,
+        parameter_name: str,
+        metadata: T_EXTRACTOR | type[T_EXTRACTOR],
+        optional: bool,
+    ) -> Callable[[Request], Any]:
         parameter_type = metadata if inspect.isclass(metadata) else type(metadata)
         try:
             extractor = await self.di.get(ParamExtractor[parameter_type])
@@ -85,15 +101,26 @@ class RequestParamFromRequest(ABC):
             # pylint: disable=raise-missing-from
             raise MissingRequestParamExtractorImplError(parameter_type)
 
-        converter = await self.di.get(Converter[str, original_type])
+        converter = await self.di.get(Converter[str, original_type], optional=True)
+
+        def extract(request: Request) -> Any:
+            data = extractor.extract(request, parameter_name, metadata)
+
+            if data is not None and not isinstance(data, str):
+                # path parameter converted when matching the route
+                return data
+
+            if data:
+                if not converter:
+                    raise MissingConverterImplError(original_type)
+                return converter.convert(data, original_type)
 
-        if data := extractor.extract(request, parameter_name, metadata):
-            return converter.convert(data, original_type)
+            if optional:
+                return None
 
-        if optional:
-            return None
+            raise HTTPBadRequestException()
 
-        raise HTTPBadRequestException()
+        return extract
 
 
 @register_from_request(FromPath)
@@ -1,3 +1,5 @@
+from typing import Any
+
 from asgikit.requests import Request
 
 from selva.web.converter.decorator import register_param_extractor
@@ -24,14 +26,14 @@ class FromPathExtractor:
         request: Request,
         parameter_name: str,
         metadata: FromPath | type[FromPath],
-    ) -> str:
+    ) -> Any:
         if isinstance(metadata, FromPath):
             name = metadata.name or parameter_name
         else:
             name = parameter_name
 
         param = request["path_params"].get(name)
-        if not param:
+        if param is None:
             raise PathParamNotFoundError(name)
 
         return param
@@ -30,6 +30,10 @@ class HTTPNotFoundException(HTTPException):
     status = HTTPStatus.NOT_FOUND
 
 
+class HTTPMethodNotAllowedException(HTTPException):
+    status = HTTPStatus.METHOD_NOT_ALLOWED
+
+
 class HTTPUnauthorizedException(HTTPException):
     status = HTTPStatus.UNAUTHORIZED
 
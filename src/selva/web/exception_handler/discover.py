@@ -16,7 +16,9 @@ def _is_exception_handler(arg) -> bool:
 def find_exception_handlers(*args) -> dict[type[Exception], ExceptionHandlerType]:
     result = {}
 
-    for item in scan_packages(*args, predicate=_is_exception_handler):
+    for item in scan_packages(
+        *args, predicate=_is_exception_handler, attribute=ATTRIBUTE_EXCEPTION_HANDLER
+    ):
         exc_handler_info = getattr(item, ATTRIBUTE_EXCEPTION_HANDLER)
         exc_type = exc_handler_info.exception_class
         if exc_type in result:
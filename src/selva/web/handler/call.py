@@ -1,68 +1,214 @@
+import asyncio
 import functools
 import inspect
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from asgikit.requests import Request
 
 from selva._util.maybe_async import maybe_async
-from selva.di.container import Container
+from selva.di.container import MISSING, Container
+from selva.di.scope import Scope
 from selva.web.converter.error import MissingFromRequestImplError
-from selva.web.converter.from_request import FromRequest
+from selva.web.converter.from_request import FromRequest, PrepareFromRequest
+from selva.web.handler.model import ServiceParam
 from selva.web.handler.parse import parse_handler_params
 
+__all__ = ("CallPlan", "build_call_plan", "call_handler")
 
-async def call_handler(
-    di: Container, handler: Callable, request: Request, *, skip: int
-):
-    actual_handler = handler
-    while isinstance(actual_handler, functools.partial):
-        actual_handler = actual_handler.func
-
-    handler_params = parse_handler_params(actual_handler, skip=skip)
-    request_params = await params_from_request(di, request, handler_params.request)
-
-    request_services = {
-        name: await di.get(service_type, name=service_name, optional=has_default)
-        for name, (
-            service_type,
-            service_name,
-            has_default,
-        ) in handler_params.service
-    }
+Extractor = Callable[[Request], Any]
 
-    await handler(request, **(request_params | request_services))
 
+class CallPlan:
+    """Services and parameter extractors of a handler, resolved ahead of time
 
-async def params_from_request(
-    di: Container,
-    request: Request,
-    params: list[tuple[str, Any, bool]],
-) -> dict[str, Any]:
-    result = {}
-
-    for name, (param_type, param_annotation, has_default) in params:
-        if param_annotation:
-            if inspect.isclass(param_annotation):
-                converter_type = param_annotation
-            else:
-                converter_type = type(param_annotation)
+    Calling the plan only extracts the request parameters, since the singleton
+    services required by the handler are resolved when the plan is built.
+    Request scoped and transient services are resolved on each call.
+
+    When `concurrent` is set, parameters extracted by async `FromRequest`
+    implementations are awaited concurrently. If one of them fails, the others
+    are cancelled and the error is raised.
+    """
+
+    __slots__ = ("di", "extractors", "services", "scoped_services", "concurrent")
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        di: Container,
+        extractors: list[tuple[str, Extractor]],
+        services: dict,
+        scoped_services: list[tuple[str, ServiceParam]] = None,
+        *,
+        concurrent: bool = False,
+    ):
+        self.di = di
+        self.extractors = extractors
+        self.services = services
+        self.scoped_services = scoped_services or []
+        self.concurrent = concurrent and len(extractors) > 1
+
+    async def __call__(self, handler: Callable, request: Request):
+        if self.concurrent:
+            params = await self._extract_concurrently(request)
         else:
-            converter_type = param_type
-
-        if from_request_service := await di.get(FromRequest[converter_type]):
-            value = await maybe_async(
-                from_request_service.from_request,
-                request,
-                param_type,
-                name,
-                param_annotation,
-                has_default,
+            params = await self._extract(request)
+
+        if self.scoped_services:
+            params |= await self._get_scoped_services()
+
+        await handler(request, **params, **self.services)
+
+    async def _get_scoped_services(self) -> dict[str, Any]:
+        services = {}
+
+        for name, (service_type, service_name, optional) in self.scoped_services:
+            # request scoped services may have been created earlier in the request
+            service = self.di.get_cached(
+                service_type, name=service_name, default=MISSING
+            )
+            if service is MISSING:
+                service = await self.di.get(
+                    service_type, name=service_name, optional=optional
+                )
+
+            services[name] = service
+
+        return services
+
+    async def _extract(self, request: Request) -> dict[str, Any]:
+        params = {}
+
+        for name, extract in self.extractors:
+            value = extract(request)
+            if inspect.isawaitable(value):
+                value = await value
+
+            if value is not None:
+                params[name] = value
+
+        return params
+
+    async def _extract_concurrently(self, request: Request) -> dict[str, Any]:
+        params = {}
+        pending = {}
+
+        try:
+            for name, extract in self.extractors:
+                value = extract(request)
+                if inspect.isawaitable(value):
+                    pending[name] = value
+                elif value is not None:
+                    params[name] = value
+        except Exception:
+            for value in pending.values():
+                if inspect.iscoroutine(value):
+                    value.close()
+            raise
+
+        if len(pending) == 1:
+            [(name, value)] = pending.items()
+            if (value := await value) is not None:
+                params[name] = value
+            return params
+
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                tasks = {
+                    name: task_group.create_task(
+                        value if inspect.iscoroutine(value) else _await(value)
+                    )
+                    for name, value in pending.items()
+                }
+        except ExceptionGroup as err:
+            raise err.exceptions[0]  # pylint: disable=raise-missing-from
+
+        for name, task in tasks.items():
+            if (value := task.result()) is not None:
+                params[name] = value
+
+        return params
+
+
+async def _await(awaitable: Awaitable) -> Any:
+    return await awaitable
+
+
+async def build_call_plan(
+    di: Container, handler: Callable, *, skip: int, concurrent: bool = False
+) -> CallPlan:
+    """Resolve the services and parameter extractors required by the handler
+
+    :param concurrent: whether to extract async parameters concurrently
+
+    :raises MissingFromRequestImplError: if a parameter has no `FromRequest`
+    """
+
+    while isinstance(handler, functools.partial):
+        handler = handler.func
+
+    handler_params = parse_handler_params(handler, skip=skip)
+
+    extractors = [
+        (name, await _build_extractor(di, name, *param))
+        for name, param in handler_params.request
+    ]
+
+    services = {}
+    scoped_services = []
+
+    for name, param in handler_params.service:
+        service_type, service_name, has_default = param
+        if di.scope_of(service_type, service_name) in (None, Scope.SINGLETON):
+            services[name] = await di.get(
+                service_type, name=service_name, optional=has_default
             )
+        else:
+            scoped_services.append((name, param))
 
-            if value:
-                result[name] = value
+    return CallPlan(di, extractors, services, scoped_services, concurrent=concurrent)
+
+
+async def _build_extractor(
+    di: Container,
+    name: str,
+    param_type: type,
+    param_annotation: Any,
+    has_default: bool,
+) -> Extractor:
+    if param_annotation:
+        if inspect.isclass(param_annotation):
+            converter_type = param_annotation
         else:
-            raise MissingFromRequestImplError(param_type)
+            converter_type = type(param_annotation)
+    else:
+        converter_type = param_type
+
+    from_request_service = await di.get(FromRequest[converter_type], optional=True)
+    if not from_request_service:
+        raise MissingFromRequestImplError(param_type)
+
+    if isinstance(from_request_service, PrepareFromRequest):
+        return await from_request_service.prepare(
+            param_type, name, param_annotation, has_default
+        )
+
+    def extract(request: Request):
+        return maybe_async(
+            from_request_service.from_request,
+            request,
+            param_type,
+            name,
+            param_annotation,
+            has_default,
+        )
+
+    return extract
+
 
-    return result
+async def call_handler(
+    di: Container, handler: Callable, request: Request, *, skip: int
+):
+    plan = await build_call_plan(di, handler, skip=skip)
+    await plan(handler, request)
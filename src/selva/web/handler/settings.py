@@ -0,0 +1,7 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class HandlerSettings(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    concurrent_params: bool = False
@@ -11,8 +11,18 @@ def _predicate_background_services(item) -> bool:
 
 
 def find_startup_hooks(*args):
-    return list(scan_packages(*args, predicate=_predicate_startup_hooks))
+    return list(
+        scan_packages(
+            *args, predicate=_predicate_startup_hooks, attribute=ATTRIBUTE_STARTUP
+        )
+    )
 
 
 def find_background_services(*args):
-    return list(scan_packages(*args, predicate=_predicate_background_services))
+    return list(
+        scan_packages(
+            *args,
+            predicate=_predicate_background_services,
+            attribute=ATTRIBUTE_BACKGROUND,
+        )
+    )
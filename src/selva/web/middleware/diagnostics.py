@@ -0,0 +1,33 @@
+from asgikit.requests import Request
+from asgikit.responses import respond_json, respond_text
+
+from selva.configuration.settings import Settings
+from selva.di.container import Container
+from selva.di.diagnostics import dependency_graph, dependency_graph_dot
+
+
+async def services_graph_middleware(app, settings: Settings, di: Container):
+    """Serve the dependency graph of the services for diagnostics
+
+    The graph is served as json, or in the graphviz dot format when requested
+    with the `format=dot` query parameter. It exposes the internals of the
+    application, so it should not be enabled in production.
+    """
+
+    path = "/" + settings.diagnostics.path.strip("/")
+
+    async def handler(scope, receive, send):
+        if scope["type"] != "http" or scope["path"].rstrip("/") != path:
+            await app(scope, receive, send)
+            return
+
+        request = Request(scope, receive, send)
+        graph = dependency_graph(di)
+
+        if request.query.get("format") == "dot":
+            request.response.content_type = "text/vnd.graphviz"
+            await respond_text(request.response, dependency_graph_dot(graph))
+        else:
+            await respond_json(request.response, graph)
+
+    return handler
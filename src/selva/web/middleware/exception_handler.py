@@ -1,53 +1,82 @@
 import functools
-from functools import cache
 
 import structlog
 from asgikit.requests import Request
 
 from selva._util.base_types import get_base_types
+from selva._util.package_scan import PackageIndex
 from selva.configuration.settings import Settings
 from selva.di.container import Container
 from selva.web.exception_handler.decorator import ExceptionHandlerType
 from selva.web.exception_handler.discover import find_exception_handlers
-from selva.web.handler.call import call_handler
+from selva.web.handler.call import CallPlan, build_call_plan
 
 logger = structlog.get_logger()
 
 
-def exception_handler_middleware(app, settings: Settings, di: Container):
-    exception_handlers = find_exception_handlers(settings.application)
-    return ExceptionHandlerMiddleware(app, di, exception_handlers)
+async def exception_handler_middleware(app, settings: Settings, di: Container):
+    # reuse the application index instead of scanning the application again
+    index = await di.get(PackageIndex, optional=True)
+    exception_handlers = find_exception_handlers(index or settings.application)
+
+    call_plans = {
+        handler: await build_call_plan(di, handler, skip=2)
+        for handler in exception_handlers.values()
+    }
+
+    return ExceptionHandlerMiddleware(app, di, exception_handlers, call_plans)
 
 
 class ExceptionHandlerMiddleware:
-    def __init__(self, app, di: Container, exception_handlers):
+    def __init__(
+        self,
+        app,
+        di: Container,
+        exception_handlers: dict[type[BaseException], ExceptionHandlerType],
+        call_plans: dict[ExceptionHandlerType, CallPlan] = None,
+    ):
         self.app = app
         self.di = di
         self.exception_handlers = exception_handlers
+        self.call_plans = call_plans if call_plans is not None else {}
+
+        # exception types resolved to their handler, including types without one
+        self.dispatch: dict[type[BaseException], ExceptionHandlerType | None] = dict(
+            exception_handlers
+        )
 
     async def __call__(self, scope, receive, send):
         try:
             await self.app(scope, receive, send)
         except Exception as err:
-            if handler := self._get_exception_handler(err):
+            if handler := self._get_exception_handler(type(err)):
                 logger.debug(
                     "Handling exception with handler",
                     module=handler.__module__,
                     handler=handler.__qualname__,
                 )
 
+                if not (plan := self.call_plans.get(handler)):
+                    plan = await build_call_plan(self.di, handler, skip=2)
+                    self.call_plans[handler] = plan
+
                 request = Request(scope, receive, send)
-                await call_handler(
-                    self.di, functools.partial(handler, err), request, skip=2
-                )
+                await plan(functools.partial(handler, err), request)
             else:
                 raise
 
-    @cache
-    def _get_exception_handler(self, err: BaseException) -> ExceptionHandlerType | None:
-        err_type = type(err)
+    def _get_exception_handler(
+        self, err_type: type[BaseException]
+    ) -> ExceptionHandlerType | None:
+        try:
+            return self.dispatch[err_type]
+        except KeyError:
+            pass
+
+        handler = None
         for base in get_base_types(err_type):
             if handler := self.exception_handlers.get(base):
-                return handler
+                break
 
-        return None
+        self.dispatch[err_type] = handler
+        return handler
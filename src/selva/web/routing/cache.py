@@ -0,0 +1,115 @@
+from collections import OrderedDict
+from http import HTTPMethod
+from typing import NamedTuple
+
+from selva.web.routing.route import RouteMatch
+
+__all__ = ("RouteCache", "RouteCacheInfo", "MISSING")
+
+MISSING = object()
+
+
+class RouteCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class RouteCache:
+    """Least recently used cache of route match results
+
+    Matches are copied when stored and when returned, so changes to the params
+    of a request do not affect the cache.
+
+    When `negative` is set, paths that did not match any route are also cached,
+    so repeated requests to unknown paths skip the route matching.
+
+    The methods allowed for the paths of unmatched requests are cached
+    separately, with the same size limit.
+    """
+
+    def __init__(self, maxsize: int, *, negative: bool = False):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than zero")
+
+        self.maxsize = maxsize
+        self.negative = negative
+        self.hits = 0
+        self.misses = 0
+        self.data: OrderedDict[tuple[HTTPMethod | None, str], RouteMatch | None] = (
+            OrderedDict()
+        )
+        self.allowed: OrderedDict[str, list[HTTPMethod]] = OrderedDict()
+
+    def get(self, method: HTTPMethod | None, path: str) -> RouteMatch | None | object:
+        """Get a cached match result
+
+        :returns: the cached result, which may be None for negative entries,
+                  or `MISSING` if there is no entry for the method and path
+        """
+
+        key = (method, path)
+
+        try:
+            result = self.data[key]
+        except KeyError:
+            self.misses += 1
+            return MISSING
+
+        self.data.move_to_end(key)
+        self.hits += 1
+
+        # the params of the match are given to the request, which may change them
+        if result is not None:
+            return result._replace(params=dict(result.params))
+
+        return result
+
+    def put(self, method: HTTPMethod | None, path: str, match: RouteMatch | None):
+        if match is None and not self.negative:
+            return
+
+        if match is not None:
+            match = match._replace(params=dict(match.params))
+
+        key = (method, path)
+        self.data[key] = match
+        self.data.move_to_end(key)
+
+        if len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+
+    def get_allowed(self, path: str) -> list[HTTPMethod] | object:
+        """Get the cached allowed methods of a path
+
+        :returns: the cached methods, which may be empty for negative entries,
+                  or `MISSING` if there is no entry for the path
+        """
+
+        try:
+            allowed = self.allowed[path]
+        except KeyError:
+            return MISSING
+
+        self.allowed.move_to_end(path)
+        return allowed
+
+    def put_allowed(self, path: str, allowed: list[HTTPMethod]):
+        if not allowed and not self.negative:
+            return
+
+        self.allowed[path] = allowed
+        self.allowed.move_to_end(path)
+
+        if len(self.allowed) > self.maxsize:
+            self.allowed.popitem(last=False)
+
+    def clear(self):
+        self.data.clear()
+        self.allowed.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> RouteCacheInfo:
+        return RouteCacheInfo(self.hits, self.misses, self.maxsize, len(self.data))
@@ -6,6 +6,22 @@ class DuplicateRouteError(Exception):
         super().__init__(f"path for {route1} clashes with {route2}")
 
 
+class RouteNotFoundError(LookupError):
+    def __init__(self, route: str):
+        super().__init__(f"route not found: {route}")
+
+
+class ReverseRouteError(ValueError):
+    def __init__(self, route: str, missing: set[str], unexpected: set[str]):
+        message = f"cannot reverse route {route}:"
+        if missing:
+            message += f" missing parameters ({', '.join(sorted(missing))})"
+        if unexpected:
+            message += f" unexpected parameters ({', '.join(sorted(unexpected))})"
+
+        super().__init__(message)
+
+
 class HandlerWithoutDecoratorError(Exception):
     def __init__(self, handler):
         super().__init__(
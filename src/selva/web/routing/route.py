@@ -1,11 +1,17 @@
 import re
 import typing
+import uuid
 from collections import Counter
+from decimal import Decimal
+from functools import cache, cached_property
 from http import HTTPMethod
 from re import Pattern
-from typing import Callable, NamedTuple
+from typing import Any, Callable, NamedTuple
+from urllib.parse import quote
 
-__all__ = ("Route", "RouteMatch")
+from selva.web.routing.exception import ReverseRouteError
+
+__all__ = ("Route", "RouteMatch", "PathParamType", "build_path_pattern")
 
 RE_PATH_PARAM_SPEC = re.compile(r"([:*])([a-zA-Z\w]+)")
 RE_MULTI_SLASH = re.compile(r"/{2,}")
@@ -16,18 +22,72 @@ PATH_PARAM_PATTERN = {
 }
 
 
-def build_path_regex_and_params(
-    handler: Callable, path: str
-) -> tuple[Pattern, dict[str, type]]:
-    """parse path and build regex for route matching
+class PathParamType(NamedTuple):
+    """Constraint applied to a `:param` when matching the route
 
-    :returns: compiled regex and tuple of mapping param name to type
+    :param pattern: regex that the path segment must match
+    :param convert: function to convert the matched value to the parameter type
+    """
+
+    pattern: str
+    convert: Callable[[str], Any]
+
+
+RE_NUMBER = r"[+-]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)(?:[eE][+-]?[0-9]+)?"
+RE_BOOL = r"(?:[01]|[Tt][Rr][Uu][Ee]|[Ff][Aa][Ll][Ss][Ee])"
+RE_UUID = r"[0-9a-fA-F]{8}(?:-?[0-9a-fA-F]{4}){3}-?[0-9a-fA-F]{12}"
+
+PATH_PARAM_TYPES: dict[type, PathParamType] = {
+    int: PathParamType(r"[+-]?[0-9]+", int),
+    float: PathParamType(RE_NUMBER, float),
+    Decimal: PathParamType(RE_NUMBER, Decimal),
+    bool: PathParamType(RE_BOOL, lambda value: value.lower() in ("1", "true")),
+    uuid.UUID: PathParamType(RE_UUID, uuid.UUID),
+}
+
+
+def get_param_pattern(kind: str, param_type: type) -> str:
+    """get the regex that a path parameter must match
+
+    Only single segment parameters (`:param`) are constrained by their type
+    """
+
+    if kind == ":" and (path_param_type := PATH_PARAM_TYPES.get(param_type)):
+        return path_param_type.pattern
+
+    return PATH_PARAM_PATTERN[kind]
+
+
+def build_path_pattern(path: str) -> str:
+    """normalize path into a pattern that identifies the requests it matches
+
+    Repeated slashes are collapsed and the parameter names are removed, so
+    `users/:id` and `/users/:user_id/` result in the same pattern
+    """
+
+    path = RE_MULTI_SLASH.sub("/", path).strip("/")
+    return RE_PATH_PARAM_SPEC.sub(r"\1", path)
+
+
+@cache
+def get_handler_type_hints(handler: Callable) -> dict[str, type]:
+    """get the type hints of the handler parameters
+
+    The result is cached, so handlers mapped to several paths are inspected once
     """
 
     type_hints = typing.get_type_hints(handler)
     type_hints.pop("return", None)
+    return type_hints
 
-    regex = RE_MULTI_SLASH.sub("/", path)
+
+def build_path_params(handler: Callable, path: str) -> dict[str, type]:
+    """parse path parameters and their types from the handler type hints
+
+    :returns: mapping of param name to type
+    """
+
+    type_hints = get_handler_type_hints(handler)
     path_params = RE_PATH_PARAM_SPEC.findall(path)
 
     # verify that path does not have duplicate parameters
@@ -38,12 +98,16 @@ def build_path_regex_and_params(
             f"path parameters defined more than once: {', '.join(repeated)}"
         )
 
-    param_types = {}
-    for kind, param in path_params:
-        type_hint = type_hints.get(param, str)
-        param_types[param] = type_hint
+    return {param: type_hints.get(param, str) for _kind, param in path_params}
+
 
-        param_regex = f"(?P<{param}>{PATH_PARAM_PATTERN[kind]})"
+def build_path_regex(path: str, param_types: dict[str, type]) -> Pattern:
+    """build regex for route matching"""
+
+    regex = RE_MULTI_SLASH.sub("/", path)
+
+    for kind, param in RE_PATH_PARAM_SPEC.findall(path):
+        param_regex = f"(?P<{param}>{get_param_pattern(kind, param_types[param])})"
         regex = regex.replace(f"{kind}{param}", param_regex)
 
     if not regex.startswith("/"):
@@ -55,7 +119,40 @@ def build_path_regex_and_params(
         regex += "/?"
 
     regex = f"^{regex}$"
-    return re.compile(regex), param_types
+    return re.compile(regex)
+
+
+def build_path_regex_and_params(
+    handler: Callable, path: str
+) -> tuple[Pattern, dict[str, type]]:
+    """parse path and build regex for route matching
+
+    :returns: compiled regex and tuple of mapping param name to type
+    """
+
+    param_types = build_path_params(handler, path)
+    return build_path_regex(path, param_types), param_types
+
+
+def build_reverse_template(path: str) -> list[tuple[str, str | None, str | None]]:
+    """split path into the parts used to build urls for the route
+
+    :returns: list of 3-tuples of literal text preceding a parameter,
+              parameter kind and parameter name. The last item holds the text
+              after the last parameter, with kind and name set to None
+    """
+
+    path = RE_MULTI_SLASH.sub("/", path)
+    template = []
+    last = 0
+
+    for match in RE_PATH_PARAM_SPEC.finditer(path):
+        kind, param = match.groups()
+        template.append((path[last : match.start()], kind, param))
+        last = match.end()
+
+    template.append((path[last:], None, None))
+    return template
 
 
 class Route:
@@ -70,7 +167,30 @@ class Route:
         self.path = path
         self.action = action
         self.name = name
-        self.regex, self.path_params = build_path_regex_and_params(action, path)
+        self.pattern = build_path_pattern(path)
+        self.path_params = build_path_params(action, path)
+        self.reverse_template = build_reverse_template(path)
+
+        param_specs = RE_PATH_PARAM_SPEC.findall(path)
+
+        # regex of each parameter in order, to tell apart routes that have
+        # the same pattern but different parameter types
+        self.param_patterns = tuple(
+            get_param_pattern(kind, self.path_params[param])
+            for kind, param in param_specs
+        )
+
+        self.converters: dict[str, Callable[[str], Any]] = {
+            param: PATH_PARAM_TYPES[param_type].convert
+            for kind, param in param_specs
+            if kind == ":"
+            and (param_type := self.path_params[param]) in PATH_PARAM_TYPES
+        }
+
+    @cached_property
+    def regex(self) -> Pattern:
+        # compiled on first use, since routes are matched by the route tree
+        return build_path_regex(self.path, self.path_params)
 
     def match(self, method: HTTPMethod | None, path: str) -> dict[str, str] | None:
         if method is self.method and (match := self.regex.match(path)):
@@ -78,19 +198,40 @@ class Route:
 
         return None
 
+    def convert_params(self, params: dict[str, str]) -> dict[str, Any]:
+        """convert the values of the typed path parameters in place"""
+
+        for param, convert in self.converters.items():
+            params[param] = convert(params[param])
+
+        return params
+
     def reverse(self, **kwargs) -> str:
-        path = self.path
+        """build the path for the route, replacing the parameters with the values
+
+        Values for `:param` are quoted as a single segment, while values for
+        `*param` may contain slashes
+
+        :raises ReverseRouteError: if parameters are missing or unexpected
+        """
+
+        if kwargs.keys() != self.path_params.keys():
+            missing = self.path_params.keys() - kwargs.keys()
+            unexpected = kwargs.keys() - self.path_params.keys()
+            raise ReverseRouteError(self.name, missing, unexpected)
 
-        for param, value in kwargs.items():
-            if param not in self.path_params:
-                raise ValueError()
-            path = path.replace(f"{{{param}}}", value)
+        result = []
+        for literal, kind, param in self.reverse_template:
+            result.append(literal)
+            if param:
+                safe = "/" if kind == "*" else ""
+                result.append(quote(str(kwargs[param]), safe=safe))
 
-        return path
+        return "".join(result)
 
 
 class RouteMatch(NamedTuple):
     route: Route
     method: HTTPMethod | None
     path: str
-    params: dict[str, str]
+    params: dict[str, Any]
@@ -1,12 +1,12 @@
 import inspect
-from collections import OrderedDict
-from collections.abc import Callable
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Iterator
 from http import HTTPMethod
 
 import structlog
 
 from selva._util.package_scan import scan_packages
-from selva.web.exception import HTTPNotFoundException
+from selva.web.routing.cache import MISSING, RouteCache
 from selva.web.routing.decorator import (
     ATTRIBUTE_HANDLER,
     HandlerInfo,
@@ -16,8 +16,15 @@ from selva.web.routing.decorator import (
 from selva.web.routing.exception import (
     DuplicateRouteError,
     HandlerWithoutDecoratorError,
+    RouteNotFoundError,
 )
-from selva.web.routing.route import Route, RouteMatch
+from selva.web.routing.route import (
+    RE_MULTI_SLASH,
+    RE_PATH_PARAM_SPEC,
+    Route,
+    RouteMatch,
+)
+from selva.web.routing.tree import RouteTree, normalize_path
 
 logger = structlog.get_logger()
 
@@ -29,21 +36,141 @@ def _is_handler(arg) -> bool:
 
 
 class Router:
-    def __init__(self):
+    def __init__(self, *, cache: RouteCache = None):
+        self.cache = cache
         self.routes: OrderedDict[str, Route] = OrderedDict()
 
-    def scan(self, *args):
-        for item in scan_packages(*args, predicate=_is_handler):
-            self.route(item)
+        # routes partitioned by http method, or None for websocket
+        self.method_routes: dict[HTTPMethod | None, list[Route]] = defaultdict(list)
+
+        # routes without path parameters, indexed by their normalized path
+        self.static_routes: dict[HTTPMethod | None, dict[str, Route]] = defaultdict(
+            dict
+        )
+
+        # routes with path parameters
+        self.trees: dict[HTTPMethod | None, RouteTree] = defaultdict(RouteTree)
+
+        # routes indexed by method, pattern and parameter types, to detect duplicates
+        self.route_keys: dict[
+            tuple[HTTPMethod | None, str, tuple[str, ...]], Route
+        ] = {}
+
+        # one http route for each pattern and parameter types, to find the
+        # methods allowed for a path by matching it once
+        self.method_index = RouteTree()
+        self.pattern_methods: dict[tuple[str, tuple[str, ...]], set[HTTPMethod]] = (
+            defaultdict(set)
+        )
+
+        # mounted routers indexed by the first segment of their prefix, with
+        # the longest prefixes first
+        self.mounts: dict[str, dict[str, Router]] = defaultdict(dict)
+
+        # handlers registered in mounted routers, which are skipped when
+        # scanning into this router
+        self.mounted_handlers: set[Callable] = set()
+
+    def scan(self, *args, prefix: str = None):
+        """Register the handlers found in the given modules
+
+        :param prefix: register the handlers into the router mounted on the prefix,
+                       creating it if it does not exist
+        """
+
+        if prefix:
+            router = self.mount(prefix)
+            for item in scan_packages(*args, predicate=_is_handler):
+                router.route(item)
+                self.mounted_handlers.add(item)
+
+            if self.cache:
+                self.cache.clear()
+        else:
+            for item in scan_packages(*args, predicate=_is_handler):
+                if item not in self.mounted_handlers:
+                    self.route(item)
+
+    def mount(self, prefix: str, router: "Router" = None) -> "Router":
+        """Mount a router on a path prefix
+
+        Requests under the prefix are matched against the routes of the mounted
+        router, with the prefix removed from the path.
+
+        :param prefix: static path prefix, like `api/v1`
+        :param router: router to mount, if not given a new router is created
+        :returns: the router mounted on the prefix
+        """
+
+        prefix = normalize_path(RE_MULTI_SLASH.sub("/", prefix.strip("/")))
+        if not prefix or RE_PATH_PARAM_SPEC.search(prefix):
+            raise ValueError(f"invalid mount prefix: '{prefix}'")
+
+        mounts = self.mounts[prefix.partition("/")[0]]
+
+        if current := mounts.get(prefix):
+            if router and router is not current:
+                raise ValueError(f"a router is already mounted on '{prefix}'")
+            return current
+
+        router = router or Router()
+        mounts[prefix] = router
 
-    def _check_duplicates(self, route):
-        for current_route in self.routes.values():
-            if (
-                current_route.action != route.action
-                and current_route.method == route.method
-                and current_route.regex == route.regex
-            ):
-                raise DuplicateRouteError(route.name, current_route.name)
+        # longer prefixes are tried first, so nested prefixes can be reached
+        self.mounts[prefix.partition("/")[0]] = dict(
+            sorted(mounts.items(), key=lambda item: len(item[0]), reverse=True)
+        )
+
+        if self.cache:
+            self.cache.clear()
+
+        logger.debug("router mounted", prefix=prefix)
+        return router
+
+    def _find_mounts(self, path: str) -> Iterator[tuple["Router", str]]:
+        """Find the routers mounted on a prefix of the path, longest prefix first"""
+
+        if not self.mounts:
+            return
+
+        path = path.removeprefix("/")
+        if not (mounts := self.mounts.get(path.partition("/")[0])):
+            return
+
+        for prefix, router in mounts.items():
+            if path == prefix or path.startswith(prefix + "/"):
+                yield router, path[len(prefix) :]
+
+    def _check_duplicates(self, route: Route):
+        key = (route.method, route.pattern, route.param_patterns)
+
+        current_route = self.route_keys.setdefault(key, route)
+        if current_route.action != route.action:
+            raise DuplicateRouteError(route.name, current_route.name)
+
+    def _add_route(self, route: Route):
+        self._check_duplicates(route)
+
+        self.routes[route.name] = route
+        self.method_routes[route.method].append(route)
+
+        if RE_PATH_PARAM_SPEC.search(route.path):
+            self.trees[route.method].add(route)
+        else:
+            self.static_routes[route.method].setdefault(route.pattern, route)
+
+        if route.method:
+            key = (route.pattern, route.param_patterns)
+            if key not in self.pattern_methods:
+                self.method_index.add(route)
+
+            methods = self.pattern_methods[key]
+            methods.update((route.method, HTTPMethod.OPTIONS))
+            if route.method is HTTPMethod.GET:
+                methods.add(HTTPMethod.HEAD)
+
+        if self.cache:
+            self.cache.clear()
 
     def route(self, handler: Callable):
         handler_info: HandlerInfo = getattr(handler, ATTRIBUTE_HANDLER, None)
@@ -59,9 +186,7 @@ class Router:
                     f"{method.lower()}.{handler.__module__}.{handler.__qualname__}"
                 )
                 route = Route(method, path, handler, route_name)
-                self._check_duplicates(route)
-
-                self.routes[route_name] = route
+                self._add_route(route)
                 logger.debug(
                     "action registered",
                     action=f"{handler.__module__}.{handler.__qualname__}",
@@ -74,9 +199,7 @@ class Router:
                 path = path.strip("/")
                 route_name = f"websocket.{handler.__module__}.{handler.__qualname__}"
                 route = Route(None, path, handler, route_name)
-                self._check_duplicates(route)
-
-                self.routes[route_name] = route
+                self._add_route(route)
                 logger.debug(
                     "websocket registered",
                     action=f"{handler.__module__}.{handler.__qualname__}",
@@ -90,14 +213,132 @@ class Router:
         :param path: path to match against
         """
 
-        for route in self.routes.values():
+        if not self.cache:
+            return self._match(method, path)
+
+        match = self.cache.get(method, path)
+        if match is MISSING:
+            match = self._match(method, path)
+            self.cache.put(method, path, match)
+
+        return match
+
+    def _match(self, method: HTTPMethod | None, path: str) -> RouteMatch | None:
+        for router, sub_path in self._find_mounts(path):
+            if match := router._match(method, sub_path):
+                return RouteMatch(match.route, method, path, match.params)
+
+        if match := self._match_method(method, path):
+            return match
+
+        # serve HEAD requests with the GET handler
+        if method is HTTPMethod.HEAD and (
+            match := self._match_method(HTTPMethod.GET, path)
+        ):
+            return RouteMatch(match.route, method, path, match.params)
+
+        return None
+
+    def _match_method(self, method: HTTPMethod | None, path: str) -> RouteMatch | None:
+        if static_routes := self.static_routes.get(method):
+            if route := static_routes.get(normalize_path(path)):
+                return RouteMatch(route, method, path, {})
+
+        if tree := self.trees.get(method):
+            if result := tree.match(path):
+                route, params = result
+                return RouteMatch(route, method, path, route.convert_params(params))
+
+        return None
+
+    def allowed_methods(self, path: str) -> list[HTTPMethod]:
+        """Get the http methods allowed for a path
+
+        :param path: path to match against
+        :returns: the allowed methods, or an empty list if the path does not
+                  match any route
+        """
+
+        if not self.cache:
+            return self._allowed_methods(path)
+
+        allowed = self.cache.get_allowed(path)
+        if allowed is MISSING:
+            allowed = self._allowed_methods(path)
+            self.cache.put_allowed(path, allowed)
+
+        return allowed
+
+    def _allowed_methods(self, path: str) -> list[HTTPMethod]:
+        for router, sub_path in self._find_mounts(path):
+            if allowed := router._allowed_methods(sub_path):
+                return allowed
+
+        allowed = set()
+        for route in self.method_index.match_all(path):
+            allowed |= self.pattern_methods[route.pattern, route.param_patterns]
+
+        return sorted(allowed)
+
+    def match_regex(self, method: HTTPMethod | None, path: str) -> RouteMatch | None:
+        """Match a path against the routes by testing the regex of each route
+
+        This is the original matching strategy, kept as reference to test the
+        route tree against.
+
+        :param method: HTTP method or None for websocket
+        :param path: path to match against
+        """
+
+        for router, sub_path in self._find_mounts(path):
+            if match := router.match_regex(method, sub_path):
+                return RouteMatch(match.route, method, path, match.params)
+
+        for route in self.method_routes.get(method, []):
             if (match := route.match(method, path)) is not None:
-                return RouteMatch(route, method, path, match)
+                return RouteMatch(route, method, path, route.convert_params(match))
 
         return None
 
-    def reverse(self, name: str, **kwargs) -> str:
+    def all_routes(self) -> Iterator[Route]:
+        """Iterate over the routes of this router and of the mounted routers"""
+
+        yield from self.routes.values()
+
+        for mounts in self.mounts.values():
+            for router in mounts.values():
+                yield from router.all_routes()
+
+    def _find_route(self, name: str) -> tuple[str, Route] | None:
         if route := self.routes.get(name):
-            return route.reverse(**kwargs)
+            return "", route
+
+        for mounts in self.mounts.values():
+            for prefix, router in mounts.items():
+                if found := router._find_route(name):
+                    sub_prefix, route = found
+                    return f"{prefix}/{sub_prefix}", route
+
+        return None
+
+    def reverse(self, name: str, /, **kwargs) -> str:
+        """Build the path of the route with the given name, without leading slash
+
+        :raises RouteNotFoundError: if there is no route with the given name
+        :raises ReverseRouteError: if parameters are missing or unexpected
+        """
+
+        if not (found := self._find_route(name)):
+            raise RouteNotFoundError(name)
+
+        prefix, route = found
+        return f"{prefix}{route.reverse(**kwargs)}".rstrip("/")
+
+    def url_for(self, name: str, /, **params) -> str:
+        """Build the url path of the route with the given name
+
+        :raises RouteNotFoundError: if there is no route with the given name
+        :raises ReverseRouteError: if parameters are missing or unexpected
+        """
 
-        raise HTTPNotFoundException()
+        return "/" + self.reverse(name, **params)
@@ -0,0 +1,17 @@
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class RouteCacheSettings(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    size: Annotated[int, Field(ge=0)] = 0
+    negative: bool = False
+
+
+class RoutingSettings(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    cache: Annotated[RouteCacheSettings, Field(default_factory=RouteCacheSettings)]
+    mounts: Annotated[dict[str, str], Field(default_factory=dict)]
@@ -0,0 +1,258 @@
+import re
+from re import Pattern
+
+from selva.web.routing.route import (
+    PATH_PARAM_TYPES,
+    RE_MULTI_SLASH,
+    RE_PATH_PARAM_SPEC,
+    Route,
+    get_param_pattern,
+)
+
+__all__ = ("RouteTree", "normalize_path", "split_path")
+
+
+def normalize_path(path: str) -> str:
+    """remove a single leading and trailing slash from the path
+
+    A path made only of two slashes is not empty, as the regex engine does not
+    match it against the root
+    """
+
+    path = path.removeprefix("/")
+    return path.removesuffix("/") if path != "/" else path
+
+
+def split_path(path: str) -> tuple[list[str], bool]:
+    """split a request path into segments
+
+    A single leading and trailing slash are ignored, as the regex engine
+    accepts them as optional.
+
+    :returns: list of segments and whether the path had a trailing slash
+    """
+
+    path = path.removeprefix("/")
+
+    trailing_slash = path.endswith("/") and path != "/"
+    if trailing_slash:
+        path = path[:-1]
+
+    return (path.split("/") if path else []), trailing_slash
+
+
+def _build_regex(
+    pattern: str, param_types: dict[str, type], suffix: str = ""
+) -> Pattern:
+    regex = ""
+    last = 0
+    for match in RE_PATH_PARAM_SPEC.finditer(pattern):
+        kind, param = match.groups()
+        param_pattern = get_param_pattern(kind, param_types.get(param, str))
+        regex += re.escape(pattern[last : match.start()])
+        regex += f"(?P<{param}>{param_pattern})"
+        last = match.end()
+
+    regex += re.escape(pattern[last:])
+    return re.compile(regex + suffix)
+
+
+class _Tail:
+    """Terminal node that matches the remainder of the path
+
+    A tail is created when a route contains a `*param`. When the wildcard is the
+    last segment, the remainder is captured as is, otherwise the remainder is
+    matched against a regex that, like the regex engine, accepts an optional
+    trailing slash.
+    """
+
+    __slots__ = ("wildcard", "regex", "route")
+
+    def __init__(self, pattern: str, param_types: dict[str, type]):
+        if (match := RE_PATH_PARAM_SPEC.fullmatch(pattern)) and match[1] == "*":
+            self.wildcard = match[2]
+            self.regex = None
+        else:
+            self.wildcard = None
+            self.regex = _build_regex(pattern, param_types, suffix="/?")
+
+        self.route: Route | None = None
+
+    def match(self, rest: str) -> dict[str, str] | None:
+        if self.wildcard:
+            return {self.wildcard: rest}
+
+        if match := self.regex.fullmatch(rest):
+            return match.groupdict()
+
+        return None
+
+
+class _Node:
+    __slots__ = ("static", "params", "patterns", "tails", "route")
+
+    def __init__(self):
+        self.static: dict[str, _Node] = {}
+        self.params: dict[str, _Node] = {}
+        # segments with literal text or typed parameters, keyed by their regex
+        self.patterns: dict[str, tuple[Pattern, _Node]] = {}
+        self.tails: dict[str, _Tail] = {}
+        self.route: Route | None = None
+
+
+class RouteTree:
+    """Segment based route tree for the routes of a single method
+
+    Each path segment is resolved by a dictionary lookup for static segments
+    before trying the path parameters, so the cost of matching a path depends
+    on the number of its segments rather than on the number of routes.
+    """
+
+    def __init__(self):
+        self.root = _Node()
+
+    def add(self, route: Route):
+        path = RE_MULTI_SLASH.sub("/", route.path).strip("/")
+        segments = path.split("/") if path else []
+
+        node = self.root
+        for index, segment in enumerate(segments):
+            if "*" in segment:
+                pattern = "/".join(segments[index:])
+                tail = _Tail(pattern, route.path_params)
+                key = tail.regex.pattern if tail.regex else pattern
+                tail = node.tails.setdefault(key, tail)
+                tail.route = route
+                return
+
+            if not RE_PATH_PARAM_SPEC.search(segment):
+                node = node.static.setdefault(segment, _Node())
+            elif (
+                match := RE_PATH_PARAM_SPEC.fullmatch(segment)
+            ) and route.path_params.get(match[2], str) not in PATH_PARAM_TYPES:
+                node = node.params.setdefault(match[2], _Node())
+            else:
+                regex = _build_regex(segment, route.path_params)
+                _, node = node.patterns.setdefault(regex.pattern, (regex, _Node()))
+
+        node.route = route
+
+    def match(self, path: str) -> tuple[Route, dict[str, str]] | None:
+        segments, trailing_slash = split_path(path)
+        params = {}
+
+        if route := self._match(self.root, segments, 0, trailing_slash, params):
+            return route, params
+
+        return None
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def _match(
+        self,
+        node: _Node,
+        segments: list[str],
+        index: int,
+        trailing_slash: bool,
+        params: dict[str, str],
+    ) -> Route | None:
+        if index == len(segments):
+            if node.route:
+                return node.route
+        else:
+            segment = segments[index]
+
+            if child := node.static.get(segment):
+                if route := self._match(
+                    child, segments, index + 1, trailing_slash, params
+                ):
+                    return route
+
+            if segment:
+                for regex, child in node.patterns.values():
+                    if not (match := regex.fullmatch(segment)):
+                        continue
+
+                    if route := self._match(
+                        child, segments, index + 1, trailing_slash, params
+                    ):
+                        params.update(match.groupdict())
+                        return route
+
+                for name, child in node.params.items():
+                    if route := self._match(
+                        child, segments, index + 1, trailing_slash, params
+                    ):
+                        params[name] = segment
+                        return route
+
+        if (rest := self._remainder(node, segments, index, trailing_slash)) is not None:
+            for tail in node.tails.values():
+                if tail.route and (values := tail.match(rest)) is not None:
+                    params.update(values)
+                    return tail.route
+
+        return None
+
+    def _remainder(
+        self, node: _Node, segments: list[str], index: int, trailing_slash: bool
+    ) -> str | None:
+        """remainder of the path to match against the tails of the node"""
+
+        # the remainder of a tail starts after a slash, so a path that ends at
+        # this node without a trailing slash cannot match it, except at the root
+        if not node.tails or not (
+            index < len(segments) or trailing_slash or node is self.root
+        ):
+            return None
+
+        if index == len(segments):
+            return ""
+
+        rest = "/".join(segments[index:])
+        if trailing_slash:
+            rest += "/"
+
+        return rest
+
+    def match_all(self, path: str) -> list[Route]:
+        """Find every route that matches the path, regardless of precedence"""
+
+        segments, trailing_slash = split_path(path)
+        routes = []
+        self._match_all(self.root, segments, 0, trailing_slash, routes)
+        return routes
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def _match_all(
+        self,
+        node: _Node,
+        segments: list[str],
+        index: int,
+        trailing_slash: bool,
+        routes: list[Route],
+    ):
+        if index == len(segments):
+            if node.route:
+                routes.append(node.route)
+        else:
+            segment = segments[index]
+
+            if child := node.static.get(segment):
+                self._match_all(child, segments, index + 1, trailing_slash, routes)
+
+            if segment:
+                for regex, child in node.patterns.values():
+                    if regex.fullmatch(segment):
+                        self._match_all(
+                            child, segments, index + 1, trailing_slash, routes
+                        )
+
+                for child in node.params.values():
+                    self._match_all(child, segments, index + 1, trailing_slash, routes)
+
+        if (rest := self._remainder(node, segments, index, trailing_slash)) is not None:
+            routes.extend(
+                tail.route
+                for tail in node.tails.values()
+                if tail.route and tail.match(rest) is not None
+            )
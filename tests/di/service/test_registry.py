@@ -0,0 +1,53 @@
+from selva.di.service.parse import parse_service_spec
+from selva.di.service.registry import ServiceRegistry
+
+
+class Service:
+    pass
+
+
+class Other:
+    pass
+
+
+def test_failed_lookup_does_not_modify_registry():
+    registry = ServiceRegistry()
+    registry[Service] = parse_service_spec(Service)
+
+    assert registry.get(Other) is None
+    assert registry.get(Service, "name") is None
+    assert Other not in registry
+    assert list(registry.services) == [Service]
+
+
+def test_find_first_candidate():
+    registry = ServiceRegistry()
+    spec = parse_service_spec(Service)
+    registry[Service] = spec
+
+    assert registry.find([Other, Service]) is spec
+    assert registry.find([Other]) is None
+    assert list(registry.services) == [Service]
+
+
+def test_registry_with_parent():
+    parent = ServiceRegistry()
+    parent_spec = parse_service_spec(Service)
+    parent[Service] = parent_spec
+
+    registry = ServiceRegistry(parent)
+    other_spec = parse_service_spec(Other)
+    registry[Other] = other_spec
+
+    assert registry.get(Service) is parent_spec
+    assert Service in registry
+    assert Other not in parent
+    assert registry.types() == [Service, Other]
+    assert list(registry.specs()) == [parent_spec, other_spec]
+
+    override_spec = parse_service_spec(Service)
+    registry[Service] = override_spec
+
+    assert registry.get(Service) is override_spec
+    assert registry.providers(Service) == {None: override_spec}
+    assert parent.get(Service) is parent_spec
@@ -0,0 +1,174 @@
+from typing import Annotated
+
+import pytest
+
+from selva.di.container import Container
+from selva.di.decorator import service
+from selva.di.error import ServiceNotFoundError
+from selva.di.inject import Inject
+from selva.di.scope import Scope
+
+
+class Config:
+    def __init__(self, value: str):
+        self.value = value
+
+
+@service
+class Repository:
+    config: Annotated[Config, Inject]
+
+
+@service
+class Handler:
+    repository: Annotated[Repository, Inject]
+
+
+@service
+class Independent:
+    pass
+
+
+@service
+class ChildOnly:
+    pass
+
+
+@service(provides=Independent)
+class OtherIndependent(Independent):
+    pass
+
+
+@service(scope=Scope.REQUEST)
+class RequestRepository:
+    config: Annotated[Config, Inject]
+
+
+@service(scope=Scope.REQUEST)
+class RequestIndependent:
+    pass
+
+
+@pytest.fixture
+def parent() -> Container:
+    container = Container()
+    container.define(Container, container)
+    container.define(Config, Config("parent"))
+    container.register(Repository)
+    container.register(Handler)
+    container.register(Independent)
+    return container
+
+
+async def test_child_inherits_services_and_instances(parent: Container):
+    handler = await parent.get(Handler)
+    child = parent.child()
+
+    assert await child.get(Handler) is handler
+    assert await child.get(Config) is await parent.get(Config)
+    assert child.cache == {(Container, None): child}
+
+
+async def test_child_overrides_dependency(parent: Container):
+    parent_handler = await parent.get(Handler)
+    independent = await parent.get(Independent)
+
+    child = parent.child()
+    child.define(Config, Config("child"))
+
+    child_handler = await child.get(Handler)
+    assert child_handler is not parent_handler
+    assert child_handler.repository.config.value == "child"
+    assert await child.get(Independent) is independent
+
+    assert parent_handler.repository.config.value == "parent"
+    assert await parent.get(Handler) is parent_handler
+
+
+async def test_child_overrides_registered_service(parent: Container):
+    child = parent.child()
+    child.register(OtherIndependent)
+
+    assert isinstance(await child.get(Independent), OtherIndependent)
+    assert type(await parent.get(Independent)) is Independent
+
+
+async def test_child_services_are_not_visible_to_parent(parent: Container):
+    child = parent.child()
+    child.register(ChildOnly)
+
+    assert isinstance(await child.get(ChildOnly), ChildOnly)
+
+    with pytest.raises(ServiceNotFoundError):
+        await parent.get(ChildOnly)
+
+
+async def test_child_container_is_injected(parent: Container):
+    child = parent.child()
+
+    assert await child.get(Container) is child
+    assert await parent.get(Container) is parent
+
+
+async def test_grandchild_inherits_overrides(parent: Container):
+    child = parent.child()
+    child.define(Config, Config("child"))
+    handler = await child.get(Handler)
+
+    grandchild = child.child()
+    assert await grandchild.get(Handler) is handler
+
+
+async def test_child_finalizers_are_scoped_to_child(parent: Container):
+    finalized = []
+
+    @service
+    class Finalizable:
+        config: Annotated[Config, Inject]
+
+        def finalize(self):
+            finalized.append(self.config.value)
+
+    parent.register(Finalizable)
+    await parent.get(Finalizable)
+
+    child = parent.child()
+    child.define(Config, Config("child"))
+    await child.get(Finalizable)
+
+    await child.run_finalizers()
+    assert finalized == ["child"]
+
+    await parent.run_finalizers()
+    assert finalized == ["child", "parent"]
+
+
+async def test_child_compile_with_parent_instances(parent: Container):
+    child = parent.child()
+    child.compile()
+
+    assert isinstance(await child.get(Handler), Handler)
+    assert [impl for impl, _name in child.iter_service(Handler)] == [Handler]
+
+
+async def test_child_uses_request_scope_of_parent(parent: Container):
+    parent.register(RequestIndependent)
+    child = parent.child()
+
+    async with parent.request_scope():
+        instance = await child.get(RequestIndependent)
+        assert await parent.get(RequestIndependent) is instance
+
+
+async def test_child_request_service_depending_on_override(parent: Container):
+    parent.register(RequestRepository)
+    child = parent.child()
+    child.define(Config, Config("child"))
+
+    async with parent.request_scope():
+        parent_repository = await parent.get(RequestRepository)
+        child_repository = await child.get(RequestRepository)
+
+        assert parent_repository.config.value == "parent"
+        assert child_repository.config.value == "child"
+        assert await child.get(RequestRepository) is child_repository
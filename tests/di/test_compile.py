@@ -0,0 +1,211 @@
+from typing import Annotated
+
+import pytest
+
+from selva.di.container import Container
+from selva.di.decorator import service
+from selva.di.error import (
+    DependencyLoopError,
+    MissingDependencyError,
+    ScopeMismatchError,
+)
+from selva.di.inject import Inject
+from selva.di.scope import Scope
+
+
+class Missing:
+    pass
+
+
+@service
+class Leaf:
+    pass
+
+
+@service
+class Middle:
+    leaf: Annotated[Leaf, Inject]
+
+
+@service
+class Root:
+    middle: Annotated[Middle, Inject]
+    leaf: Annotated[Leaf, Inject]
+
+
+@service
+class MissingDependency:
+    missing: Annotated[Missing, Inject]
+
+
+@service
+class OptionalMissingDependency:
+    missing: Annotated[Missing, Inject] = None
+
+
+@service
+class ClassLoop1:
+    other: Annotated["ClassLoop2", Inject]
+
+
+@service
+class ClassLoop2:
+    other: Annotated[ClassLoop1, Inject]
+
+
+class Product:
+    pass
+
+
+@service
+class ClassLoopWithFactory:
+    product: Annotated[Product, Inject]
+    other: Annotated["ClassInFactoryLoop", Inject]
+
+
+@service
+class ClassInFactoryLoop:
+    other: Annotated[ClassLoopWithFactory, Inject]
+
+
+@service
+def product_factory(dependency: ClassInFactoryLoop) -> Product:
+    return Product()
+
+
+@service
+class ConstructedService:
+    leaf: Annotated[Leaf, Inject]
+
+
+@service
+class InheritedDependency(Middle):
+    root: Annotated[Root, Inject]
+
+
+@service(scope=Scope.REQUEST)
+class RequestService:
+    pass
+
+
+@service
+class SingletonWithRequestDependency:
+    request_service: Annotated[RequestService, Inject]
+
+
+def test_compile_plans_dependencies_in_order(ioc: Container):
+    ioc.register(Root)
+    ioc.register(Middle)
+    ioc.register(Leaf)
+
+    ioc.compile()
+
+    assert ioc.graph[Root, None] == [
+        ioc.registry.get(Leaf),
+        ioc.registry.get(Middle),
+    ]
+    assert ioc.graph[Middle, None] == [ioc.registry.get(Leaf)]
+    assert ioc.graph[Leaf, None] == []
+
+
+async def test_get_compiled_service(ioc: Container):
+    ioc.register(Root)
+    ioc.register(Middle)
+    ioc.register(Leaf)
+
+    ioc.compile()
+
+    root = await ioc.get(Root)
+    assert root.middle is await ioc.get(Middle)
+    assert root.leaf is root.middle.leaf
+
+
+async def test_compiled_service_receives_dependencies_in_constructor(
+    ioc: Container,
+):
+    ioc.register(ConstructedService)
+    ioc.register(Leaf)
+
+    ioc.compile()
+
+    assert (ConstructedService, None) in ioc.constructor_injection
+
+    constructed = await ioc.get(ConstructedService)
+    assert constructed.leaf is await ioc.get(Leaf)
+
+
+async def test_compiled_service_receives_inherited_dependencies(ioc: Container):
+    ioc.register(InheritedDependency)
+    ioc.register(Root)
+    ioc.register(Middle)
+    ioc.register(Leaf)
+
+    ioc.compile()
+
+    assert (InheritedDependency, None) in ioc.constructor_injection
+
+    instance = await ioc.get(InheritedDependency)
+    assert instance.leaf is await ioc.get(Leaf)
+    assert instance.root is await ioc.get(Root)
+
+
+def test_compile_missing_dependency_should_fail(ioc: Container):
+    ioc.register(MissingDependency)
+
+    with pytest.raises(MissingDependencyError):
+        ioc.compile()
+
+
+def test_compile_optional_missing_dependency(ioc: Container):
+    ioc.register(OptionalMissingDependency)
+    ioc.compile()
+
+    assert ioc.graph[OptionalMissingDependency, None] == []
+
+
+def test_compile_defined_dependency(ioc: Container):
+    ioc.register(MissingDependency)
+    ioc.define(Missing, Missing())
+    ioc.compile()
+
+    assert ioc.graph[MissingDependency, None] == []
+
+
+async def test_compile_loop_of_service_classes(ioc: Container):
+    ioc.register(ClassLoop1)
+    ioc.register(ClassLoop2)
+
+    ioc.compile()
+
+    assert ioc.constructor_injection == set()
+
+    service1 = await ioc.get(ClassLoop1)
+    assert service1.other.other is service1
+
+
+def test_compile_loop_with_factory_should_fail(ioc: Container):
+    ioc.register(ClassLoopWithFactory)
+    ioc.register(ClassInFactoryLoop)
+    ioc.register(product_factory)
+
+    with pytest.raises(DependencyLoopError):
+        ioc.compile()
+
+
+def test_compile_singleton_depending_on_request_service_should_fail(
+    ioc: Container,
+):
+    ioc.register(RequestService)
+    ioc.register(SingletonWithRequestDependency)
+
+    with pytest.raises(ScopeMismatchError):
+        ioc.compile()
+
+
+def test_register_after_compile_discards_graph(ioc: Container):
+    ioc.register(Leaf)
+    ioc.compile()
+
+    ioc.register(Middle)
+    assert ioc.graph is None
+    assert ioc.constructor_injection == set()
@@ -23,7 +23,7 @@ def test_class_with_dependency_annotation():
         dependency: Annotated[Dependency, Inject]
 
     init = inspect.signature(Service.__init__)
-    assert len(init.parameters) == 3
+    assert list(init.parameters) == ["self", "dependency", "_args", "_kwargs"]
 
     assert Service().dependency is None
     assert Service(Dependency()).dependency is not None
@@ -61,3 +61,70 @@ def test_class_with_mixed_dependency_annotation():
     assert not hasattr(Service(), "non_dependency")
     assert not hasattr(Service(NonDependency()), "non_dependency")
     assert not hasattr(Service(non_dependency=NonDependency()), "non_dependency")
+
+
+def test_class_with_original_init():
+    class Dependency:
+        pass
+
+    @service
+    class Service:
+        dependency: Annotated[Dependency, Inject]
+
+        def __init__(self):
+            self.initialized = True
+
+    instance = Service(Dependency())
+    assert instance.initialized
+    assert isinstance(instance.dependency, Dependency)
+
+
+def test_class_with_slots():
+    class Dependency:
+        pass
+
+    @service(slots=True)
+    class Service:
+        dependency: Annotated[Dependency, Inject]
+        other: Annotated[Dependency, Inject] = None
+
+        def method(self):
+            return self.dependency
+
+    dependency = Dependency()
+    instance = Service(dependency)
+
+    assert Service.__slots__ == ("dependency", "other")
+    assert not hasattr(instance, "__dict__")
+    assert instance.method() is dependency
+    assert instance.other is None
+    assert getattr(Service, ATTRIBUTE_DI_SERVICE) == ServiceInfo(None, None)
+
+
+def test_class_with_slots_calling_super():
+    class Dependency:
+        pass
+
+    class Base:
+        def __init__(self):
+            self.base_initialized = True
+
+        def name(self):
+            return "base"
+
+    @service(slots=True)
+    class Service(Base):
+        dependency: Annotated[Dependency, Inject]
+
+        def __init__(self):
+            super().__init__()
+
+        def name(self):
+            return f"service {super().name()}"
+
+    dependency = Dependency()
+    instance = Service(dependency)
+
+    assert instance.base_initialized
+    assert instance.dependency is dependency
+    assert instance.name() == "service base"
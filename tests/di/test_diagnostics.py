@@ -0,0 +1,120 @@
+import json
+from typing import Annotated
+
+from selva.di.container import Container
+from selva.di.decorator import service
+from selva.di.diagnostics import dependency_graph, dependency_graph_dot
+from selva.di.inject import Inject
+from selva.di.lazy import Lazy
+from selva.di.scope import Scope
+
+
+@service
+class Dependency:
+    def initialize(self):
+        pass
+
+
+@service(scope=Scope.TRANSIENT)
+class Transient:
+    dependency: Annotated[Dependency, Inject]
+
+
+class Defined:
+    pass
+
+
+class Missing:
+    pass
+
+
+@service
+class Service:
+    transient: Annotated[Lazy[Transient], Inject]
+    missing: Annotated[Missing, Inject] = None
+
+
+async def test_creation_timings(ioc: Container):
+    ioc.register(Dependency)
+    ioc.register(Transient)
+
+    await ioc.get(Transient)
+    await ioc.get(Transient)
+
+    timings = ioc.timings[Transient, None]
+    assert timings.count == 2
+    assert timings.factory >= 0
+    assert timings.total == timings.factory + timings.initializer + timings.interceptors
+
+    assert ioc.timings[Dependency, None].count == 1
+    assert ioc.timings[Dependency, None].initializer >= 0
+
+
+async def test_resolutions_by_scope(ioc: Container):
+    ioc.register(Dependency)
+    ioc.register(Transient)
+    ioc.define(Defined, Defined())
+
+    await ioc.get(Transient)
+    await ioc.get(Transient)
+    await ioc.get(Defined)
+
+    assert ioc.resolutions[Dependency, None] == 2
+    assert ioc.resolutions_by_scope() == {
+        Scope.SINGLETON: 3,
+        Scope.REQUEST: 0,
+        Scope.TRANSIENT: 2,
+    }
+
+
+async def test_dependency_graph(ioc: Container):
+    ioc.register(Dependency)
+    ioc.register(Transient)
+    ioc.register(Service)
+    ioc.define(Defined, Defined())
+
+    await ioc.get(Dependency)
+
+    graph = dependency_graph(ioc)
+    services = {service["id"]: service for service in graph["services"]}
+
+    dependency = services[f"{__name__}.Dependency"]
+    assert dependency["created"]
+    assert dependency["resolutions"] == 1
+    assert dependency["timings"]["count"] == 1
+
+    assert services[f"{__name__}.Transient"]["scope"] == "transient"
+    assert services[f"{__name__}.Transient"]["timings"] is None
+    assert services[f"{__name__}.Defined"]["impl"] is None
+
+    assert graph["dependencies"] == [
+        {
+            "source": f"{__name__}.Transient",
+            "target": f"{__name__}.Dependency",
+            "attribute": "dependency",
+            "optional": False,
+            "lazy": False,
+        },
+        {
+            "source": f"{__name__}.Service",
+            "target": f"{__name__}.Transient",
+            "attribute": "transient",
+            "optional": False,
+            "lazy": True,
+        },
+    ]
+
+    assert json.loads(json.dumps(graph)) == graph
+
+
+async def test_dependency_graph_dot(ioc: Container):
+    ioc.register(Dependency)
+    ioc.register(Transient)
+    ioc.register(Service)
+
+    dot = dependency_graph_dot(dependency_graph(ioc))
+
+    assert dot.startswith("digraph services {\n")
+    assert dot.endswith("}\n")
+    assert f'"{__name__}.Transient" [label="{__name__}.Transient\\ntransient"];' in dot
+    assert f'"{__name__}.Service" -> "{__name__}.Transient" [style=dashed];' in dot
@@ -0,0 +1,82 @@
+from typing import Generic, TypeVar
+
+from selva.di.container import Container
+from selva.di.decorator import service
+
+T = TypeVar("T")
+
+
+class Source:
+    pass
+
+
+class Base:
+    pass
+
+
+class Model(Base):
+    pass
+
+
+class Converter(Generic[T]):
+    pass
+
+
+class Unknown:
+    pass
+
+
+@service(provides=Converter[Base])
+class BaseConverter(Converter[Base]):
+    pass
+
+
+@service(provides=Converter[list[Base]])
+class BaseListConverter(Converter[list[Base]]):
+    pass
+
+
+@service(provides=Base)
+class BaseService(Base):
+    pass
+
+
+async def test_find_generic_service_by_base_type(ioc: Container):
+    ioc.register(BaseConverter)
+
+    converter = await ioc.find(Converter[Model])
+    assert isinstance(converter, BaseConverter)
+    assert ioc.resolution_cache[Converter[Model], None] == Converter[Base]
+
+
+async def test_find_generic_list_service_by_base_type(ioc: Container):
+    ioc.register(BaseListConverter)
+
+    converter = await ioc.find(Converter[list[Model]])
+    assert isinstance(converter, BaseListConverter)
+
+
+async def test_find_service_by_base_type(ioc: Container):
+    ioc.register(BaseService)
+
+    assert isinstance(await ioc.find(Model), BaseService)
+
+
+async def test_find_defined_service(ioc: Container):
+    instance = BaseConverter()
+    ioc.define(Converter[Base], instance)
+
+    assert await ioc.find(Converter[Model]) is instance
+
+
+async def test_find_caches_missing_service(ioc: Container):
+    assert await ioc.find(Converter[Unknown]) is None
+    assert ioc.resolution_cache[Converter[Unknown], None] is None
+    assert ioc.registry.services == {}
+
+
+async def test_register_clears_resolution_cache(ioc: Container):
+    assert await ioc.find(Converter[Model]) is None
+
+    ioc.register(BaseConverter)
+    assert isinstance(await ioc.find(Converter[Model]), BaseConverter)
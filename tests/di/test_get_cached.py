@@ -0,0 +1,98 @@
+import pytest
+
+from selva.di.container import Container
+from selva.di.decorator import service
+from selva.di.error import ServiceNotCreatedError
+from selva.di.scope import Scope
+
+
+class Empty(dict):
+    pass
+
+
+@service
+async def empty_factory() -> Empty:
+    return Empty()
+
+
+@service(scope=Scope.REQUEST)
+class RequestService:
+    pass
+
+
+@service
+class Service:
+    pass
+
+
+async def test_falsy_instance_is_cached(ioc: Container):
+    ioc.register(empty_factory)
+
+    instance = await ioc.get(Empty)
+    assert not instance
+    assert await ioc.get(Empty) is instance
+
+
+async def test_falsy_generator_instance_is_finalized_once(ioc: Container):
+    finalized = []
+
+    @service
+    async def factory() -> Empty:
+        yield Empty()
+        finalized.append(True)
+
+    ioc.register(factory)
+
+    await ioc.get(Empty)
+    await ioc.get(Empty)
+    await ioc.run_finalizers()
+
+    assert finalized == [True]
+
+
+async def test_get_cached(ioc: Container):
+    ioc.register(Service)
+
+    assert ioc.get_cached(Service) is None
+    assert ioc.get_cached(Service, default=False) is False
+
+    instance = await ioc.get(Service)
+    assert ioc.get_cached(Service) is instance
+
+
+async def test_get_cached_falsy_instance(ioc: Container):
+    ioc.register(empty_factory)
+    instance = await ioc.get(Empty)
+
+    assert ioc.get_cached(Empty, default=None) is instance
+
+
+async def test_get_cached_request_scoped_service(ioc: Container):
+    ioc.register(RequestService)
+
+    async with ioc.request_scope():
+        assert ioc.get_cached(RequestService) is None
+        instance = await ioc.get(RequestService)
+        assert ioc.get_cached(RequestService) is instance
+
+    assert ioc.get_cached(RequestService) is None
+
+
+async def test_get_nowait(ioc: Container):
+    ioc.register(Service)
+
+    with pytest.raises(ServiceNotCreatedError):
+        ioc.get_nowait(Service)
+
+    instance = await ioc.get(Service)
+    assert ioc.get_nowait(Service) is instance
+
+
+def test_get_nowait_defined_service(ioc: Container):
+    instance = Service()
+    ioc.define(Service, instance, name="name")
+
+    assert ioc.get_nowait(Service, name="name") is instance
+
+    with pytest.raises(ServiceNotCreatedError):
+        ioc.get_nowait(Service)
@@ -0,0 +1,98 @@
+import asyncio
+from typing import Annotated
+
+import pytest
+
+from selva.di.container import Container
+from selva.di.decorator import service
+from selva.di.error import ServiceInitTimeoutError
+from selva.di.inject import Inject
+from selva.di.scope import Scope
+
+first_started: asyncio.Event
+second_started: asyncio.Event
+
+
+@service
+class First:
+    async def initialize(self):
+        first_started.set()
+        await second_started.wait()
+
+
+@service
+class Second:
+    async def initialize(self):
+        second_started.set()
+        await first_started.wait()
+
+
+@service
+class Dependent:
+    first: Annotated[First, Inject]
+    second: Annotated[Second, Inject]
+
+
+@service(scope=Scope.REQUEST)
+class RequestService:
+    pass
+
+
+@service(scope=Scope.TRANSIENT)
+class TransientService:
+    pass
+
+
+@service
+class Slow:
+    async def initialize(self):
+        await asyncio.sleep(10)
+
+
+@pytest.fixture(autouse=True)
+def create_events():
+    global first_started, second_started  # pylint: disable=global-statement
+    first_started = asyncio.Event()
+    second_started = asyncio.Event()
+
+
+async def test_initialize_singletons(ioc: Container):
+    ioc.register(Dependent)
+    ioc.register(First)
+    ioc.register(Second)
+    ioc.register(RequestService)
+    ioc.register(TransientService)
+
+    timings = await asyncio.wait_for(ioc.initialize_singletons(), timeout=1)
+
+    assert set(list(timings)[:2]) == {(First, None), (Second, None)}
+    assert list(timings)[2] == (Dependent, None)
+    assert all(seconds >= 0 for seconds in timings.values())
+
+    dependent = ioc.cache[Dependent, None]
+    assert dependent.first is ioc.cache[First, None]
+    assert dependent.second is ioc.cache[Second, None]
+
+    assert (RequestService, None) not in ioc.cache
+    assert (TransientService, None) not in ioc.cache
+
+
+async def test_initialize_singletons_skips_created_services(ioc: Container):
+    ioc.register(First)
+    ioc.register(Second)
+
+    first_started.set()
+    second_started.set()
+
+    first = await ioc.get(First)
+    timings = await ioc.initialize_singletons()
+
+    assert list(timings) == [(Second, None)]
+    assert ioc.cache[First, None] is first
+
+
+async def test_initialize_singletons_timeout_should_fail(ioc: Container):
+    ioc.register(Slow)
+
+    with pytest.raises(ServiceInitTimeoutError):
+        await ioc.initialize_singletons(timeout=0.01)
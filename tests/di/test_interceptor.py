@@ -22,3 +22,53 @@ async def test_intercept(ioc: Container):
     instance = await ioc.get(MyService)
 
     assert getattr(instance, "intercepted")
+
+
+class Base:
+    pass
+
+
+@service
+class Derived(Base):
+    pass
+
+
+@service
+class Unrelated:
+    pass
+
+
+@service
+class TargetedInterceptor:
+    service_types = (Base,)
+
+    def __init__(self):
+        self.calls = []
+
+    async def intercept(self, instance: Any, service_type: type):
+        self.calls.append(service_type)
+
+
+async def test_intercept_declared_service_types(ioc: Container):
+    ioc.register(Derived)
+    ioc.register(Unrelated)
+    ioc.interceptor(TargetedInterceptor)
+
+    await ioc.get(Derived)
+    await ioc.get(Unrelated)
+
+    [interceptor] = ioc.interceptor_chains[Derived]
+    assert isinstance(interceptor, TargetedInterceptor)
+    assert interceptor.calls == [Derived]
+    assert ioc.interceptor_chains[Unrelated] == []
+
+
+async def test_interceptor_chain_is_reset_on_new_interceptor(ioc: Container):
+    ioc.register(MyService)
+    ioc.interceptor(TargetedInterceptor)
+
+    await ioc.get(MyService)
+    assert ioc.interceptor_chains[MyService] == []
+
+    ioc.interceptor(MyInterceptor)
+    assert ioc.interceptor_chains == {}
@@ -0,0 +1,123 @@
+from typing import Annotated
+
+import pytest
+
+from selva.di.call import call_with_dependencies
+from selva.di.container import Container
+from selva.di.decorator import service
+from selva.di.error import ServiceNotFoundError
+from selva.di.inject import Inject
+from selva.di.lazy import Lazy
+from selva.di.scope import Scope
+
+
+@service
+class Heavy:
+    pass
+
+
+@service
+class Consumer:
+    heavy: Annotated[Lazy[Heavy], Inject]
+
+
+@service(scope=Scope.REQUEST)
+class RequestService:
+    pass
+
+
+@service
+class RequestConsumer:
+    request_service: Annotated[Lazy[RequestService], Inject]
+
+
+@service
+class LoopWithLazy:
+    product: Annotated[Lazy["Product"], Inject]
+
+
+class Product:
+    pass
+
+
+@service
+def product_factory(dependency: LoopWithLazy) -> Product:
+    return Product()
+
+
+@service
+def lazy_factory(heavy: Lazy[Heavy]) -> Product:
+    assert not heavy.resolved
+    return Product()
+
+
+async def test_lazy_dependency_is_resolved_on_first_use(ioc: Container):
+    ioc.register(Heavy)
+    ioc.register(Consumer)
+
+    consumer = await ioc.get(Consumer)
+
+    assert isinstance(consumer.heavy, Lazy)
+    assert not consumer.heavy.resolved
+    assert (Heavy, None) not in ioc.cache
+
+    heavy = await consumer.heavy
+    assert heavy is await ioc.get(Heavy)
+    assert consumer.heavy.resolved
+    assert await consumer.heavy.get() is heavy
+
+
+async def test_lazy_request_service_is_resolved_per_request(ioc: Container):
+    ioc.register(RequestService)
+    ioc.register(RequestConsumer)
+
+    ioc.compile()
+    consumer = await ioc.get(RequestConsumer)
+
+    async with ioc.request_scope():
+        service1 = await consumer.request_service
+        assert service1 is await consumer.request_service
+
+    async with ioc.request_scope():
+        service2 = await consumer.request_service
+
+    assert service1 is not service2
+    assert not consumer.request_service.resolved
+
+
+async def test_lazy_dependency_breaks_factory_loop(ioc: Container):
+    ioc.register(LoopWithLazy)
+    ioc.register(product_factory)
+
+    ioc.compile()
+
+    product = await ioc.get(Product)
+    loop_with_lazy = await ioc.get(LoopWithLazy)
+    assert await loop_with_lazy.product is product
+
+
+async def test_lazy_factory_dependency(ioc: Container):
+    ioc.register(Heavy)
+    ioc.register(lazy_factory)
+
+    await ioc.get(Product)
+    assert (Heavy, None) not in ioc.cache
+
+
+async def test_call_with_lazy_dependency(ioc: Container):
+    ioc.register(Heavy)
+
+    async def target(heavy: Annotated[Lazy[Heavy], Inject]):
+        return heavy
+
+    result = await call_with_dependencies(ioc, target)
+    assert await result is await ioc.get(Heavy)
+
+
+async def test_missing_lazy_dependency_should_fail_on_use(ioc: Container):
+    ioc.register(Consumer)
+
+    consumer = await ioc.get(Consumer)
+
+    with pytest.raises(ServiceNotFoundError):
+        await consumer.heavy
@@ -0,0 +1,113 @@
+import asyncio
+from typing import Annotated
+
+import pytest
+
+from selva.di.container import Container
+from selva.di.decorator import service
+from selva.di.inject import Inject
+
+finalized: list[str]
+first_finalizing: asyncio.Event
+second_finalizing: asyncio.Event
+
+
+@service
+class First:
+    async def finalize(self):
+        first_finalizing.set()
+        await second_finalizing.wait()
+        finalized.append("first")
+
+
+@service
+class Second:
+    async def finalize(self):
+        second_finalizing.set()
+        await first_finalizing.wait()
+        finalized.append("second")
+
+
+@service
+class Dependent:
+    first: Annotated[First, Inject]
+    second: Annotated[Second, Inject]
+
+    async def finalize(self):
+        finalized.append("dependent")
+
+
+@service
+class Slow:
+    async def finalize(self):
+        await asyncio.sleep(10)
+        finalized.append("slow")
+
+
+@service
+class Failing:
+    def finalize(self):
+        raise ValueError()
+
+
+@service
+class Other:
+    def finalize(self):
+        finalized.append("other")
+
+
+@pytest.fixture(autouse=True)
+def create_state():
+    global finalized, first_finalizing, second_finalizing  # pylint: disable=global-statement
+    finalized = []
+    first_finalizing = asyncio.Event()
+    second_finalizing = asyncio.Event()
+
+
+async def test_run_finalizers_in_layers(ioc: Container):
+    ioc.register(Dependent)
+    ioc.register(First)
+    ioc.register(Second)
+
+    await ioc.get(Dependent)
+    timings = await asyncio.wait_for(ioc.run_finalizers(), timeout=1)
+
+    assert finalized[0] == "dependent"
+    assert set(finalized[1:]) == {"first", "second"}
+    assert set(timings) == {(Dependent, None), (First, None), (Second, None)}
+    assert all(seconds >= 0 for seconds in timings.values())
+    assert ioc.finalizers == []
+
+
+async def test_finalizer_timeout(ioc: Container):
+    ioc.register(Slow)
+    ioc.register(Other)
+
+    await ioc.get(Slow)
+    await ioc.get(Other)
+    timings = await asyncio.wait_for(ioc.run_finalizers(timeout=0.01), timeout=1)
+
+    assert finalized == ["other"]
+    assert set(timings) == {(Slow, None), (Other, None)}
+
+
+async def test_total_timeout(ioc: Container):
+    ioc.register(Slow)
+
+    await ioc.get(Slow)
+    timings = await asyncio.wait_for(ioc.run_finalizers(total_timeout=0.01), timeout=1)
+
+    assert finalized == []
+    assert timings == {}
+
+
+async def test_failing_finalizer_does_not_stop_others(ioc: Container):
+    ioc.register(Failing)
+    ioc.register(Other)
+
+    await ioc.get(Failing)
+    await ioc.get(Other)
+    timings = await ioc.run_finalizers()
+
+    assert finalized == ["other"]
+    assert set(timings) == {(Failing, None), (Other, None)}
@@ -72,3 +72,17 @@ async def test_register_a_service_twice_should_fail(ioc: Container):
     ioc.register(Implementation)
     with pytest.raises(ServiceAlreadyRegisteredError):
         ioc.register(Implementation2)
+
+
+@service(slots=True)
+class SlotsService:
+    service1: Annotated[Service1, Inject]
+
+
+async def test_inject_into_slots(ioc: Container):
+    ioc.register(Service1)
+    ioc.register(SlotsService)
+
+    instance = await ioc.get(SlotsService)
+    assert instance.service1 is await ioc.get(Service1)
+    assert not hasattr(instance, "__dict__")
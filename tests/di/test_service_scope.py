@@ -0,0 +1,286 @@
+import asyncio
+from typing import Annotated
+
+import pytest
+
+from selva.di.container import Container
+from selva.di.decorator import service
+from selva.di.error import RequestScopeNotActiveError, ScopeMismatchError
+from selva.di.inject import Inject
+from selva.di.interceptor import Interceptor
+from selva.di.scope import Scope
+
+
+@service
+class Singleton:
+    pass
+
+
+@service(scope=Scope.REQUEST)
+class RequestService:
+    singleton: Annotated[Singleton, Inject]
+    finalized = False
+
+    def finalize(self):
+        self.finalized = True
+
+
+@service(scope=Scope.TRANSIENT)
+class TransientService:
+    request_service: Annotated[RequestService, Inject]
+
+
+@service
+class SingletonWithRequestDependency:
+    request_service: Annotated[RequestService, Inject]
+
+
+class Tenant:
+    def __init__(self, name: str):
+        self.name = name
+
+
+@service(scope="request")
+async def tenant_factory() -> Tenant:
+    yield Tenant("tenant")
+
+
+async def test_request_service_is_shared_within_request(ioc: Container):
+    ioc.register(Singleton)
+    ioc.register(RequestService)
+
+    async with ioc.request_scope():
+        service1 = await ioc.get(RequestService)
+        service2 = await ioc.get(RequestService)
+        assert service1 is service2
+        assert service1.singleton is await ioc.get(Singleton)
+
+    async with ioc.request_scope():
+        service3 = await ioc.get(RequestService)
+        assert service3 is not service1
+
+    assert service1.finalized
+    assert service3.finalized
+    assert ioc.cache.keys() == {(Singleton, None)}
+
+
+async def test_request_service_without_request_should_fail(ioc: Container):
+    ioc.register(Singleton)
+    ioc.register(RequestService)
+
+    with pytest.raises(RequestScopeNotActiveError):
+        await ioc.get(RequestService)
+
+
+async def test_concurrent_requests_are_isolated(ioc: Container):
+    ioc.register(Singleton)
+    ioc.register(RequestService)
+
+    async def handle_request():
+        async with ioc.request_scope():
+            service1 = await ioc.get(RequestService)
+            await asyncio.sleep(0)
+            assert service1 is await ioc.get(RequestService)
+            return service1
+
+    service1, service2 = await asyncio.gather(handle_request(), handle_request())
+    assert service1 is not service2
+
+
+async def test_transient_service_is_created_on_each_get(ioc: Container):
+    ioc.register(Singleton)
+    ioc.register(RequestService)
+    ioc.register(TransientService)
+
+    async with ioc.request_scope():
+        service1 = await ioc.get(TransientService)
+        service2 = await ioc.get(TransientService)
+
+        assert service1 is not service2
+        assert service1.request_service is service2.request_service
+
+
+async def test_request_scoped_factory_generator_is_finalized(ioc: Container):
+    ioc.register(tenant_factory)
+
+    async with ioc.request_scope() as request_scope:
+        tenant = await ioc.get(Tenant)
+        assert tenant.name == "tenant"
+        assert len(request_scope.finalizers) == 1
+
+    assert ioc.finalizers == []
+
+
+async def test_singleton_depending_on_request_service_should_fail(ioc: Container):
+    ioc.register(Singleton)
+    ioc.register(RequestService)
+    ioc.register(SingletonWithRequestDependency)
+
+    async with ioc.request_scope():
+        with pytest.raises(ScopeMismatchError):
+            await ioc.get(SingletonWithRequestDependency)
+
+
+async def test_scope_of(ioc: Container):
+    ioc.register(Singleton)
+    ioc.register(RequestService)
+    ioc.register(TransientService)
+    ioc.define(str, "value")
+
+    assert ioc.scope_of(Singleton) is Scope.SINGLETON
+    assert ioc.scope_of(RequestService) is Scope.REQUEST
+    assert ioc.scope_of(TransientService) is Scope.TRANSIENT
+    assert ioc.scope_of(str) is Scope.SINGLETON
+    assert ioc.scope_of(int) is None
+
+
+class Session:
+    def __init__(self):
+        self.closed = False
+
+
+@service(scope=Scope.TRANSIENT)
+async def session_factory() -> Session:
+    session = Session()
+    yield session
+    session.closed = True
+
+
+@service
+class SingletonWithTransientDependency:
+    session: Annotated[Session, Inject]
+
+
+async def test_transient_dependency_of_singleton_outlives_request(ioc: Container):
+    ioc.register(session_factory)
+    ioc.register(SingletonWithTransientDependency)
+
+    async with ioc.request_scope():
+        singleton = await ioc.get(SingletonWithTransientDependency)
+        session = await ioc.get(Session)
+
+    assert session.closed
+    assert not singleton.session.closed
+
+    await ioc.run_finalizers()
+    assert singleton.session.closed
+
+
+async def test_transient_outside_request_does_not_keep_finalizer(ioc: Container):
+    ioc.register(session_factory)
+
+    for _ in range(3):
+        session = await ioc.get(Session)
+        assert not session.closed
+
+    assert ioc.finalizers == []
+
+
+class CurrentUser:
+    pass
+
+
+created: list[str] = []
+
+
+@service(scope=Scope.REQUEST)
+async def current_user_factory() -> CurrentUser:
+    await asyncio.sleep(0.01)
+    yield CurrentUser()
+    created.append("finalized")
+
+
+async def test_concurrent_gets_create_request_service_once(ioc: Container):
+    ioc.register(current_user_factory)
+    created.clear()
+
+    async with ioc.request_scope():
+        user1, user2 = await asyncio.gather(ioc.get(CurrentUser), ioc.get(CurrentUser))
+        assert user1 is user2
+
+    assert created == ["finalized"]
+
+
+@service
+class SlowSingleton:
+    async def initialize(self):
+        await asyncio.sleep(0.01)
+
+
+async def test_concurrent_gets_create_singleton_once(ioc: Container):
+    ioc.register(SlowSingleton)
+
+    service1, service2 = await asyncio.gather(
+        ioc.get(SlowSingleton), ioc.get(SlowSingleton)
+    )
+    assert service1 is service2
+    assert ioc.timings[SlowSingleton, None].count == 1
+
+
+@service
+class SlowEngine:
+    singleton: Annotated[Singleton, Inject]
+
+    def __init__(self):
+        self.ready = False
+
+    async def initialize(self):
+        await asyncio.sleep(0.01)
+        self.ready = True
+
+
+async def test_concurrent_gets_wait_for_initializer_of_compiled_service(
+    ioc: Container,
+):
+    ioc.register(Singleton)
+    ioc.register(SlowEngine)
+    ioc.compile()
+    await ioc.get(Singleton)
+
+    async def get_ready():
+        return (await ioc.get(SlowEngine)).ready
+
+    ready = await asyncio.gather(get_ready(), get_ready(), get_ready())
+    assert ready == [True, True, True]
+    assert ioc.timings[SlowEngine, None].count == 1
+
+
+@service
+async def slow_factory() -> SlowEngine:
+    return SlowEngine()
+
+
+async def test_concurrent_gets_wait_for_interceptors_of_factory(ioc: Container):
+    class ReadyInterceptor(Interceptor):
+        async def intercept(self, instance, dispatch_type):
+            if isinstance(instance, SlowEngine):
+                await instance.initialize()
+
+    ioc.register(slow_factory)
+    ioc.interceptor(ReadyInterceptor)
+
+    async def get_ready():
+        return (await ioc.get(SlowEngine)).ready
+
+    ready = await asyncio.gather(get_ready(), get_ready())
+    assert ready == [True, True]
+
+
+@service(scope=Scope.REQUEST)
+class FailingFinalizer:
+    def finalize(self):
+        raise ValueError()
+
+
+async def test_failing_request_finalizer_does_not_stop_others(ioc: Container):
+    ioc.register(Singleton)
+    ioc.register(RequestService)
+    ioc.register(FailingFinalizer)
+
+    async with ioc.request_scope():
+        request_service = await ioc.get(RequestService)
+        await ioc.get(FailingFinalizer)
+        request_scope = ioc.request_scope_var.get()
+
+    assert request_service.finalized
+    assert request_scope.cache == {}
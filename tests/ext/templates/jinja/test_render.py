@@ -4,6 +4,8 @@ from pathlib import Path
 from selva.configuration.defaults import default_settings
 from selva.configuration.settings import Settings
 from selva.ext.templates.jinja.service import JinjaTemplate
+from selva.web.routing.decorator import get
+from selva.web.routing.router import Router
 
 
 async def test_render_template():
@@ -22,3 +24,21 @@ async def test_render_str():
     template.initialize()
     result = await template.render_str("{{ variable }}", {"variable": "Jinja"})
     assert result == "Jinja"
+
+
+@get("items/:item_id")
+async def item(request, item_id: int):
+    pass
+
+
+async def test_render_url_for():
+    router = Router()
+    router.route(item)
+
+    settings = Settings(deepcopy(default_settings))
+    template = JinjaTemplate(settings, router)
+    template.initialize()
+    result = await template.render_str(
+        "{{ url_for('get.tests.ext.templates.jinja.test_render.item', item_id=1) }}", {}
+    )
+    assert result == "/items/1"
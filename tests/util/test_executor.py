@@ -0,0 +1,139 @@
+import asyncio
+import contextvars
+import threading
+
+import pytest
+
+from selva._util.maybe_async import maybe_async
+from selva.di.container import Container
+from selva.di.decorator import service
+from selva.executor import (
+    SyncExecutor,
+    configure_executor,
+    get_executor,
+    inline,
+    use_executor,
+)
+
+
+@pytest.fixture(name="executor")
+def fixture_executor():
+    executor = SyncExecutor(max_workers=1, queue_size=1)
+    yield executor
+    executor.shutdown()
+
+
+async def test_sync_function_runs_in_executor_thread():
+    def func():
+        return threading.current_thread()
+
+    thread = await maybe_async(func)
+    assert thread.name.startswith("selva")
+
+
+async def test_inline_function_runs_on_event_loop():
+    @inline
+    def func():
+        return threading.current_thread()
+
+    thread = await maybe_async(func)
+    assert thread is threading.current_thread()
+
+
+async def test_inline_method_runs_on_event_loop():
+    class Service:
+        @inline
+        def func(self):
+            return threading.current_thread()
+
+    thread = await maybe_async(Service().func)
+    assert thread is threading.current_thread()
+
+
+async def test_executor_stats(executor: SyncExecutor):
+    started = threading.Event()
+    release = threading.Event()
+
+    def func():
+        started.set()
+        release.wait()
+
+    tasks = [asyncio.create_task(executor.run(func)) for _ in range(3)]
+
+    await asyncio.to_thread(started.wait)
+    await asyncio.sleep(0)
+
+    stats = executor.stats()
+    assert stats.running == 1
+    assert stats.pending == 1
+    assert stats.waiting == 1
+    assert stats.saturated
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    stats = executor.stats()
+    assert stats.running == 0
+    assert stats.pending == 0
+    assert stats.waiting == 0
+    assert stats.completed == 3
+    assert not stats.saturated
+
+
+async def test_configure_executor():
+    previous = get_executor()
+    executor = configure_executor(max_workers=2, queue_size=4)
+
+    try:
+        assert get_executor() is executor
+        assert executor.max_workers == 2
+        assert executor.queue_size == 4
+    finally:
+        configure_executor(previous.max_workers, previous.queue_size)
+
+
+async def test_use_executor():
+    previous = get_executor()
+    executor = SyncExecutor(max_workers=1)
+
+    with use_executor(executor):
+        assert get_executor() is executor
+        assert await maybe_async(get_executor) is executor
+
+    assert get_executor() is previous
+
+
+variable: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "variable", default="unset"
+)
+
+
+class ContextService:
+    def __init__(self, value: str):
+        self.value = value
+
+
+@service
+def context_service_factory() -> ContextService:
+    return ContextService(variable.get())
+
+
+async def test_sync_function_sees_caller_context():
+    token = variable.set("set")
+    try:
+        assert await maybe_async(variable.get) == "set"
+    finally:
+        variable.reset(token)
+
+
+async def test_sync_factory_sees_caller_context():
+    ioc = Container()
+    ioc.register(context_service_factory)
+
+    token = variable.set("set")
+    try:
+        instance = await ioc.get(ContextService)
+    finally:
+        variable.reset(token)
+
+    assert instance.value == "set"
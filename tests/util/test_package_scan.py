@@ -2,7 +2,7 @@ import inspect
 
 import pytest
 
-from selva._util.package_scan import scan_packages
+from selva._util.package_scan import PackageIndex, scan_packages
 
 
 def test_scan_package():
@@ -50,3 +50,41 @@ def test_scan_package_str_with_predicate():
 def test_non_function_predicate_should_fail():
     with pytest.raises(TypeError, match="invalid predicate"):
         list(scan_packages("", predicate="predicate"))
+
+
+def test_package_index():
+    from .package_to_scan.module_to_scan import ClassItem, function_item
+
+    setattr(function_item, "__test_marker__", True)
+    try:
+        index = PackageIndex("tests.util.package_to_scan")
+
+        assert index.members == [ClassItem, function_item]
+        assert index.with_attribute("__test_marker__") == [function_item]
+        assert index.by_attribute == {"__test_marker__": [function_item]}
+    finally:
+        delattr(function_item, "__test_marker__")
+
+
+def test_scan_package_index():
+    from .package_to_scan.module_to_scan import ClassItem
+
+    index = PackageIndex("tests.util.package_to_scan")
+
+    def predicate(arg):
+        return inspect.isclass(arg)
+
+    assert list(scan_packages(index, predicate=predicate)) == [ClassItem]
+    assert list(scan_packages(index, attribute="__missing__")) == []
+
+
+def test_package_index_subpackage():
+    from .package_to_scan.module_to_scan import ClassItem, function_item
+
+    index = PackageIndex("tests.util")
+
+    assert index.covers("tests.util.package_to_scan")
+    assert not index.covers("tests.utility")
+
+    subpackage = index.subpackage("tests.util.package_to_scan")
+    assert subpackage.members == [ClassItem, function_item]
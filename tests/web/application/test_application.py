@@ -1,9 +1,11 @@
+import pkgutil
 from http import HTTPStatus
 
 from httpx import ASGITransport, AsyncClient
 
 from selva.configuration.defaults import default_settings
 from selva.configuration.settings import Settings
+from selva.executor import get_executor
 from selva.web.application import Selva
 
 
@@ -27,3 +29,53 @@ async def test_not_found():
     client = AsyncClient(transport=ASGITransport(app=app))
     response = await client.get("http://localhost:8000/not-found")
     assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+async def test_call_plans_are_built_on_startup():
+    settings = Settings(
+        default_settings | {"application": f"{__package__}.application"}
+    )
+    app = Selva(settings)
+    await app._lifespan_startup()
+
+    actions = {route.action for route in app.router.all_routes()}
+    assert actions and actions == app.call_plans.keys()
+
+
+def test_application_package_is_scanned_once(monkeypatch):
+    scanned = []
+    walk_packages = pkgutil.walk_packages
+
+    def walk_packages_spy(path, prefix):
+        scanned.append(prefix)
+        return walk_packages(path, prefix)
+
+    monkeypatch.setattr(pkgutil, "walk_packages", walk_packages_spy)
+
+    settings = Settings(
+        default_settings
+        | {
+            "application": "tests.util.package_to_scan",
+            "middleware": [],
+        }
+    )
+    Selva(settings)
+
+    assert scanned.count("tests.util.package_to_scan.") == 1
+
+
+async def test_applications_have_their_own_executor():
+    settings = Settings(
+        default_settings | {"application": f"{__package__}.application"}
+    )
+    default_executor = get_executor()
+
+    app1 = Selva(settings)
+    assert await app1.executor.run(pow, 2, 3) == 8
+
+    app2 = Selva(settings)
+
+    assert app1.executor is not app2.executor
+    assert app1.executor.stats().completed == 1
+    assert app1.executor._executor is not None
+    assert get_executor() is default_executor
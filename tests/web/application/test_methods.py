@@ -0,0 +1,49 @@
+from http import HTTPStatus
+
+from httpx import ASGITransport, AsyncClient
+
+from selva.configuration.defaults import default_settings
+from selva.configuration.settings import Settings
+from selva.web.application import Selva
+
+SETTINGS = Settings(default_settings | {"application": f"{__package__}.application"})
+
+
+async def test_head_request_is_served_by_get_handler():
+    app = Selva(SETTINGS)
+
+    client = AsyncClient(transport=ASGITransport(app=app))
+    response = await client.head("http://localhost:8000/")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-length"] == "2"
+    assert response.content == b""
+
+
+async def test_wrong_method_should_respond_method_not_allowed():
+    app = Selva(SETTINGS)
+
+    client = AsyncClient(transport=ASGITransport(app=app))
+    response = await client.post("http://localhost:8000/")
+
+    assert response.status_code == HTTPStatus.METHOD_NOT_ALLOWED
+    assert response.headers["allow"].upper() == "GET, HEAD, OPTIONS"
+
+
+async def test_options_request_should_respond_allowed_methods():
+    app = Selva(SETTINGS)
+
+    client = AsyncClient(transport=ASGITransport(app=app))
+    response = await client.options("http://localhost:8000/")
+
+    assert response.status_code == HTTPStatus.NO_CONTENT
+    assert response.headers["allow"].upper() == "GET, HEAD, OPTIONS"
+
+
+async def test_options_request_on_unknown_path_should_respond_not_found():
+    app = Selva(SETTINGS)
+
+    client = AsyncClient(transport=ASGITransport(app=app))
+    response = await client.options("http://localhost:8000/not-found")
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
@@ -1,5 +1,6 @@
 from selva.configuration.defaults import default_settings
 from selva.configuration.settings import Settings
+from selva.di.decorator import service
 from selva.web.application import Selva
 from selva.web.lifecycle.decorator import startup
 
@@ -21,3 +22,23 @@ async def test_application(capfd):
 
     await app._lifespan_startup()
     assert capfd.readouterr().out == "startup"
+
+
+@service
+class EagerService:
+    pass
+
+
+async def test_eager_services(capfd):
+    settings = Settings(
+        default_settings
+        | {
+            "application": f"{test_application.__module__}",
+            "services": {"eager": True, "timeout": 1},
+        }
+    )
+
+    app = Selva(settings)
+
+    await app._lifespan_startup()
+    assert (EagerService, None) in app.di.cache
@@ -179,6 +179,22 @@ async def test_path_param_from_request(ioc: Container):
     assert result == "value"
 
 
+async def test_converted_path_param_from_request(ioc: Container):
+    ioc.define(Container, ioc)
+    ioc.register(PathParamFromRequest)
+    ioc.register(FromPathExtractor)
+
+    from_request = await ioc.get(FromRequest[FromPath])
+
+    scope = {"type": "http", "method": "GET"}
+    request = Request(scope, None, None)
+    request.attributes["path_params"] = {"param": 0}
+
+    # no converter is registered, the value converted by the router is used
+    result = await from_request.from_request(request, int, "param", FromPath, False)
+    assert result == 0
+
+
 async def test_path_param_from_request_missing_param_should_fail(ioc: Container):
     ioc.define(Container, ioc)
     ioc.register(StrParamConverter)
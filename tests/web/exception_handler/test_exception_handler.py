@@ -1,12 +1,21 @@
 import copy
+import gc
+import weakref
 
 from httpx import ASGITransport, AsyncClient
 
 from selva.configuration import Settings
 from selva.configuration.defaults import default_settings
 from selva.web.application import Selva
+from selva.web.middleware.exception_handler import ExceptionHandlerMiddleware
 
-from .application import DerivedException, MyBaseException, MyException
+from .application import (
+    DerivedException,
+    MyBaseException,
+    MyException,
+    base_exception_handler,
+    my_exception_handler,
+)
 
 SETTINGS = Settings(
     default_settings
@@ -40,3 +49,47 @@ async def test_derived_exception_handler():
 
     response = await client.get("http://localhost:8000/derived")
     assert response.text == f"handler=base; exception={DerivedException.__name__}"
+
+
+async def test_exception_handler_dispatch_is_keyed_by_type():
+    settings = copy.copy(SETTINGS)
+
+    app = Selva(settings)
+    await app._lifespan_startup()
+
+    middleware = app.handler
+    assert isinstance(middleware, ExceptionHandlerMiddleware)
+    assert middleware.call_plans.keys() == {
+        my_exception_handler,
+        base_exception_handler,
+    }
+
+    client = AsyncClient(transport=ASGITransport(app=app))
+    await client.get("http://localhost:8000/derived")
+    await client.get("http://localhost:8000/derived")
+
+    assert middleware.dispatch[DerivedException] is base_exception_handler
+    assert all(isinstance(key, type) for key in middleware.dispatch)
+
+
+async def test_handled_exception_is_not_retained():
+    settings = copy.copy(SETTINGS)
+
+    app = Selva(settings)
+    await app._lifespan_startup()
+
+    middleware = app.handler
+    handled = []
+
+    async def raise_exception(scope, receive, send):
+        err = DerivedException()
+        handled.append(weakref.ref(err))
+        raise err
+
+    middleware.app = raise_exception
+
+    client = AsyncClient(transport=ASGITransport(app=app))
+    await client.get("http://localhost:8000/")
+
+    gc.collect()
+    assert handled[0]() is None
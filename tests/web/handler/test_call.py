@@ -0,0 +1,196 @@
+import asyncio
+from typing import Annotated
+
+import pytest
+from asgikit.requests import Request
+
+from selva.di.container import Container
+from selva.di.decorator import service
+from selva.di.inject import Inject
+from selva.di.scope import Scope
+from selva.web.converter.decorator import register_from_request
+from selva.web.converter.error import MissingFromRequestImplError
+from selva.web.converter.from_request_impl import QueryParamFromRequest
+from selva.web.converter.param_converter_impl import IntParamConverter
+from selva.web.converter.param_extractor import FromQuery
+from selva.web.converter.param_extractor_impl import FromQueryExtractor
+from selva.web.exception import HTTPUnauthorizedException
+from selva.web.handler.call import build_call_plan
+
+
+@service
+class Greeter:
+    def greet(self, name: str) -> str:
+        return f"Hello, {name}"
+
+
+class Unknown:
+    pass
+
+
+@pytest.fixture(name="ioc")
+def fixture_ioc() -> Container:
+    ioc = Container()
+    ioc.define(Container, ioc)
+    ioc.register(Greeter)
+    ioc.register(IntParamConverter)
+    ioc.register(QueryParamFromRequest)
+    ioc.register(FromQueryExtractor)
+    return ioc
+
+
+def make_request(query: bytes) -> Request:
+    scope = {"type": "http", "method": "GET", "query_string": query}
+    return Request(scope, None, None)
+
+
+async def test_call_plan_resolves_services_once(ioc: Container):
+    result = []
+
+    async def handler(
+        request,
+        number: Annotated[int, FromQuery],
+        greeter: Annotated[Greeter, Inject],
+    ):
+        result.append((number, greeter))
+
+    plan = await build_call_plan(ioc, handler, skip=1)
+
+    calls = []
+    original_get = ioc.get
+
+    async def get(*args, **kwargs):
+        calls.append(args)
+        return await original_get(*args, **kwargs)
+
+    ioc.get = get
+
+    await plan(handler, make_request(b"number=1"))
+    await plan(handler, make_request(b"number=2"))
+
+    greeter = await original_get(Greeter)
+    assert result == [(1, greeter), (2, greeter)]
+    assert calls == []
+
+
+async def test_call_plan_skips_missing_optional_param(ioc: Container):
+    result = []
+
+    async def handler(request, number: Annotated[int, FromQuery] = 0):
+        result.append(number)
+
+    plan = await build_call_plan(ioc, handler, skip=1)
+    await plan(handler, make_request(b""))
+
+    assert result == [0]
+
+
+async def test_call_plan_missing_from_request_should_fail(ioc: Container):
+    async def handler(request, param: Unknown):
+        pass
+
+    with pytest.raises(MissingFromRequestImplError):
+        await build_call_plan(ioc, handler, skip=1)
+
+
+class First:
+    pass
+
+
+class Second:
+    pass
+
+
+async def test_concurrent_call_plan_extracts_params_concurrently(ioc: Container):
+    first_started = asyncio.Event()
+    second_started = asyncio.Event()
+
+    @register_from_request(First)
+    class FirstFromRequest:
+        async def from_request(self, request, original_type, name, meta, optional):
+            first_started.set()
+            await second_started.wait()
+            return "first"
+
+    @register_from_request(Second)
+    class SecondFromRequest:
+        async def from_request(self, request, original_type, name, meta, optional):
+            second_started.set()
+            await first_started.wait()
+            return "second"
+
+    ioc.register(FirstFromRequest)
+    ioc.register(SecondFromRequest)
+
+    result = []
+
+    async def handler(request, first: First, second: Second):
+        result.append((first, second))
+
+    plan = await build_call_plan(ioc, handler, skip=1, concurrent=True)
+    await asyncio.wait_for(plan(handler, make_request(b"")), timeout=1)
+
+    assert result == [("first", "second")]
+
+
+async def test_concurrent_call_plan_failure_cancels_other_params(ioc: Container):
+    cancelled = asyncio.Event()
+
+    @register_from_request(First)
+    class FirstFromRequest:
+        async def from_request(self, request, original_type, name, meta, optional):
+            raise HTTPUnauthorizedException()
+
+    @register_from_request(Second)
+    class SecondFromRequest:
+        async def from_request(self, request, original_type, name, meta, optional):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+    ioc.register(FirstFromRequest)
+    ioc.register(SecondFromRequest)
+
+    async def handler(request, first: First, second: Second):
+        pass
+
+    plan = await build_call_plan(ioc, handler, skip=1, concurrent=True)
+
+    with pytest.raises(HTTPUnauthorizedException):
+        await plan(handler, make_request(b""))
+
+    assert cancelled.is_set()
+
+
+@service(scope=Scope.REQUEST)
+class RequestGreeter:
+    pass
+
+
+async def test_call_plan_resolves_request_services_per_request(ioc: Container):
+    ioc.register(RequestGreeter)
+
+    result = []
+
+    async def handler(
+        request,
+        greeter: Annotated[RequestGreeter, Inject],
+        other: Annotated[RequestGreeter, Inject],
+    ):
+        result.append((greeter, other))
+
+    plan = await build_call_plan(ioc, handler, skip=1)
+    assert plan.services == {}
+
+    async with ioc.request_scope():
+        await plan(handler, make_request(b""))
+
+    async with ioc.request_scope():
+        await plan(handler, make_request(b""))
+
+    (greeter1, other1), (greeter2, other2) = result
+    assert greeter1 is other1
+    assert greeter2 is other2
+    assert greeter1 is not greeter2
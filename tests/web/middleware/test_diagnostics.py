@@ -0,0 +1,74 @@
+from http import HTTPStatus
+from typing import Annotated
+
+from httpx import ASGITransport, AsyncClient
+
+from selva.configuration import Settings
+from selva.configuration.defaults import default_settings
+from selva.di.decorator import service
+from selva.di.inject import Inject
+from selva.web.application import Selva
+from selva.web.middleware.diagnostics import services_graph_middleware
+
+MIDDLEWARE = [
+    f"{services_graph_middleware.__module__}:{services_graph_middleware.__name__}"
+]
+
+
+@service
+class Dependency:
+    pass
+
+
+@service
+class Service:
+    dependency: Annotated[Dependency, Inject]
+
+
+async def create_client() -> AsyncClient:
+    settings = Settings(
+        default_settings
+        | {
+            "application": __name__,
+            "middleware": list(MIDDLEWARE),
+        }
+    )
+    app = Selva(settings)
+    await app._lifespan_startup()
+
+    return AsyncClient(transport=ASGITransport(app=app))
+
+
+async def test_services_graph_json():
+    client = await create_client()
+    response = await client.get("http://localhost:8000/_selva/services")
+
+    assert response.status_code == HTTPStatus.OK
+
+    graph = response.json()
+    services = {service["id"]: service for service in graph["services"]}
+    assert services[f"{__name__}.Service"]["scope"] == "singleton"
+    assert {
+        "source": f"{__name__}.Service",
+        "target": f"{__name__}.Dependency",
+        "attribute": "dependency",
+        "optional": False,
+        "lazy": False,
+    } in graph["dependencies"]
+
+
+async def test_services_graph_dot():
+    client = await create_client()
+    response = await client.get("http://localhost:8000/_selva/services?format=dot")
+
+    assert response.status_code == HTTPStatus.OK
+    assert "text/vnd.graphviz" in response.headers["Content-Type"]
+    assert response.text.startswith("digraph services {")
+    assert f'"{__name__}.Service" -> "{__name__}.Dependency";' in response.text
+
+
+async def test_other_paths_are_not_handled():
+    client = await create_client()
+    response = await client.get("http://localhost:8000/other")
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
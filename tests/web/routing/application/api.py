@@ -0,0 +1,10 @@
+from typing import Annotated
+
+from asgikit.responses import respond_text
+
+from selva.web import FromPath, get
+
+
+@get("items/:item_id")
+async def item(request, item_id: Annotated[int, FromPath]):
+    await respond_text(request.response, f"item {item_id}")
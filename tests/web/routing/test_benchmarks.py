@@ -0,0 +1,12 @@
+import pytest
+
+from benchmarks import router_match
+
+
+@pytest.mark.parametrize("engine", ["tree", "regex"])
+def test_router_match_benchmark(engine: str):
+    results = router_match.run(30, engine, requests=100)
+
+    scenarios = [result["scenario"] for result in results]
+    assert scenarios == ["match_hit", "match_miss", "match_websocket", "reverse"]
+    assert all(result["requests"] == 100 for result in results)
@@ -0,0 +1,154 @@
+from http import HTTPMethod
+
+import pytest
+
+from selva.configuration.defaults import default_settings
+from selva.configuration.settings import Settings
+from selva.web.application import Selva
+from selva.web.routing.cache import MISSING, RouteCache, RouteCacheInfo
+from selva.web.routing.decorator import get
+from selva.web.routing.router import Router
+
+
+@get("items/:item_id")
+async def item(request, item_id: str):
+    pass
+
+
+def test_cache_hit():
+    router = Router(cache=RouteCache(10))
+    router.route(item)
+
+    match1 = router.match(HTTPMethod.GET, "/items/1")
+    match2 = router.match(HTTPMethod.GET, "/items/1")
+
+    assert match1 == match2
+    assert router.cache.info() == RouteCacheInfo(
+        hits=1, misses=1, maxsize=10, currsize=1
+    )
+
+
+def test_cache_hit_params_are_not_shared():
+    router = Router(cache=RouteCache(10))
+    router.route(item)
+
+    match1 = router.match(HTTPMethod.GET, "/items/1")
+    match1.params["item_id"] = "999"
+
+    match2 = router.match(HTTPMethod.GET, "/items/1")
+    match2.params["item_id"] = "998"
+
+    assert router.match(HTTPMethod.GET, "/items/1").params == {"item_id": "1"}
+
+
+def test_cache_evicts_least_recently_used():
+    cache = RouteCache(2)
+    router = Router(cache=cache)
+    router.route(item)
+
+    router.match(HTTPMethod.GET, "/items/1")
+    router.match(HTTPMethod.GET, "/items/2")
+    router.match(HTTPMethod.GET, "/items/1")
+    router.match(HTTPMethod.GET, "/items/3")
+
+    assert cache.get(HTTPMethod.GET, "/items/2") is MISSING
+    assert cache.get(HTTPMethod.GET, "/items/1") is not MISSING
+    assert cache.get(HTTPMethod.GET, "/items/3") is not MISSING
+
+
+def test_cache_without_negative_does_not_store_not_found():
+    cache = RouteCache(10)
+    router = Router(cache=cache)
+    router.route(item)
+
+    assert router.match(HTTPMethod.GET, "/not-found") is None
+    assert cache.info().currsize == 0
+
+
+def test_negative_cache_stores_not_found():
+    cache = RouteCache(10, negative=True)
+    router = Router(cache=cache)
+    router.route(item)
+
+    assert router.match(HTTPMethod.GET, "/not-found") is None
+    assert router.match(HTTPMethod.GET, "/not-found") is None
+    assert cache.info() == RouteCacheInfo(hits=1, misses=1, maxsize=10, currsize=1)
+
+
+def test_cache_stores_allowed_methods():
+    cache = RouteCache(10)
+    router = Router(cache=cache)
+    router.route(item)
+
+    allowed = router.allowed_methods("/items/1")
+
+    assert cache.get_allowed("/items/1") is allowed
+    assert router.allowed_methods("/items/1") is allowed
+
+
+def test_cache_without_negative_does_not_store_empty_allowed_methods():
+    cache = RouteCache(10)
+    router = Router(cache=cache)
+    router.route(item)
+
+    assert router.allowed_methods("/not-found") == []
+    assert cache.get_allowed("/not-found") is MISSING
+
+
+def test_negative_cache_stores_empty_allowed_methods():
+    cache = RouteCache(10, negative=True)
+    router = Router(cache=cache)
+    router.route(item)
+
+    assert router.allowed_methods("/not-found") == []
+    assert cache.get_allowed("/not-found") == []
+
+
+def test_register_route_clears_cache():
+    cache = RouteCache(10, negative=True)
+    router = Router(cache=cache)
+
+    assert router.match(HTTPMethod.GET, "/items/1") is None
+
+    router.route(item)
+    assert router.match(HTTPMethod.GET, "/items/1").route.action is item
+
+
+def test_register_route_clears_allowed_methods():
+    cache = RouteCache(10, negative=True)
+    router = Router(cache=cache)
+
+    assert router.allowed_methods("/items/1") == []
+
+    router.route(item)
+    assert HTTPMethod.GET in router.allowed_methods("/items/1")
+
+
+def test_invalid_cache_size_should_fail():
+    with pytest.raises(ValueError):
+        RouteCache(0)
+
+
+def test_cache_from_settings():
+    settings = Settings(
+        default_settings
+        | {
+            "application": "tests.web.application.application",
+            "routing": {"cache": {"size": "100", "negative": "true"}},
+        }
+    )
+
+    app = Selva(settings)
+
+    assert app.router.cache.maxsize == 100
+    assert app.router.cache.negative
+
+
+def test_cache_disabled_by_default():
+    settings = Settings(
+        default_settings | {"application": "tests.web.application.application"}
+    )
+
+    app = Selva(settings)
+
+    assert app.router.cache is None
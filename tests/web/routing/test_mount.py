@@ -0,0 +1,124 @@
+from http import HTTPMethod, HTTPStatus
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from selva.configuration.defaults import default_settings
+from selva.configuration.settings import Settings
+from selva.web.application import Selva
+from selva.web.routing.decorator import get
+from selva.web.routing.router import Router
+
+from .application import index
+from .application.api import item
+
+
+def test_mounted_router_matches_under_prefix():
+    router = Router()
+    router.mount("api/v1").route(item)
+
+    match = router.match(HTTPMethod.GET, "/api/v1/items/1")
+    assert match.route.action is item
+    assert match.path == "/api/v1/items/1"
+    assert match.params == {"item_id": 1}
+
+    assert router.match(HTTPMethod.GET, "/items/1") is None
+    assert router.match(HTTPMethod.GET, "/api/v2/items/1") is None
+    assert router.match(HTTPMethod.GET, "/api/v1items/1") is None
+
+
+@pytest.mark.parametrize("prefixes", [["api", "api/v1"], ["api/v1", "api"]])
+def test_nested_mount_prefixes(prefixes):
+    @get("v1/health")
+    async def health(request):
+        pass
+
+    router = Router()
+    for prefix in prefixes:
+        router.mount(prefix)
+
+    router.mount("api/v1").route(item)
+    router.mount("api").route(health)
+
+    match = router.match(HTTPMethod.GET, "/api/v1/items/1")
+    assert match.route.action is item
+    assert match.params == {"item_id": 1}
+
+    assert router.match(HTTPMethod.GET, "/api/v1/health").route.action is health
+    assert router.match_regex(HTTPMethod.GET, "/api/v1/items/1").route.action is item
+    assert router.allowed_methods("/api/v1/health") == [
+        HTTPMethod.GET,
+        HTTPMethod.HEAD,
+        HTTPMethod.OPTIONS,
+    ]
+
+
+def test_mount_returns_existing_router():
+    router = Router()
+    sub_router = router.mount("/api/v1/")
+
+    assert router.mount("api/v1") is sub_router
+
+    with pytest.raises(ValueError):
+        router.mount("api/v1", Router())
+
+
+@pytest.mark.parametrize("prefix", ["", "/", "api/:version"])
+def test_invalid_mount_prefix_should_fail(prefix):
+    with pytest.raises(ValueError):
+        Router().mount(prefix)
+
+
+def test_root_routes_are_matched_when_mount_does_not_match():
+    @get("api/v1/health")
+    async def health(request):
+        pass
+
+    router = Router()
+    router.mount("api/v1").route(item)
+    router.route(health)
+
+    assert router.match(HTTPMethod.GET, "/api/v1/health").route.action is health
+    assert router.match(HTTPMethod.GET, "/api/v1/items/1").route.action is item
+
+
+def test_mount_allowed_methods():
+    router = Router()
+    router.mount("api").route(item)
+
+    assert router.allowed_methods("/api/items/1") == [
+        HTTPMethod.GET,
+        HTTPMethod.HEAD,
+        HTTPMethod.OPTIONS,
+    ]
+
+
+def test_scan_into_mount():
+    router = Router()
+    router.scan(f"{__package__}.application.api", prefix="api")
+    router.scan(f"{__package__}.application")
+
+    assert list(router.routes.values())[0].action is index
+    assert len(router.routes) == 1
+
+    assert router.match(HTTPMethod.GET, "/api/items/1").route.action is item
+    assert router.match(HTTPMethod.GET, "/items/1") is None
+
+
+async def test_mount_from_settings():
+    settings = Settings(
+        default_settings
+        | {
+            "application": f"{__package__}.application",
+            "routing": {"mounts": {"api/v1": f"{__package__}.application.api"}},
+        }
+    )
+
+    app = Selva(settings)
+    client = AsyncClient(transport=ASGITransport(app=app))
+
+    response = await client.get("http://localhost:8000/api/v1/items/1")
+    assert response.text == "item 1"
+
+    response = await client.get("http://localhost:8000/items/1")
+    assert response.status_code == HTTPStatus.NOT_FOUND
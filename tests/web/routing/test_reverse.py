@@ -0,0 +1,87 @@
+import pytest
+
+from selva.web.routing.decorator import get
+from selva.web.routing.exception import ReverseRouteError, RouteNotFoundError
+from selva.web.routing.router import Router
+
+
+@get("users/:user_id/posts/:post_id")
+async def user_post(request, user_id: int, post_id: str):
+    pass
+
+
+@get("files/*path")
+async def files(request, path: str):
+    pass
+
+
+@get("report.:ext")
+async def report(request, ext: str):
+    pass
+
+
+@get
+async def index(request):
+    pass
+
+
+@pytest.fixture(name="router")
+def fixture_router() -> Router:
+    router = Router()
+    for handler in (user_post, files, report, index):
+        router.route(handler)
+    return router
+
+
+def name_of(handler) -> str:
+    return f"get.{handler.__module__}.{handler.__qualname__}"
+
+
+@pytest.mark.parametrize(
+    "handler,params,expected",
+    [
+        (user_post, {"user_id": 1, "post_id": "a"}, "users/1/posts/a"),
+        (user_post, {"user_id": 1, "post_id": "a b/c"}, "users/1/posts/a%20b%2Fc"),
+        (files, {"path": "a/b c.txt"}, "files/a/b%20c.txt"),
+        (report, {"ext": "pdf"}, "report.pdf"),
+        (index, {}, ""),
+    ],
+)
+def test_reverse(router: Router, handler, params, expected):
+    assert router.reverse(name_of(handler), **params) == expected
+
+
+def test_url_for(router: Router):
+    url = router.url_for(name_of(user_post), user_id=1, post_id=2)
+    assert url == "/users/1/posts/2"
+    assert router.url_for(name_of(index)) == "/"
+
+
+def test_reversed_path_matches_route(router: Router):
+    path = router.url_for(name_of(files), path="a/b/c")
+    match = router.match("GET", path)
+    assert match.route.action is files
+    assert match.params == {"path": "a/b/c"}
+
+
+def test_reverse_missing_param_should_fail(router: Router):
+    with pytest.raises(ReverseRouteError, match="missing parameters \\(post_id\\)"):
+        router.reverse(name_of(user_post), user_id=1)
+
+
+def test_reverse_unexpected_param_should_fail(router: Router):
+    with pytest.raises(ReverseRouteError, match="unexpected parameters \\(other\\)"):
+        router.reverse(name_of(report), ext="pdf", other="value")
+
+
+def test_reverse_unknown_route_should_fail(router: Router):
+    with pytest.raises(RouteNotFoundError, match="route not found: unknown"):
+        router.reverse("unknown")
+
+
+def test_reverse_mounted_route():
+    router = Router()
+    router.mount("api/v1").route(user_post)
+
+    url = router.url_for(name_of(user_post), user_id=1, post_id=2)
+    assert url == "/api/v1/users/1/posts/2"
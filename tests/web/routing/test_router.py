@@ -0,0 +1,214 @@
+from http import HTTPMethod
+
+import pytest
+
+from selva.web.routing.decorator import delete, get, post, websocket
+from selva.web.routing.exception import DuplicateRouteError
+from selva.web.routing.router import Router
+
+
+def test_static_route_is_indexed_by_path():
+    @get("static/path")
+    async def handler(request):
+        pass
+
+    router = Router()
+    router.route(handler)
+
+    route = router.static_routes[HTTPMethod.GET]["static/path"]
+    assert route.action is handler
+    assert HTTPMethod.GET not in router.trees
+
+    for path in ("/static/path", "/static/path/", "static/path"):
+        match = router.match(HTTPMethod.GET, path)
+        assert match.route is route
+        assert match.params == {}
+
+
+def test_routes_are_partitioned_by_method():
+    @get("path")
+    async def get_handler(request):
+        pass
+
+    @post("path")
+    async def post_handler(request):
+        pass
+
+    @websocket("path")
+    async def websocket_handler(request):
+        pass
+
+    router = Router()
+    router.route(get_handler)
+    router.route(post_handler)
+    router.route(websocket_handler)
+
+    assert [r.action for r in router.method_routes[HTTPMethod.GET]] == [get_handler]
+    assert [r.action for r in router.method_routes[HTTPMethod.POST]] == [post_handler]
+    assert [r.action for r in router.method_routes[None]] == [websocket_handler]
+
+    assert router.match(HTTPMethod.GET, "/path").route.action is get_handler
+    assert router.match(HTTPMethod.POST, "/path").route.action is post_handler
+    assert router.match(None, "/path").route.action is websocket_handler
+    assert router.match(HTTPMethod.PUT, "/path") is None
+
+
+def test_websocket_route_does_not_match_http_request():
+    @websocket("chat/:room")
+    async def handler(request, room: str):
+        pass
+
+    router = Router()
+    router.route(handler)
+
+    assert router.match(HTTPMethod.GET, "/chat/room") is None
+    assert router.match(None, "/chat/room").params == {"room": "room"}
+
+
+def test_allowed_methods():
+    @get("items/:item_id")
+    async def get_item(request, item_id: str):
+        pass
+
+    @delete("items/:key")
+    async def delete_item(request, key: str):
+        pass
+
+    @post("items")
+    async def post_item(request):
+        pass
+
+    router = Router()
+    router.route(get_item)
+    router.route(delete_item)
+    router.route(post_item)
+
+    assert router.allowed_methods("/items/1") == [
+        HTTPMethod.DELETE,
+        HTTPMethod.GET,
+        HTTPMethod.HEAD,
+        HTTPMethod.OPTIONS,
+    ]
+    assert router.allowed_methods("/items") == [HTTPMethod.OPTIONS, HTTPMethod.POST]
+    assert router.allowed_methods("/not-found") == []
+
+
+def test_allowed_methods_with_typed_params():
+    @get("users/:user_id")
+    async def get_user(request, user_id: str):
+        pass
+
+    @delete("users/:user_id")
+    async def delete_user(request, user_id: int):
+        pass
+
+    router = Router()
+    router.route(get_user)
+    router.route(delete_user)
+
+    assert router.allowed_methods("/users/1") == [
+        HTTPMethod.DELETE,
+        HTTPMethod.GET,
+        HTTPMethod.HEAD,
+        HTTPMethod.OPTIONS,
+    ]
+    assert router.allowed_methods("/users/abc") == [
+        HTTPMethod.GET,
+        HTTPMethod.HEAD,
+        HTTPMethod.OPTIONS,
+    ]
+
+
+def test_allowed_methods_of_every_matching_pattern():
+    @get("users/:user_id")
+    async def get_user(request, user_id: str):
+        pass
+
+    @post("users/me")
+    async def update_me(request):
+        pass
+
+    router = Router()
+    router.route(get_user)
+    router.route(update_me)
+
+    assert router.allowed_methods("/users/me") == [
+        HTTPMethod.GET,
+        HTTPMethod.HEAD,
+        HTTPMethod.OPTIONS,
+        HTTPMethod.POST,
+    ]
+
+
+def test_allowed_methods_do_not_match_each_method(monkeypatch):
+    @get("items/:item_id")
+    async def get_item(request, item_id: int):
+        pass
+
+    @delete("items/:item_id")
+    async def delete_item(request, item_id: int):
+        pass
+
+    router = Router()
+    router.route(get_item)
+    router.route(delete_item)
+
+    def fail(*args):
+        raise AssertionError("allowed methods matched each method")
+
+    monkeypatch.setattr(router, "_match_method", fail)
+
+    assert router.allowed_methods("/items/1") == [
+        HTTPMethod.DELETE,
+        HTTPMethod.GET,
+        HTTPMethod.HEAD,
+        HTTPMethod.OPTIONS,
+    ]
+    assert router.allowed_methods("/items/abc") == []
+
+
+def test_head_request_matches_get_route():
+    @get("path")
+    async def handler(request):
+        pass
+
+    router = Router()
+    router.route(handler)
+
+    match = router.match(HTTPMethod.HEAD, "/path")
+    assert match.route.action is handler
+    assert match.route.method is HTTPMethod.GET
+    assert match.method is HTTPMethod.HEAD
+
+
+def test_duplicate_route_with_different_param_names_should_fail():
+    @get("items/:item_id")
+    async def handler1(request, item_id: str):
+        pass
+
+    @get("items/:key")
+    async def handler2(request, key: str):
+        pass
+
+    router = Router()
+    router.route(handler1)
+
+    with pytest.raises(DuplicateRouteError):
+        router.route(handler2)
+
+
+def test_routes_with_different_param_types_are_not_duplicate():
+    @get("items/:item_id")
+    async def handler1(request, item_id: int):
+        pass
+
+    @get("items/:slug")
+    async def handler2(request, slug: str):
+        pass
+
+    router = Router()
+    router.route(handler1)
+    router.route(handler2)
+
+    assert router.match(HTTPMethod.GET, "/items/1").route.action is handler1
+    assert router.match(HTTPMethod.GET, "/items/one").route.action is handler2
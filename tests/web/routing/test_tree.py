@@ -0,0 +1,200 @@
+from http import HTTPMethod
+
+import pytest
+
+from selva.web.routing.decorator import get, post, websocket
+from selva.web.routing.router import Router
+from selva.web.routing.tree import split_path
+
+
+@get
+async def index(request):
+    pass
+
+
+@get("users")
+async def users(request):
+    pass
+
+
+@get("users/:user_id")
+async def user(request, user_id: str):
+    pass
+
+
+@post("users/:user_id")
+async def update_user(request, user_id: str):
+    pass
+
+
+@get("users/:user_id/posts/:post_id")
+async def user_post(request, user_id: str, post_id: str):
+    pass
+
+
+@get("files/*path")
+async def files(request, path: str):
+    pass
+
+
+@get("archive/*path/:name")
+async def archive(request, path: str, name: str):
+    pass
+
+
+@get("p/*rest/end")
+async def nested_wildcard(request, rest: str):
+    pass
+
+
+@get("report.:ext")
+async def report(request, ext: str):
+    pass
+
+
+@websocket("chat/:room")
+async def chat(request, room: str):
+    pass
+
+
+HANDLERS = [
+    index,
+    users,
+    user,
+    update_user,
+    user_post,
+    files,
+    archive,
+    nested_wildcard,
+    report,
+    chat,
+]
+
+
+@pytest.fixture(name="router")
+def fixture_router() -> Router:
+    router = Router()
+    for handler in HANDLERS:
+        router.route(handler)
+    return router
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("/", ([], False)),
+        ("", ([], False)),
+        ("/users", (["users"], False)),
+        ("/users/", (["users"], True)),
+        ("/users/1/posts", (["users", "1", "posts"], False)),
+        ("//", (["", ""], False)),
+    ],
+)
+def test_split_path(path, expected):
+    assert split_path(path) == expected
+
+
+@pytest.mark.parametrize(
+    "method,path",
+    [
+        (HTTPMethod.GET, "/"),
+        (HTTPMethod.GET, "/users"),
+        (HTTPMethod.GET, "/users/"),
+        (HTTPMethod.GET, "/users/1"),
+        (HTTPMethod.POST, "/users/1"),
+        (HTTPMethod.GET, "/users/1/posts/2"),
+        (HTTPMethod.GET, "/users/1/posts"),
+        (HTTPMethod.GET, "/files/a"),
+        (HTTPMethod.GET, "/files/a/b/c.txt"),
+        (HTTPMethod.GET, "/files/a/"),
+        (HTTPMethod.GET, "/files/"),
+        (HTTPMethod.GET, "/files"),
+        (HTTPMethod.GET, "/archive/a/b/c.zip"),
+        (HTTPMethod.GET, "/archive/a/b/c.zip/"),
+        (HTTPMethod.GET, "/p/x/y/end"),
+        (HTTPMethod.GET, "/p/x/y/end/"),
+        (HTTPMethod.GET, "/p//end"),
+        (HTTPMethod.GET, "/p/end"),
+        (HTTPMethod.GET, "/report.pdf"),
+        (HTTPMethod.GET, "/report."),
+        (HTTPMethod.GET, "/chat/room"),
+        (None, "/chat/room"),
+        (None, "/users/1"),
+        (HTTPMethod.DELETE, "/users/1"),
+        (HTTPMethod.GET, "/not/found"),
+        (HTTPMethod.GET, "//"),
+        (HTTPMethod.GET, "///"),
+        (HTTPMethod.GET, "/users//"),
+    ],
+)
+def test_tree_matches_regex(router: Router, method, path):
+    tree_match = router.match(method, path)
+    regex_match = router.match_regex(method, path)
+
+    assert tree_match == regex_match
+
+
+def test_match_params(router: Router):
+    match = router.match(HTTPMethod.GET, "/archive/a/b/c.zip")
+    assert match.route.action is archive
+    assert match.params == {"path": "a/b", "name": "c.zip"}
+
+
+def test_static_segment_has_precedence_over_registration_order():
+    """The regex engine matches the first route registered, while the tree
+    prefers the most specific route
+    """
+
+    @get("users/:user_id")
+    async def user_by_id(request, user_id: str):
+        pass
+
+    @get("users/me")
+    async def current_user(request):
+        pass
+
+    router = Router()
+    router.route(user_by_id)
+    router.route(current_user)
+
+    assert router.match(HTTPMethod.GET, "/users/me").route.action is current_user
+    assert router.match_regex(HTTPMethod.GET, "/users/me").route.action is user_by_id
+
+    assert router.match(HTTPMethod.GET, "/users/1") == router.match_regex(
+        HTTPMethod.GET, "/users/1"
+    )
+
+
+def test_static_segment_has_precedence():
+    @get("items/:item_id")
+    async def item(request, item_id: str):
+        pass
+
+    @get("items/new")
+    async def new_item(request):
+        pass
+
+    router = Router()
+    router.route(item)
+    router.route(new_item)
+
+    assert router.match(HTTPMethod.GET, "/items/new").route.action is new_item
+    assert router.match(HTTPMethod.GET, "/items/1").route.action is item
+
+
+def test_match_backtracks_to_param():
+    @get("items/new/edit")
+    async def new_item_edit(request):
+        pass
+
+    @get("items/:item_id/details")
+    async def item_details(request, item_id: str):
+        pass
+
+    router = Router()
+    router.route(new_item_edit)
+    router.route(item_details)
+
+    match = router.match(HTTPMethod.GET, "/items/new/details")
+    assert match.route.action is item_details
+    assert match.params == {"item_id": "new"}
@@ -0,0 +1,133 @@
+import uuid
+from decimal import Decimal
+from http import HTTPMethod
+from typing import Annotated
+
+import pytest
+
+from selva.web.converter.param_extractor import FromPath
+from selva.web.routing.decorator import get
+from selva.web.routing.router import Router
+
+
+@get("int/:value")
+async def int_handler(request, value: Annotated[int, FromPath]):
+    pass
+
+
+@get("float/:value")
+async def float_handler(request, value: Annotated[float, FromPath]):
+    pass
+
+
+@get("decimal/:value")
+async def decimal_handler(request, value: Annotated[Decimal, FromPath]):
+    pass
+
+
+@get("bool/:value")
+async def bool_handler(request, value: Annotated[bool, FromPath]):
+    pass
+
+
+@get("uuid/:value")
+async def uuid_handler(request, value: Annotated[uuid.UUID, FromPath]):
+    pass
+
+
+@get("str/:value")
+async def str_handler(request, value: Annotated[str, FromPath]):
+    pass
+
+
+@get("file/:name.:version")
+async def mixed_handler(
+    request,
+    name: Annotated[str, FromPath],
+    version: Annotated[int, FromPath],
+):
+    pass
+
+
+HANDLERS = [
+    int_handler,
+    float_handler,
+    decimal_handler,
+    bool_handler,
+    uuid_handler,
+    str_handler,
+    mixed_handler,
+]
+
+UUID = uuid.uuid4()
+
+
+@pytest.fixture(name="router")
+def fixture_router() -> Router:
+    router = Router()
+    for handler in HANDLERS:
+        router.route(handler)
+    return router
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("/int/0", {"value": 0}),
+        ("/int/-10", {"value": -10}),
+        ("/float/1.5", {"value": 1.5}),
+        ("/float/1e3", {"value": 1000.0}),
+        ("/decimal/10.01", {"value": Decimal("10.01")}),
+        ("/bool/true", {"value": True}),
+        ("/bool/0", {"value": False}),
+        (f"/uuid/{UUID}", {"value": UUID}),
+        (f"/uuid/{UUID.hex}", {"value": UUID}),
+        ("/str/10", {"value": "10"}),
+        ("/file/name.10", {"name": "name", "version": 10}),
+    ],
+)
+def test_typed_params_are_converted(router: Router, path, expected):
+    match = router.match(HTTPMethod.GET, path)
+    assert match.params == expected
+
+    regex_match = router.match_regex(HTTPMethod.GET, path)
+    assert regex_match.params == expected
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/int/abc",
+        "/int/1.5",
+        "/float/abc",
+        "/decimal/1,5",
+        "/bool/yes",
+        "/uuid/abc",
+        "/file/name.abc",
+    ],
+)
+def test_invalid_typed_params_do_not_match(router: Router, path):
+    assert router.match(HTTPMethod.GET, path) is None
+    assert router.match_regex(HTTPMethod.GET, path) is None
+
+
+def test_typed_param_falls_back_to_untyped_route():
+    @get("items/:item_id")
+    async def item_by_id(request, item_id: Annotated[int, FromPath]):
+        pass
+
+    @get("items/:slug/details")
+    async def item_by_slug(request, slug: Annotated[str, FromPath]):
+        pass
+
+    router = Router()
+    router.route(item_by_id)
+    router.route(item_by_slug)
+
+    match = router.match(HTTPMethod.GET, "/items/1")
+    assert match.route.action is item_by_id
+    assert match.params == {"item_id": 1}
+
+    match = router.match(HTTPMethod.GET, "/items/first/details")
+    assert match.route.action is item_by_slug
+    assert match.params == {"slug": "first"}